@@ -0,0 +1,499 @@
+# -*- coding: utf-8 -*-
+"""
+나이스 교육정보 OPEN API 모의 서버 모듈
+
+이 모듈은 `SyncSession`과 `AsyncSession`의 처리량, 꼬리 지연 시간, 재시도 동작을
+실제 API 없이 측정하기 위한 aiohttp 기반의 로컬 서버를 제공합니다.
+응답 형식(`[{"head": [...]}, {"row": [...]}]`), `pIndex`/`pSize` 페이지 처리,
+`RESULT.CODE` 오류는 실제 API와 동일하게 재현되며, 지연 시간, 지터, 오류율,
+초당 요청 수 제한을 설정할 수 있습니다.
+
+**사용례**::
+
+    from benchmarks.mock_server import MockNeisServer, synthetic_rows
+    from ezneis.http import SyncSession
+    from ezneis.http.service import Services
+
+    rows = {Services.MEALS: synthetic_rows(Services.MEALS, 5000)}
+    with MockNeisServer(rows, latency=0.05, error_rate=0.01).serve() as url:
+        with SyncSession("key", base_url=url) as sess:
+            meals = sess.get(Services.MEALS)
+
+    # 명령줄에서 실행
+    # python -m benchmarks.mock_server --port 8080 --rows 5000 --latency 0.05
+"""
+
+from __future__ import annotations
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date, timedelta
+from threading import Thread
+from time import monotonic
+from typing import Callable, Collection, Iterator, Mapping, Sequence
+from aiohttp import web
+from ezneis.exceptions import InternalServiceCode
+from ezneis.http.service import DATE_FIELDS, Services
+import argparse
+import asyncio
+import orjson
+import random
+
+__all__ = ["MockNeisServer", "synthetic_rows"]
+
+# 결과 코드별 응답 메시지
+_MESSAGES = {
+    InternalServiceCode.OK: "정상 처리되었습니다.",
+    InternalServiceCode.NOT_FOUND: "해당하는 데이터가 없습니다.",
+    InternalServiceCode.UNAUTHORIZED: "인증키가 유효하지 않습니다.",
+    InternalServiceCode.UNKNOWN_SERVICE: "해당하는 서비스를 찾을 수 없습니다.",
+    InternalServiceCode.UNSUPPORTED_TYPE: "요청위치 값의 타입이 유효하지 않습니다.",
+    InternalServiceCode.REQUEST_TOO_LARGE: (
+        "데이터요청은 한번에 최대 1,000건을 넘을 수 없습니다."
+    ),
+    InternalServiceCode.TOO_MANY_REQUESTS: "일별 트래픽 제한을 넘은 호출입니다.",
+    InternalServiceCode.SERVER_ERROR: "서버 오류입니다.",
+    InternalServiceCode.DATABASE_ERROR: "데이터베이스 연결 오류입니다.",
+}
+
+# 페이지 처리와 관계없이 레코드 필터링에 사용하지 않는 매개변수
+_RESERVED_PARAMS = frozenset(("KEY", "Type", "pIndex", "pSize"))
+
+RowSource = (
+    Mapping[Services, Sequence[dict]] | Callable[[Services, dict], Sequence[dict]]
+)
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+def synthetic_rows(svc: Services, count: int, *, seed: int = 0) -> list[dict]:
+    """
+    서비스의 응답 레코드와 같은 형태의 가상 레코드를 생성합니다.
+
+    급식, 학사일정, 시간표, 학교 기본 정보, 학과 및 계열 정보는 실제 필드 이름을
+    사용하며, 그 외 서비스는 일련 번호만 포함된 레코드를 생성합니다.
+
+    :param svc: 레코드를 생성할 서비스
+    :type svc: Services
+    :param count: 생성할 레코드 수
+    :type count: int
+    :param seed: 난수 시드
+    :type seed: int
+    :return: 가상 레코드 목록
+    :rtype: list[dict]
+    """
+    rand = random.Random(seed)
+    start = date(2025, 3, 3)
+    common = {"ATPT_OFCDC_SC_CODE": "J10", "SD_SCHUL_CODE": "7530000"}
+    rows = []
+    for i in range(count):
+        day = (start + timedelta(days=i // 8)).strftime("%Y%m%d")
+        match svc:
+            case Services.MEALS:
+                row = {
+                    **common,
+                    "MMEAL_SC_CODE": str(i % 3 + 1),
+                    "MLSV_YMD": day,
+                    "MLSV_FGR": str(rand.randint(300, 900)),
+                    "DDISH_NM": "<br/>".join(
+                        f"요리{rand.randint(1, 99)} (1.2.{rand.randint(3, 19)})"
+                        for _ in range(6)
+                    ),
+                    "ORPLC_INFO": "쌀 : 국내산<br/>김치류 : 국내산",
+                    "CAL_INFO": f"{rand.uniform(500, 900):.1f} Kcal",
+                    "NTR_INFO": "탄수화물(g) : 100.1<br/>단백질(g) : 30.2",
+                }
+            case Services.SCHEDULES:
+                row = {
+                    **common,
+                    "AY": day[:4],
+                    "DGHT_CRSE_SC_NM": "주간",
+                    "SBTR_DD_SC_NM": "해당없음",
+                    "AA_YMD": day,
+                    "EVENT_NM": f"행사{i}",
+                    "EVENT_CNTNT": None,
+                    **{
+                        f"{g}_GRADE_EVENT_YN": rand.choice("YN")
+                        for g in ("ONE", "TW", "THREE", "FR", "FIV", "SIX")
+                    },
+                }
+            case (
+                Services.TIMETABLES_E
+                | Services.TIMETABLES_M
+                | Services.TIMETABLES_H
+                | Services.TIMETABLES_S
+            ):
+                row = {
+                    **common,
+                    "AY": day[:4],
+                    "SEM": "1",
+                    "ALL_TI_YMD": day,
+                    "DGHT_CRSE_SC_NM": "주간",
+                    "ORD_SC_NM": "일반계",
+                    "DDDEP_NM": "일반과",
+                    "GRADE": str(i % 3 + 1),
+                    "CLRM_NM": f"{i % 10 + 1}반",
+                    "CLASS_NM": str(i % 10 + 1),
+                    "PERIO": str(i % 7 + 1),
+                    "ITRT_CNTNT": f"과목{rand.randint(1, 30)}",
+                }
+            case Services.MAJORS:
+                row = {
+                    **common,
+                    "DGHT_CRSE_SC_NM": "주간",
+                    "ORD_SC_NM": "공업계",
+                    "DDDEP_NM": f"학과{i}",
+                }
+            case Services.DEPARTMENTS:
+                row = {**common, "DGHT_CRSE_SC_NM": "주간", "ORD_SC_NM": f"계열{i}"}
+            case Services.SCHOOL_INFO:
+                row = {
+                    **common,
+                    "SD_SCHUL_CODE": f"{7530000 + i}",
+                    "SCHUL_NM": f"가상{i}고등학교",
+                    "ENG_SCHUL_NM": f"Virtual{i} High School",
+                    "SCHUL_KND_SC_NM": "고등학교",
+                    "JU_ORG_NM": "경기도교육청",
+                    "FOND_SC_NM": "공립",
+                    "ORG_RDNZC": "16000",
+                    "ORG_RDNMA": "경기도 가상시 가상로 1",
+                    "ORG_RDNDA": None,
+                    "ORG_TELNO": "031-000-0000",
+                    "HMPG_ADRES": None,
+                    "COEDU_SC_NM": "남여공학",
+                    "ORG_FAXNO": None,
+                    "HS_SC_NM": "일반고",
+                    "INDST_SPECL_CCCCL_EXST_YN": "N",
+                    "HS_GNRL_BUSNS_SC_NM": "일반계",
+                    "SPCLY_PURPS_HS_ORD_NM": None,
+                    "ENE_BFE_SEHF_SC_NM": "후기",
+                    "DGHT_SC_NM": "주간",
+                    "FOND_YMD": "19800301",
+                    "FOAS_MEMRD": "19800301",
+                }
+            case _:
+                row = {**common, "SEQ": str(i)}
+        rows.append(row)
+    return rows
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class MockNeisServer:
+    """
+    나이스 교육정보 OPEN API를 흉내 내는 로컬 aiohttp 서버입니다.
+
+    요청된 서비스의 레코드 중 query의 매개변수와 값이 일치하는(일자 매개변수의 경우
+    기간에 포함되는) 레코드만 골라 `pIndex`/`pSize`에 맞게 잘라 응답합니다.
+    서버가 받은 요청 수, 결과 코드별 응답 수, 최대 동시 요청 수는 `stats`에
+    기록됩니다.
+    """
+
+    def __init__(
+        self,
+        rows: RowSource | None = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        http_error_rate: float = 0.0,
+        rate_limit: float | None = None,
+        throttle_status: int | None = None,
+        keys: Collection[str] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int | None = None,
+    ):
+        """
+        MockNeisServer 인스턴스를 초기화합니다.
+
+        :param rows: 서비스별 레코드 또는 (서비스, query)를 받아 레코드를 반환하는 함수.
+            None인 경우 모든 서비스에 대해 1,000개의 가상 레코드를 사용
+        :type rows: Mapping 또는 Callable 또는 None
+        :param latency: 응답마다 추가할 기본 지연 시간(초)
+        :type latency: float
+        :param jitter: 기본 지연 시간에 더할 무작위 지연 시간의 최대값(초)
+        :type jitter: float
+        :param error_rate: ERROR-500 또는 ERROR-600 결과로 응답할 확률
+        :type error_rate: float
+        :param http_error_rate: HTTP 503으로 응답할 확률
+        :type http_error_rate: float
+        :param rate_limit: 초당 허용 요청 수 (None인 경우 제한하지 않음)
+        :type rate_limit: float 또는 None
+        :param throttle_status: 요청 수 제한을 넘었을 때 응답할 HTTP 상태 코드,
+            None인 경우 ERROR-337 결과로 응답
+        :type throttle_status: int 또는 None
+        :param keys: 유효한 인증 키 목록 (None인 경우 모든 인증 키 허용)
+        :type keys: Collection[str] 또는 None
+        :param host: 서버가 사용할 호스트
+        :type host: str
+        :param port: 서버가 사용할 포트 (0인 경우 임의의 빈 포트)
+        :type port: int
+        :param seed: 지연 시간과 오류 발생에 사용할 난수 시드
+        :type seed: int 또는 None
+        """
+        self._rows = rows
+        self._generated: dict[Services, list[dict]] = {}
+        self._latency = latency
+        self._jitter = jitter
+        self.error_rate = error_rate
+        """ERROR-500 또는 ERROR-600 결과로 응답할 확률 (실행 중에 바꿀 수 있음)"""
+        self.http_error_rate = http_error_rate
+        """HTTP 503으로 응답할 확률 (실행 중에 바꿀 수 있음)"""
+        self._rate_limit = rate_limit
+        self._throttle_status = throttle_status
+        self._keys = None if keys is None else frozenset(keys)
+        self._host = host
+        self._port = port
+        self._random = random.Random(seed)
+        self._tokens = rate_limit or 0.0
+        self._updated = monotonic()
+        self._inflight = 0
+        self._runner: web.AppRunner | None = None
+        self.stats = Counter()
+        """요청 수(`requests`), 결과 코드별 응답 수, 최대 동시 요청 수(`max_inflight`)"""
+
+    async def __aenter__(self) -> str:
+        """
+        서버를 시작하고 기본 url을 반환합니다.
+
+        :return: 세션의 `base_url`로 사용할 url
+        :rtype: str
+        """
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        서버를 종료합니다.
+        """
+        await self.stop()
+
+    async def start(self) -> str:
+        """
+        서버를 시작합니다.
+
+        :return: 세션의 `base_url`로 사용할 url
+        :rtype: str
+        """
+        app = web.Application()
+        app.router.add_get("/hub/{service}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        # 임의의 빈 포트를 사용한 경우 실제 포트를 확인
+        self._port = self._runner.addresses[0][1]
+        return self.url
+
+    async def stop(self):
+        """
+        서버를 종료합니다.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @contextmanager
+    def serve(self) -> Iterator[str]:
+        """
+        별도의 스레드에서 이벤트 루프를 실행하여 서버를 시작합니다.
+
+        동기 세션의 성능을 측정할 때 사용합니다.
+
+        :return: 세션의 `base_url`로 사용할 url
+        :rtype: Iterator[str]
+        """
+        loop = asyncio.new_event_loop()
+        thread = Thread(target=loop.run_forever, name="mock-neis", daemon=True)
+        thread.start()
+        try:
+            yield asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+        finally:
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    @property
+    def url(self) -> str:
+        """
+        세션의 `base_url`로 사용할 url입니다.
+
+        :return: 서버의 기본 url
+        :rtype: str
+        """
+        return f"http://{self._host}:{self._port}/hub/"
+
+    def _records(self, svc: Services, query: Mapping[str, str]) -> Sequence[dict]:
+        """
+        query에 해당하는 서비스의 레코드를 반환합니다.
+        """
+        if callable(self._rows):
+            return self._rows(svc, dict(query))
+        if self._rows is None:
+            if svc not in self._generated:
+                self._generated[svc] = synthetic_rows(svc, 1000)
+            rows = self._generated[svc]
+        else:
+            rows = self._rows.get(svc, ())
+        filters = [
+            (k, v) for k, v in query.items() if k not in _RESERVED_PARAMS and v != ""
+        ]
+        if not filters:
+            return rows
+        fields = DATE_FIELDS.get(svc)
+        if fields is not None:
+            # 일자 매개변수는 기간 또는 접두어(년, 년월)로 비교
+            start = query.get(fields.start, "")
+            end = query.get(fields.end, "99999999")
+            prefix = query.get(fields.day, "")
+            filters = [
+                (k, v)
+                for k, v in filters
+                if k not in (fields.start, fields.end, fields.day)
+            ]
+            rows = [
+                r
+                for r in rows
+                if start <= r[fields.day] <= end and r[fields.day].startswith(prefix)
+            ]
+        return [r for r in rows if all(str(r.get(k, v)) == v for k, v in filters)]
+
+    def _throttled(self) -> bool:
+        """
+        초당 요청 수 제한을 넘었는지 확인합니다.
+        """
+        if self._rate_limit is None:
+            return False
+        now = monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self._rate_limit, self._tokens + elapsed * self._rate_limit)
+        self._updated = now
+        if self._tokens < 1:
+            return True
+        self._tokens -= 1
+        return False
+
+    def _result(self, code: InternalServiceCode) -> web.Response:
+        """
+        서비스 데이터가 없는 결과 응답을 생성합니다.
+        """
+        self.stats[code.value] += 1
+        body = {"RESULT": {"CODE": code.value, "MESSAGE": _MESSAGES[code]}}
+        return web.Response(body=orjson.dumps(body), content_type="application/json")
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """
+        서비스 요청을 처리합니다.
+        """
+        self.stats["requests"] += 1
+        self._inflight += 1
+        self.stats["max_inflight"] = max(self.stats["max_inflight"], self._inflight)
+        try:
+            delay = self._latency + self._random.uniform(0, self._jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return self._respond(request)
+        finally:
+            self._inflight -= 1
+
+    def _respond(self, request: web.Request) -> web.Response:
+        """
+        요청에 대한 응답을 생성합니다.
+        """
+        query = request.query
+        # 요청 수 제한 및 무작위 오류
+        if self._throttled():
+            if self._throttle_status is not None:
+                self.stats[f"HTTP-{self._throttle_status}"] += 1
+                return web.Response(status=self._throttle_status)
+            return self._result(InternalServiceCode.TOO_MANY_REQUESTS)
+        if self._random.random() < self.http_error_rate:
+            self.stats["HTTP-503"] += 1
+            return web.Response(status=503)
+        if self._random.random() < self.error_rate:
+            return self._result(
+                self._random.choice(
+                    (
+                        InternalServiceCode.SERVER_ERROR,
+                        InternalServiceCode.DATABASE_ERROR,
+                    )
+                )
+            )
+        # 요청 검증
+        try:
+            svc = Services(request.match_info["service"])
+        except ValueError:
+            return self._result(InternalServiceCode.UNKNOWN_SERVICE)
+        if self._keys is not None and query.get("KEY") not in self._keys:
+            return self._result(InternalServiceCode.UNAUTHORIZED)
+        try:
+            index = int(query.get("pIndex", 1))
+            size = int(query.get("pSize", 100))
+        except ValueError:
+            return self._result(InternalServiceCode.UNSUPPORTED_TYPE)
+        if size > 1000:
+            return self._result(InternalServiceCode.REQUEST_TOO_LARGE)
+        # 페이지 처리
+        rows = self._records(svc, query)
+        page = rows[(index - 1) * size : index * size]
+        if not page:
+            return self._result(InternalServiceCode.NOT_FOUND)
+        self.stats[InternalServiceCode.OK.value] += 1
+        body = {
+            svc.value: [
+                {
+                    "head": [
+                        {"list_total_count": len(rows)},
+                        {
+                            "RESULT": {
+                                "CODE": InternalServiceCode.OK.value,
+                                "MESSAGE": _MESSAGES[InternalServiceCode.OK],
+                            }
+                        },
+                    ]
+                },
+                {"row": list(page)},
+            ]
+        }
+        return web.Response(body=orjson.dumps(body), content_type="application/json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="나이스 교육정보 OPEN API 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--rows", type=int, default=1000, help="서비스별 레코드 수")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--http-error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    args = parser.parse_args()
+
+    rows = {svc: synthetic_rows(svc, args.rows) for svc in Services}
+    server = MockNeisServer(
+        rows,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        http_error_rate=args.http_error_rate,
+        rate_limit=args.rate_limit,
+        host=args.host,
+        port=args.port,
+    )
+
+    async def run():
+        async with server as url:
+            print(f"모의 서버 실행 중: {url}")
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,496 @@
+# -*- coding: utf-8 -*-
+"""
+성능 측정 모듈
+
+이 모듈은 파서의 초당 처리 레코드 수, 모델 생성 비용, `_deep_freeze` 키 변환,
+`ttl_cache`의 적중/실패 경로, 그리고 모의 서버를 대상으로 한 `SyncSession`과
+`AsyncSession`의 `get()` 처리량(1 ~ 100 페이지)을 측정합니다.
+측정 결과는 JSON 파일로 저장되며, 이전 결과와 비교할 수 있습니다.
+
+**사용례**::
+
+    # 모든 측정을 실행하고 결과 저장
+    python -m benchmarks.run -o results/0.2.0.json
+
+    # 일부 측정만 실행하고 이전 결과와 비교
+    python -m benchmarks.run --suite caches --suite sessions \\
+        --compare results/0.2.0.json -o results/new.json
+"""
+
+from __future__ import annotations
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from itertools import count
+from statistics import median
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterator
+import argparse
+import asyncio
+import gc
+import orjson
+import platform
+import subprocess
+import sys
+
+__all__ = ["Result", "measure", "measure_async", "run", "compare", "SUITES"]
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+@dataclass(frozen=True)
+class Result:
+    """
+    하나의 측정 결과를 나타내는 데이터 클래스입니다.
+    """
+
+    name: str
+    """측정 이름 (`그룹/대상` 형식)"""
+    items: int = 0
+    """한 번의 호출에서 처리한 항목 수 (레코드 수, 키 수 등)"""
+    number: int = 0
+    """반복마다 호출한 횟수"""
+    timings: tuple[float, ...] = ()
+    """반복마다 측정한 호출 1회당 소요 시간(초)"""
+    params: dict[str, Any] = field(default_factory=dict)
+    """측정 조건"""
+
+    @property
+    def best(self) -> float:
+        """호출 1회당 최소 소요 시간(초)"""
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        """호출 1회당 소요 시간의 중앙값(초)"""
+        return median(self.timings)
+
+    @property
+    def rate(self) -> float:
+        """소요 시간의 중앙값 기준 초당 처리 항목 수"""
+        return self.items / self.median
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        JSON으로 저장할 수 있는 딕셔너리로 변환합니다.
+
+        :return: 측정 결과 딕셔너리
+        :rtype: dict[str, Any]
+        """
+        data = asdict(self)
+        data.update(best=self.best, median=self.median, rate=self.rate)
+        return data
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    items: int = 1,
+    number: int | None = None,
+    repeat: int = 5,
+    min_time: float = 0.1,
+    **params,
+) -> Result:
+    """
+    함수의 호출 1회당 소요 시간을 측정합니다.
+
+    `number`가 None인 경우 한 번의 반복이 `min_time` 이상 걸리도록 호출 횟수를
+    자동으로 정하며, 측정 중에는 가비지 컬렉터를 비활성화합니다.
+
+    :param name: 측정 이름
+    :type name: str
+    :param func: 측정할 함수
+    :type func: Callable[[], Any]
+    :param items: 한 번의 호출에서 처리하는 항목 수
+    :type items: int
+    :param number: 반복마다 호출할 횟수
+    :type number: int 또는 None
+    :param repeat: 반복 횟수
+    :type repeat: int
+    :param min_time: 호출 횟수를 자동으로 정할 때 한 번의 반복에 걸릴 최소 시간(초)
+    :type min_time: float
+    :param params: 결과에 기록할 측정 조건
+    :return: 측정 결과
+    :rtype: Result
+    """
+    func()  # 준비 실행
+    if number is None:
+        number = 1
+        while True:
+            start = perf_counter()
+            for _ in range(number):
+                func()
+            if perf_counter() - start >= min_time:
+                break
+            number *= 2
+    timings = []
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((perf_counter() - start) / number)
+    finally:
+        if enabled:
+            gc.enable()
+    return Result(name, items, number, tuple(timings), params)
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+async def measure_async(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    *,
+    items: int = 1,
+    repeat: int = 5,
+    **params,
+) -> Result:
+    """
+    코루틴 함수의 호출 1회당 소요 시간을 측정합니다.
+
+    네트워크 요청처럼 호출마다 충분한 시간이 걸리는 대상을 위한 함수로, 반복마다
+    한 번씩만 호출합니다.
+
+    :param name: 측정 이름
+    :type name: str
+    :param func: 측정할 코루틴 함수
+    :type func: Callable[[], Awaitable[Any]]
+    :param items: 한 번의 호출에서 처리하는 항목 수
+    :type items: int
+    :param repeat: 반복 횟수
+    :type repeat: int
+    :param params: 결과에 기록할 측정 조건
+    :return: 측정 결과
+    :rtype: Result
+    """
+    await func()  # 준비 실행
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        await func()
+        timings.append(perf_counter() - start)
+    return Result(name, items, 1, tuple(timings), params)
+
+
+def _parsers(repeat: int) -> Iterator[Result]:
+    """
+    파서의 초당 처리 레코드 수를 측정합니다.
+    """
+    from ezneis.http.service import Services
+    from ezneis.parsers.department import DepartmentParser
+    from ezneis.parsers.major import MajorParser
+    from ezneis.parsers.time_table import TimetableParser
+    from ezneis.models.school_info import SchoolInfo
+    from .mock_server import synthetic_rows
+
+    for parser, svc in (
+        (TimetableParser, Services.TIMETABLES_H),
+        (MajorParser, Services.MAJORS),
+        (DepartmentParser, Services.DEPARTMENTS),
+    ):
+        rows = synthetic_rows(svc, 1000)
+        yield measure(
+            f"parsers/{parser.__name__}",
+            lambda: [parser.from_json(row) for row in rows],
+            items=len(rows),
+            repeat=repeat,
+        )
+    # 빌더가 페이지마다 사용하는 모델의 from_dict
+    rows = synthetic_rows(Services.SCHOOL_INFO, 1000)
+    yield measure(
+        "parsers/SchoolInfo.from_dict",
+        lambda: [SchoolInfo.from_dict(row) for row in rows],
+        items=len(rows),
+        repeat=repeat,
+    )
+
+
+def _models(repeat: int) -> Iterator[Result]:
+    """
+    파싱이 끝난 값으로 모델을 생성하는 비용을 측정합니다.
+    """
+    from datetime import date
+    from ezneis.models.common import Timing
+    from ezneis.models.department import Department
+    from ezneis.models.major import Major
+    from ezneis.models.time_table import Timetable
+
+    cases = {
+        "Timetable": lambda: Timetable(
+            semester=1,
+            date=date(2025, 3, 4),
+            timing=Timing.DAY,
+            department="일반계",
+            major="일반과",
+            grade=1,
+            lecture_room_name="1반",
+            classroom_name="1",
+            period=3,
+            subject="수학",
+        ),
+        "Major": lambda: Major(timing=Timing.DAY, department="공업계", name="기계과"),
+        "Department": lambda: Department(timing=Timing.DAY, name="공업계"),
+    }
+    for name, func in cases.items():
+        yield measure(f"models/{name}", func, repeat=repeat)
+
+
+def _caches(repeat: int) -> Iterator[Result]:
+    """
+    `_deep_freeze`, `_make_key` 키 변환과 `ttl_cache`의 적중/실패 경로(크기 제한
+    포함)를 측정합니다.
+    """
+    # noinspection PyProtectedMember
+    from ezneis.utils.caches import _deep_freeze, _make_key, ttl_cache
+
+    small = [("7530000",), {"region": "J10"}]
+    large = [
+        (),
+        {
+            "ATPT_OFCDC_SC_CODE": "J10",
+            "SD_SCHUL_CODE": "7530000",
+            "filters": {"grades": [1, 2, 3], "classes": list(range(1, 13))},
+            "fields": ["GRADE", "CLASS_NM", "PERIO", "ITRT_CNTNT"],
+        },
+    ]
+    yield measure(
+        "caches/_deep_freeze[small]", lambda: _deep_freeze(small), repeat=repeat
+    )
+    yield measure(
+        "caches/_deep_freeze[large]", lambda: _deep_freeze(large), repeat=repeat
+    )
+    yield measure("caches/_make_key[small]", lambda: _make_key(*small), repeat=repeat)
+    yield measure("caches/_make_key[large]", lambda: _make_key(*large), repeat=repeat)
+
+    for maxsize in (64, 1024):
+
+        @ttl_cache(ttl=3600, maxsize=maxsize)
+        def cached(*args, **kwargs):
+            return args, kwargs
+
+        # 캐시를 가득 채운 뒤 적중 및 실패(삭제 포함) 경로를 측정
+        for i in range(maxsize):
+            cached(i, region="J10")
+        unique = count(maxsize)
+        yield measure(
+            "caches/ttl_cache[hit]",
+            lambda: cached(0, region="J10"),
+            repeat=repeat,
+            maxsize=maxsize,
+        )
+        yield measure(
+            "caches/ttl_cache[miss]",
+            lambda: cached(next(unique), region="J10"),
+            repeat=repeat,
+            maxsize=maxsize,
+        )
+
+    # 크기 제한이 있는 경우 실패 경로에 크기 추정과 크기 기반 삭제가 추가됨
+    @ttl_cache(ttl=3600, maxsize=1024, maxbytes=64 * 1024)
+    def bounded(*args, **kwargs):
+        return args, kwargs
+
+    for i in range(1024):
+        bounded(i, region="J10")
+    unique = count(1024)
+    yield measure(
+        "caches/ttl_cache[miss]",
+        lambda: bounded(next(unique), region="J10"),
+        repeat=repeat,
+        maxbytes=64 * 1024,
+    )
+
+    @ttl_cache(ttl=0)
+    def uncached(*args, **kwargs):
+        return args, kwargs
+
+    yield measure(
+        "caches/ttl_cache[disabled]", lambda: uncached(0, region="J10"), repeat=repeat
+    )
+
+
+def _sessions(repeat: int) -> Iterator[Result]:
+    """
+    모의 서버를 대상으로 `get()`의 처리량을 측정합니다.
+    """
+    from ezneis.http import AsyncSession, BridgeSession, SyncSession
+    from ezneis.http.service import Services
+    from .mock_server import MockNeisServer, synthetic_rows
+
+    svc = Services.DEPARTMENTS
+    for pages in (1, 10, 100):
+        rows = {svc: synthetic_rows(svc, pages * 1000)}
+        with MockNeisServer(rows).serve() as url:
+            for session in (SyncSession, BridgeSession):
+                with session("key", base_url=url) as sess:
+                    yield measure(
+                        f"sessions/{session.__name__}.get",
+                        lambda: sess.get(svc),
+                        items=pages * 1000,
+                        number=1,
+                        repeat=repeat,
+                        pages=pages,
+                    )
+
+        async def run_async() -> Result:
+            async with MockNeisServer(rows) as url:
+                async with AsyncSession("key", base_url=url) as sess:
+                    return await measure_async(
+                        "sessions/AsyncSession.get",
+                        lambda: sess.get(svc),
+                        items=pages * 1000,
+                        repeat=repeat,
+                        pages=pages,
+                    )
+
+        yield asyncio.run(run_async())
+
+
+SUITES: dict[str, Callable[[int], Iterator[Result]]] = {
+    "parsers": _parsers,
+    "models": _models,
+    "caches": _caches,
+    "sessions": _sessions,
+}
+"""측정 그룹별 측정 함수"""
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+def run(suites: list[str] | None = None, repeat: int = 5) -> list[Result]:
+    """
+    측정 그룹을 실행합니다.
+
+    측정 대상을 불러올 수 없는 경우 예외가 그대로 전파됩니다. 이전 버전과 비교할
+    때는 `compare`가 양쪽에 모두 있는 측정만 비교합니다.
+
+    :param suites: 실행할 측정 그룹 이름 목록, None인 경우 모든 그룹
+    :type suites: list[str] 또는 None
+    :param repeat: 측정마다 반복할 횟수
+    :type repeat: int
+    :return: 측정 결과 목록
+    :rtype: list[Result]
+    """
+    results = []
+    for name in suites or SUITES:
+        for result in SUITES[name](repeat):
+            results.append(result)
+            print(_format(result), file=sys.stderr)
+    return results
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+def compare(
+    baseline: dict[str, Any], results: list[Result]
+) -> list[tuple[str, float, float]]:
+    """
+    이전 측정 결과와 현재 측정 결과의 소요 시간 중앙값을 비교합니다.
+
+    :param baseline: 이전에 저장한 측정 결과 (JSON 파일의 내용)
+    :type baseline: dict[str, Any]
+    :param results: 현재 측정 결과 목록
+    :type results: list[Result]
+    :return: (측정 이름, 이전 중앙값, 현재 중앙값) 튜플 목록
+    :rtype: list[tuple[str, float, float]]
+    """
+    previous = {
+        _key(r["name"], r["params"]): r["median"]
+        for r in baseline["results"]
+        # 이전 형식에서 건너뛴 것으로 기록된 측정은 제외
+        if "median" in r
+    }
+    return [
+        (_key(r.name, r.params), previous[_key(r.name, r.params)], r.median)
+        for r in results
+        if _key(r.name, r.params) in previous
+    ]
+
+
+def _key(name: str, params: dict[str, Any]) -> str:
+    """
+    측정 이름과 측정 조건으로 비교에 사용할 키를 생성합니다.
+    """
+    if not params:
+        return name
+    return name + "(" + ", ".join(f"{k}={v}" for k, v in params.items()) + ")"
+
+
+def _format(result: Result) -> str:
+    """
+    측정 결과를 한 줄로 나타냅니다.
+    """
+    return (
+        f"{_key(result.name, result.params):<40} "
+        f"{result.median * 1e6:>12.2f} us  {result.rate:>14,.0f} /s"
+    )
+
+
+def _metadata() -> dict[str, Any]:
+    """
+    측정 환경 정보를 수집합니다.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        package = version("ezneis")
+    except PackageNotFoundError:
+        package = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "version": package,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ezneis 성능 측정")
+    parser.add_argument(
+        "--suite", action="append", choices=list(SUITES), help="실행할 측정 그룹"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="측정마다 반복할 횟수")
+    parser.add_argument("-o", "--output", help="측정 결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--compare", help="비교할 이전 측정 결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = run(args.suite, args.repeat)
+    document = {
+        "meta": _metadata(),
+        "results": [result.as_dict() for result in results],
+    }
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(orjson.dumps(document, option=orjson.OPT_INDENT_2))
+    if args.compare:
+        with open(args.compare, "rb") as f:
+            baseline = orjson.loads(f.read())
+        print(f"\n{'측정':<40} {'이전':>12} {'현재':>12} {'변화':>8}")
+        for name, before, after in compare(baseline, results):
+            change = (after - before) / before * 100
+            print(
+                f"{name:<40} {before * 1e6:>10.2f}us "
+                f"{after * 1e6:>10.2f}us {change:>+7.1f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
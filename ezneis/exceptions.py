@@ -5,6 +5,9 @@ __all__ = [
     "InternalServiceCode",
     "InternalServiceError",
     "ServiceUnavailableError",
+    "DeadlineExceededError",
+    "CircuitOpenError",
+    "KeyPoolExhaustedError",
     "DataNotFoundException",
     "SessionClosedException",
 ]
@@ -96,10 +99,13 @@ class ServiceUnavailableError(Exception):
     서비스 요청에 실패했을 때 발생한 오류를 나타냅니다.
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, status: int | None = None):
         self._url = url
+        self._status = status
 
     def __str__(self) -> str:
+        if self._status is not None:
+            return f"'{self._url}'에 연결할 수 없습니다. (HTTP {self._status})"
         return f"'{self._url}'에 연결할 수 없습니다."
 
     @property
@@ -111,6 +117,118 @@ class ServiceUnavailableError(Exception):
         """
         return self._url
 
+    @property
+    def status(self) -> int | None:
+        """
+        서비스가 응답한 HTTP 상태 코드입니다. 연결 자체에 실패한 경우 None입니다.
+
+        :return: int | None
+        """
+        return self._status
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class DeadlineExceededError(TimeoutError):
+    """
+    요청이 제한 시간 안에 완료되지 않았을 때 발생한 오류를 나타냅니다.
+    """
+
+    def __init__(self, url: str, timeout: float | None = None):
+        self._url = url
+        self._timeout = timeout
+
+    def __str__(self) -> str:
+        if self._timeout is not None:
+            return (
+                f"'{self._url}'에 대한 요청이 제한 시간({self._timeout}초) 안에 "
+                f"완료되지 않았습니다."
+            )
+        return f"'{self._url}'에 대한 요청이 제한 시간 안에 완료되지 않았습니다."
+
+    @property
+    def url(self) -> str:
+        """
+        요청한 서비스의 url입니다.
+
+        :return: str
+        """
+        return self._url
+
+    @property
+    def timeout(self) -> float | None:
+        """
+        요청에 설정된 제한 시간(초)입니다.
+
+        :return: float | None
+        """
+        return self._timeout
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class CircuitOpenError(Exception):
+    """
+    오류가 잦아 회로가 열린 서비스에 요청하지 않고 즉시 실패했음을 나타냅니다.
+    """
+
+    def __init__(self, url: str, retry_after: float | None = None):
+        self._url = url
+        self._retry_after = retry_after
+
+    def __str__(self) -> str:
+        if self._retry_after is not None:
+            return (
+                f"'{self._url}'의 오류가 잦아 요청을 중단했습니다. "
+                f"({self._retry_after:.1f}초 후 재개)"
+            )
+        return f"'{self._url}'의 오류가 잦아 요청을 중단했습니다."
+
+    @property
+    def url(self) -> str:
+        """
+        요청한 서비스의 url입니다.
+
+        :return: str
+        """
+        return self._url
+
+    @property
+    def retry_after(self) -> float | None:
+        """
+        회로가 다시 요청을 시험하기까지 남은 시간(초)입니다.
+
+        :return: float | None
+        """
+        return self._retry_after
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class KeyPoolExhaustedError(Exception):
+    """
+    키 풀에 요청에 사용할 수 있는 인증 키가 남아 있지 않은 오류를 나타냅니다.
+    """
+
+    def __init__(self, available_at: float | None = None):
+        self._available_at = available_at
+
+    def __str__(self) -> str:
+        return "사용할 수 있는 인증 키가 없습니다. (모든 키가 할당량을 소진했거나 사용 중지됨)"
+
+    @property
+    def available_at(self) -> float | None:
+        """
+        가장 먼저 다시 사용할 수 있게 되는 키의 사용 재개 시각(UNIX 시간)입니다.
+        알 수 없는 경우 None입니다.
+
+        :return: float | None
+        """
+        return self._available_at
+
 
 # noinspection SpellCheckingInspection
 # noinspection GrazieInspection
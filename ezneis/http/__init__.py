@@ -1,4 +1,16 @@
 # -*- coding: utf-8 -*-
 from .synchronous import SyncSession
 from .asynchronous import AsyncSession
-from .service import Service
+from .bridge import BridgeSession
+from .service import Services
+from .concurrency import AdaptiveConcurrency
+from .expiry import ExpiryPolicy
+from .keys import KeyPool
+from .throttle import CircuitBreaker, HedgePolicy, RetryPolicy, TokenBucket
+from .cache import (
+    CountHints,
+    ResponseCache,
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    FileResponseCache,
+)
@@ -1,19 +1,51 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from .service import Service
+from collections import deque
+from itertools import chain
+from time import monotonic
+from typing import Any, AsyncIterator, Callable, Hashable, Mapping, Sequence, TypeVar
+from .concurrency import AdaptiveConcurrency
+from .cache import CountHints, ResponseCache
+from .codec import decode
+from .instrument import SessionMetrics
+from .keys import KeyPool
+from .service import BASE_URL, Services, urljoin
+from .throttle import CircuitBreaker, HedgePolicy, RetryPolicy, TokenBucket
 from ..exceptions import (
+    CircuitOpenError,
     DataNotFoundException,
+    DeadlineExceededError,
     InternalServiceCode,
     InternalServiceError,
     ServiceUnavailableError,
     SessionClosedException,
 )
+from ..utils.metrics import REGISTRY, MetricsRegistry
 import aiohttp
 import asyncio
-import orjson
 
 __all__ = ["AsyncSession"]
 
+T = TypeVar("T")
+
+# 동시성 제어기에 혼잡 신호로 전달할 내부 서비스 코드
+_CONGESTION_CODES = frozenset(
+    (
+        InternalServiceCode.TOO_MANY_REQUESTS,
+        InternalServiceCode.SERVER_ERROR,
+        InternalServiceCode.DATABASE_ERROR,
+    )
+)
+
+
+def _cancel(task: asyncio.Future):
+    """
+    요청을 취소하고, 취소되는 대신 예외로 끝난 요청(가령, 취소와 동시에 HTTP 요청의
+    제한 시간이 지난 경우)의 예외는 확인 처리합니다.
+    """
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
 
 class AsyncSession:
     """
@@ -21,7 +53,7 @@ class AsyncSession:
 
     **사용례**::
 
-        from ezneis.http import AsyncSession, Service
+        from ezneis.http import AsyncSession, Services
         import asyncio
 
 
@@ -32,23 +64,83 @@ class AsyncSession:
 
             # 컨텍스트 매니저를 이용하여 세션 생성
             async with AsyncSession(key) as sess:
-               data = await sess.get(Service.SCHOOL_INFO, expected=10)
+               data = await sess.get(Services.SCHOOL_INFO, expected=10)
 
 
         asyncio.run(main())
     """
 
-    def __init__(self, key: str):
+    def __init__(
+        self,
+        key: str | KeyPool,
+        *,
+        max_concurrency: int = 16,
+        adaptive: bool = True,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int | None = 300,
+        rate_limiter: TokenBucket | None = None,
+        retry: RetryPolicy | None = RetryPolicy(),
+        cache: ResponseCache | None = None,
+        base_url: str = BASE_URL,
+        hints: CountHints | None = None,
+        hedge: HedgePolicy | None = None,
+        metrics: MetricsRegistry | None = REGISTRY,
+        breaker: CircuitBreaker | None = None,
+    ):
         """
         AsyncSession 인스턴스를 초기화합니다.
 
-        :param key: 나이스 교육정보 OPEN API 인증 키
-        :type key: str
+        페이지 요청은 `AdaptiveConcurrency` 제어기를 거쳐 최대 `max_concurrency`개까지
+        동시에 실행되며, `adaptive`가 True인 경우 지연 시간과 혼잡 신호(ERROR-337,
+        ERROR-500, ERROR-600, 5xx 응답)에 따라 동시 실행 수가 자동으로 조정됩니다.
+
+        :param key: 나이스 교육정보 OPEN API 인증 키 또는 여러 키에 요청을 분산할 키 풀
+        :type key: str 또는 KeyPool
+        :param max_concurrency: 동시에 실행할 수 있는 최대 페이지 요청 수 및 소켓 수
+        :type max_concurrency: int
+        :param adaptive: 동시 실행 수를 AIMD 방식으로 자동 조정할지 여부
+        :type adaptive: bool
+        :param keepalive_timeout: 유휴 keep-alive 연결을 유지할 시간(초)
+        :type keepalive_timeout: float
+        :param ttl_dns_cache: DNS 조회 결과를 캐싱할 시간(초), None인 경우 무기한
+        :type ttl_dns_cache: int 또는 None
+        :param rate_limiter: 페이지 요청에 적용할 토큰 버킷 (여러 세션이 공유 가능)
+        :type rate_limiter: TokenBucket 또는 None
+        :param retry: 일시적인 오류에 대한 재시도 정책 (None인 경우 재시도하지 않음)
+        :type retry: RetryPolicy 또는 None
+        :param cache: 페이지 응답을 저장할 캐시 (None인 경우 캐싱하지 않음)
+        :type cache: ResponseCache 또는 None
+        :param base_url: 나이스 교육정보 OPEN API의 기본 url (테스트용 서버 등)
+        :type base_url: str
+        :param hints: 질의별 총 레코드 개수 힌트 (None인 경우 세션마다 새로 생성,
+            여러 세션이 공유 가능)
+        :type hints: CountHints 또는 None
+        :param hedge: 응답이 늦는 페이지에 중복 요청을 보낼 정책 (None인 경우 사용하지
+            않음, 여러 세션이 공유 가능)
+        :type hedge: HedgePolicy 또는 None
+        :param metrics: 요청 수, 응답 시간 등의 지표를 기록할 저장소 (None인 경우
+            기록하지 않음, 기본값은 전역 저장소)
+        :type metrics: MetricsRegistry 또는 None
+        :param breaker: 오류가 잦은 서비스에 대한 요청을 차단할 회로 차단기 (None인 경우
+            사용하지 않음, 여러 세션이 공유 가능)
+        :type breaker: CircuitBreaker 또는 None
         """
-        self._key = key
+        self._keys = key if isinstance(key, KeyPool) else None
+        self._key = "" if self._keys is not None else key
         self._max_req = 5 if not key else 1000
         self._session: aiohttp.ClientSession | None = None
         self._closed = False
+        self._concurrency = AdaptiveConcurrency(max_concurrency, adaptive=adaptive)
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
+        self._rate_limiter = rate_limiter
+        self._retry = retry or RetryPolicy(retries=0)
+        self._cache = cache
+        self._base_url = base_url
+        self._hints = hints or CountHints()
+        self._hedge = hedge
+        self._metrics = SessionMetrics(metrics)
+        self._breaker = breaker
 
     async def __aenter__(self) -> AsyncSession:
         """
@@ -60,7 +152,8 @@ class AsyncSession:
         """
         if self._closed:
             raise SessionClosedException
-        self._session = aiohttp.ClientSession()
+        if self._session is None:
+            self._session = self._new_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -74,21 +167,43 @@ class AsyncSession:
         await self.close()
 
     async def get(
-        self, svc: Service, *, limit: int | None = None, **kwargs
-    ) -> list[dict]:
+        self,
+        svc: Services,
+        *,
+        limit: int | None = None,
+        parse: Callable[[dict], T] | None = None,
+        timeout: float | None = None,
+        refresh: bool = False,
+        **kwargs,
+    ) -> list[dict] | tuple[T, ...]:
         """
         나이스 교육정보 OPEN API에서 데이터를 조회합니다.
 
         이 메서드는 지정된 서비스에서 데이터를 가져오며, 필요한 경우 여러 페이지에 걸쳐 데이터를 수집합니다.
-
-        :param svc: 조회할 서비스 (Service 열거형)
-        :type svc: Service
+        각 페이지는 병렬로 요청되지만, 레코드는 항상 페이지 번호 순서대로 반환됩니다.
+        치명적인 오류가 발생하거나 `limit`에 도달하면 남은 페이지 요청은 즉시 취소됩니다.
+        `limit`이 없는 경우 총 레코드 개수를 확인하기 위해 첫번째 페이지를 먼저 요청하지만,
+        같은 조건으로 이전에 조회했거나 `count`를 호출한 적이 있다면 처음부터 여러
+        페이지를 병렬로 요청합니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
         :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
         :type limit: int 또는 None
+        :param parse: 레코드를 모델로 변환할 함수 (가령, `SchoolInfo.from_dict`).
+            주어진 경우 각 페이지의 응답 본문을 곧바로 모델로 변환하며, 중간 레코드
+            목록 없이 모델 튜플을 반환
+        :type parse: Callable[[dict], T] 또는 None
+        :param timeout: 모든 페이지를 받기까지의 제한 시간(초), 재시도와 각 페이지
+            요청에도 적용 (None인 경우 제한하지 않음)
+        :type timeout: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청하여 캐시를 갱신
+        :type refresh: bool
         :param kwargs: 서비스별 추가 매개변수
-        :return: 조회된 데이터 레코드 목록
-        :rtype: list[dict]
+        :return: 조회된 데이터 레코드 목록 또는 모델 튜플
+        :rtype: list[dict] 또는 tuple[T, ...]
         :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises DeadlineExceededError: 제한 시간 안에 조회를 마치지 못한 경우
         :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
         :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
         :raises SessionClosedException: 세션이 이미 닫힌 경우
@@ -98,7 +213,7 @@ class AsyncSession:
             async with AsyncSession("your_api_key") as sess:
                 # 학교 정보 조회
                 schools = await sess.get(
-                    Service.SCHOOL_INFO,
+                    Services.SCHOOL_INFO,
                     expected=None,             # 모든 데이터 조회
                     ATPT_OFCDC_SC_CODE="B10",  # 서울특별시교육청
                     SCHUL_KND_SC_NM="고등학교"   # 학교 종류
@@ -106,7 +221,7 @@ class AsyncSession:
 
                 # 급식 정보 조회
                 meals = await sess.get(
-                    Service.MEALS,
+                    Services.MEALS,
                     expected=10,               # 10개 데이터 조회
                     ATPT_OFCDC_SC_CODE="J10",  # 경기도교육청
                     SD_SCHUL_CODE="1234567",   # 학교 코드
@@ -121,71 +236,441 @@ class AsyncSession:
         if self._closed:
             raise SessionClosedException
         if self._session is None:
-            self._session = aiohttp.ClientSession()
-
-        # 요청 작업 생성
-        tasks = []
-        records = []
-        # 예상 레코드 수가 설정된 경우
-        if limit is not None:
-            pages = (limit + self._max_req - 1) // self._max_req
-            size = min(self._max_req, limit)
-            start = 1
-        # 예상 레코드 수가 설정되지 않은 경우
+            self._session = self._new_session()
+
+        # 페이지 번호 순서대로 레코드 수집
+        chunks = []
+        deadline = None if timeout is None else monotonic() + timeout
+        pages = self._pages(
+            svc, limit, self._concurrency.maximum, parse, deadline, refresh, **kwargs
+        )
+
+        async def collect():
+            async for page in pages:
+                chunks.append(page)
+
+        # 제한 시간이 지나면 수집을 취소하여 남은 페이지 요청도 함께 취소
+        # (각 페이지 요청은 제한 시간 안에 마칠 수 없는 재시도를 시작하지 않음)
+        try:
+            await asyncio.wait_for(collect(), timeout)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(self._url(svc), timeout) from None
+        finally:
+            await pages.aclose()
+        if parse is not None:
+            # 페이지별 모델 튜플을 중간 목록 없이 하나의 튜플로 연결
+            records = tuple(chain.from_iterable(chunks))
         else:
-            # 단일 요청을 통해 총 레코드 개수를 가져오기
-            limit, rows = await self._request(svc, 1, self._max_req, **kwargs)
-            records.extend(rows)
-            # 첫번째 요청을 기반으로 페이지 계산
-            pages = (limit + self._max_req - 1) // self._max_req
-            size = self._max_req
-            start = 2
-        # 페이지 갯수에 맞춰 요청 작업 생성
-        for i in range(start, pages + 1):
-            tasks.append(self._request(svc, i, size, **kwargs))
-
-        # 요청 작업 병렬 실행 후 처리
-        for result in await asyncio.gather(*tasks, return_exceptions=True):
-            if isinstance(result, tuple):
-                _, rows = result
-                records.extend(rows)
-            # 데이터가 없는 경우는 무시
-            elif isinstance(result, DataNotFoundException):
-                continue
-            # 그 외 예외는 재전파
-            else:
-                raise result
+            records = list(chain.from_iterable(chunks))
 
         # 레코드가 없는 경우 예외 발생
         if len(records) == 0:
-            raise DataNotFoundException(svc.url, kwargs)
-        # 레코드를 최대 expected만큼 반환
-        return records[:limit]
+            raise DataNotFoundException(self._url(svc), kwargs)
+        return records
+
+    async def count(self, svc: Services, **kwargs) -> int:
+        """
+        조회 조건에 해당하는 총 레코드 개수를 반환합니다.
+
+        레코드 하나만 요청하여 응답의 `list_total_count`를 확인하므로 데이터를
+        조회하는 것보다 훨씬 가볍습니다. 확인한 값은 힌트로 저장되어, 이후 같은
+        조건의 `get` 호출은 첫번째 페이지를 기다리지 않고 바로 여러 페이지를 병렬로
+        요청합니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 총 레코드 개수 (데이터가 없는 경우 0)
+        :rtype: int
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+
+        **사용례**::
+
+            async with AsyncSession("your_api_key") as sess:
+                total = await sess.count(Services.SCHOOL_INFO, ATPT_OFCDC_SC_CODE="J10")
+        """
+        # 세션 상태 체크
+        if self._closed:
+            raise SessionClosedException
+        if self._session is None:
+            self._session = self._new_session()
+
+        try:
+            total, _ = await self._request(svc, 1, 1, **kwargs)
+        except DataNotFoundException:
+            self._hints.discard(svc, kwargs)
+            return 0
+        self._hints.set(svc, kwargs, total)
+        return total
+
+    async def get_many(
+        self,
+        queries: (
+            Mapping[Hashable, tuple[Services, Mapping[str, Any]]]
+            | Sequence[tuple[Services, Mapping[str, Any]]]
+        ),
+        *,
+        return_exceptions: bool = False,
+    ) -> dict[Hashable, list[dict] | Exception]:
+        """
+        나이스 교육정보 OPEN API에 여러 질의를 한 번에 요청합니다.
+
+        모든 질의를 동시에 실행하며, 모든 페이지 요청은 세션의 동시성 제어기 하나를
+        거치므로 전체 동시 실행 수가 함께 제한됩니다. 전체 소요 시간은 질의 시간의 합이
+        아닌 가장 느린 질의의 시간에 가까워집니다.
+
+        :param queries: (서비스, 매개변수) 튜플의 시퀀스 또는 이를 값으로 하는 매핑.
+            매개변수에는 `get` 메서드와 같이 `limit`을 포함할 수 있습니다.
+        :type queries: Mapping 또는 Sequence
+        :param return_exceptions: True인 경우 실패한 질의의 예외를 결과로 반환하고,
+            False인 경우 첫번째 예외를 재전파하고 남은 요청을 취소합니다.
+        :type return_exceptions: bool
+        :return: 질의의 키(시퀀스인 경우 인덱스)별 데이터 레코드 목록
+        :rtype: dict[Hashable, list[dict] | Exception]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+
+        **사용례**::
+
+            async with AsyncSession("your_api_key") as sess:
+                school = {"ATPT_OFCDC_SC_CODE": "J10", "SD_SCHUL_CODE": "1234567"}
+                results = await sess.get_many({
+                    "meals": (Services.MEALS, {**school, "MLSV_YMD": "202505"}),
+                    "schedules": (Services.SCHEDULES, {**school, "AA_YMD": "202505"}),
+                })
+                print(len(results["meals"]), len(results["schedules"]))
+        """
+        # 세션 상태 체크
+        if self._closed:
+            raise SessionClosedException
+
+        if isinstance(queries, Mapping):
+            items = list(queries.items())
+        else:
+            items = list(enumerate(queries))
+
+        tasks = [
+            asyncio.ensure_future(self.get(svc, **params)) for _, (svc, params) in items
+        ]
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        finally:
+            # 오류로 인해 중단된 경우 남은 질의 취소
+            for task in tasks:
+                _cancel(task)
+        return {key: result for (key, _), result in zip(items, results)}
+
+    async def iter_pages(
+        self,
+        svc: Services,
+        *,
+        limit: int | None = None,
+        prefetch: int = 1,
+        parse: Callable[[dict], T] | None = None,
+        **kwargs,
+    ) -> AsyncIterator[list[dict] | tuple[T, ...]]:
+        """
+        나이스 교육정보 OPEN API에서 데이터를 페이지 단위로 순차 조회합니다.
+
+        `get` 메서드와 달리 모든 페이지를 모으지 않고, 각 페이지가 도착하는 즉시
+        페이지 번호 순서대로 반환합니다. 현재 페이지를 처리하는 동안 최대 `prefetch`개의
+        다음 페이지를 미리 요청하므로, 메모리에는 그 이상의 페이지가 유지되지 않습니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
+        :type limit: int 또는 None
+        :param prefetch: 미리 요청해 둘 페이지 수 (최소 1)
+        :type prefetch: int
+        :param parse: 레코드를 모델로 변환할 함수 (주어진 경우 페이지마다 도착하는 즉시
+            모델 튜플로 변환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 페이지별 데이터 레코드 목록 또는 모델 튜플의 비동기 이터레이터
+        :rtype: AsyncIterator[list[dict] | tuple[T, ...]]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+
+        **사용례**::
+
+            async with AsyncSession("your_api_key") as sess:
+                async for page in sess.iter_pages(Services.TIMETABLES_H, **params):
+                    print(f"{len(page)}개의 레코드 수신")
+        """
+        # 세션 상태 체크
+        if self._closed:
+            raise SessionClosedException
+        if self._session is None:
+            self._session = self._new_session()
+
+        pages = self._pages(svc, limit, max(1, prefetch), parse, **kwargs)
+        empty = True
+        try:
+            async for rows in pages:
+                empty = False
+                yield rows
+        finally:
+            await pages.aclose()
+        # 레코드가 없는 경우 예외 발생
+        if empty:
+            raise DataNotFoundException(self._url(svc), kwargs)
+
+    async def iter_records(
+        self, svc: Services, *, limit: int | None = None, prefetch: int = 1, **kwargs
+    ) -> AsyncIterator[dict]:
+        """
+        나이스 교육정보 OPEN API에서 데이터를 레코드 단위로 순차 조회합니다.
+
+        `iter_pages` 메서드를 이용하므로, 각 페이지가 도착하는 즉시 레코드를 반환합니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
+        :type limit: int 또는 None
+        :param prefetch: 미리 요청해 둘 페이지 수 (최소 1)
+        :type prefetch: int
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 데이터 레코드의 비동기 이터레이터
+        :rtype: AsyncIterator[dict]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+
+        **사용례**::
+
+            async with AsyncSession("your_api_key") as sess:
+                async for row in sess.iter_records(Services.MEALS, **params):
+                    print(row["DDISH_NM"])
+        """
+        pages = self.iter_pages(svc, limit=limit, prefetch=prefetch, **kwargs)
+        try:
+            async for rows in pages:
+                for row in rows:
+                    yield row
+        finally:
+            await pages.aclose()
+
+    async def _pages(
+        self,
+        svc: Services,
+        limit: int | None,
+        window: int,
+        parse: Callable[[dict], T] | None = None,
+        deadline: float | None = None,
+        refresh: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[list[dict] | tuple[T, ...]]:
+        """
+        페이지를 최대 `window`개까지 병렬로 요청하고, 페이지 번호 순서대로 반환합니다.
+
+        다음 페이지는 앞선 페이지가 반환된 뒤에만 창에 추가되므로, 도착 순서와
+        관계없이 최대 `window`개의 페이지만 메모리에 유지됩니다. 중복 요청 정책이
+        설정된 경우, 다음 차례의 페이지가 늦어지면 같은 페이지를 한 번 더 요청합니다.
+        오류가 발생하거나 `limit`에 도달하거나 순회가 중단되면, 남은 요청은 즉시
+        취소됩니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
+        :type limit: int 또는 None
+        :param window: 동시에 요청해 둘 최대 페이지 수
+        :type window: int
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param deadline: 모든 페이지를 받아야 하는 시각 (`time.monotonic` 기준)
+        :type deadline: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청
+        :type refresh: bool
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 페이지별 데이터 레코드 목록의 비동기 이터레이터
+        :rtype: AsyncIterator[list[dict]]
+        """
+        size = self._max_req if limit is None else min(self._max_req, limit)
+        pending = deque()
+        hint = None if limit is not None else self._hints.get(svc, kwargs)
+        try:
+            # 예상 레코드 수가 설정된 경우
+            if limit is not None:
+                total, first, index = limit, None, 1
+            # 이전에 확인한 총 레코드 개수가 있는 경우 첫 페이지부터 바로 병렬 요청
+            elif hint is not None:
+                total, first, index = hint, None, 1
+            # 예상 레코드 수가 설정되지 않은 경우
+            else:
+                # 단일 요청을 통해 총 레코드 개수를 가져오기
+                try:
+                    total, first = await self._request(
+                        svc, 1, size, parse, deadline, refresh, **kwargs
+                    )
+                except DataNotFoundException:
+                    return
+                self._hints.set(svc, kwargs, total)
+                index = 2
+            pages = (total + size - 1) // size
+            remain = total
+            while True:
+                # 다음 페이지들을 창의 크기만큼 미리 요청
+                while index <= pages and len(pending) < window:
+                    task = asyncio.ensure_future(
+                        self._request(
+                            svc, index, size, parse, deadline, refresh, **kwargs
+                        )
+                    )
+                    pending.append((task, index, monotonic()))
+                    index += 1
+                if first is not None:
+                    rows, first = first, None
+                elif pending:
+                    try:
+                        count, rows = await self._wait_page(
+                            pending.popleft(),
+                            svc,
+                            size,
+                            parse,
+                            deadline,
+                            refresh,
+                            kwargs,
+                        )
+                    # 데이터가 없는 경우 마지막 페이지로 간주
+                    except DataNotFoundException:
+                        if hint is not None:
+                            self._hints.discard(svc, kwargs)
+                        return
+                    # 힌트와 실제 총 레코드 개수가 다른 경우 남은 페이지 수를 보정
+                    if limit is None and count != total:
+                        self._hints.set(svc, kwargs, count)
+                        remain += count - total
+                        total = count
+                        pages = (total + size - 1) // size
+                        if remain <= 0:
+                            return
+                else:
+                    return
+                # 레코드를 최대 limit만큼 반환
+                yield rows if len(rows) <= remain else rows[:remain]
+                remain -= len(rows)
+                # limit에 도달했거나 마지막 페이지인 경우 종료
+                if remain <= 0 or len(rows) < size:
+                    return
+        finally:
+            # 남은 요청 취소 (이미 실패한 요청은 예외를 확인 처리)
+            for task, *_ in pending:
+                _cancel(task)
+
+    async def _wait_page(
+        self,
+        entry: tuple[asyncio.Task, int, float],
+        svc: Services,
+        size: int,
+        parse: Callable[[dict], T] | None,
+        deadline: float | None,
+        refresh: bool,
+        kwargs: dict,
+    ) -> tuple[int, list[dict] | tuple[T, ...]]:
+        """
+        다음 차례의 페이지 응답을 기다립니다.
+
+        중복 요청 정책이 설정된 경우, 페이지를 요청한 뒤 정책의 지연 시간이 지나도록
+        응답이 없으면 같은 페이지를 한 번 더 요청하고 먼저 성공한 응답을 반환합니다.
+
+        :param entry: (페이지 요청, 페이지 번호, 요청 시각) 튜플
+        :type entry: tuple[asyncio.Task, int, float]
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :param size: 페이지당 레코드 수
+        :type size: int
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param deadline: 응답을 받아야 하는 시각 (`time.monotonic` 기준)
+        :type deadline: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청
+        :type refresh: bool
+        :param kwargs: 서비스별 추가 매개변수
+        :type kwargs: dict
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+        :rtype: tuple[int, list[dict] | tuple[T, ...]]
+        """
+        task, index, started = entry
+        candidates = {task}
+        delay = None if self._hedge is None else self._hedge.delay()
+        try:
+            if delay is not None:
+                wait = max(0.0, started + delay - monotonic())
+                done, _ = await asyncio.wait(candidates, timeout=wait)
+                # 응답이 늦는 경우 예산이 허용하는 만큼 중복 요청
+                if not done and self._hedge.acquire():
+                    self._metrics.hedge(svc)
+                    candidates.add(
+                        asyncio.ensure_future(
+                            self._request(
+                                svc, index, size, parse, deadline, refresh, **kwargs
+                            )
+                        )
+                    )
+            while True:
+                done, candidates = await asyncio.wait(
+                    candidates, return_when=asyncio.FIRST_COMPLETED
+                )
+                # 먼저 성공한 응답을 반환하고, 모두 실패한 경우 오류를 재전파
+                failed = None
+                for finished in done:
+                    if finished.exception() is None:
+                        return finished.result()
+                    failed = finished
+                if not candidates:
+                    return failed.result()
+        finally:
+            for remaining in candidates:
+                _cancel(remaining)
 
     async def _request(
-        self, svc: Service, index: int, size: int, **kwargs
-    ) -> tuple[int, list[dict]]:
+        self,
+        svc: Services,
+        index: int,
+        size: int,
+        parse: Callable[[dict], T] | None = None,
+        deadline: float | None = None,
+        refresh: bool = False,
+        **kwargs,
+    ) -> tuple[int, list[dict] | tuple[T, ...]]:
         """
         나이스 교육정보 OPEN API에 단일 페이지 요청을 수행합니다.
 
-        :param svc: 요청할 서비스 (Service 열거형)
-        :type svc: Service
+        캐시에 유효한 응답이 있는 경우 요청 없이 캐시된 응답을 반환합니다
+        (`refresh`가 True인 경우 새로 요청하여 캐시를 갱신).
+        요청 전에 토큰 버킷에서 토큰을 획득하며, 재시도할 수 있는 오류가 발생한
+        경우 재시도 정책에 따라 대기한 뒤 다시 요청합니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
         :param index: 요청할 페이지 번호
         :type index: int
         :param size: 페이지당 레코드 수
         :type size: int
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param deadline: 응답을 받아야 하는 시각 (`time.monotonic` 기준)
+        :type deadline: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청
+        :type refresh: bool
         :param kwargs: 서비스별 추가 매개변수
-        :return: (전체 레코드 수, 현재 페이지 레코드 목록) 튜플
-        :rtype: tuple[int, list[dict]]
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+        :rtype: tuple[int, list[dict] | tuple[T, ...]]
         :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises DeadlineExceededError: 제한 시간 안에 응답을 받지 못한 경우
+        :raises CircuitOpenError: 서비스의 회로가 열려 있고 캐시된 응답도 없는 경우
         :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises KeyPoolExhaustedError: 키 풀에 사용할 수 있는 키가 남아 있지 않은 경우
         :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
         :raises SessionClosedException: 세션이 닫힌 경우
         """
-        # 세션 상태 체크
-        if not self._session or self._closed:
-            raise SessionClosedException
-
         # 쿼리 생성
         query = {
             **kwargs,
@@ -195,23 +680,228 @@ class AsyncSession:
             "pSize": size,
         }
 
-        # 서비스에 쿼리 요청 후 결과 처리
-        async with self._session.get(svc.url, params=query) as resp:
-            if resp.status != 200:
-                raise ServiceUnavailableError(svc.url)
-            payload = orjson.loads(await resp.read())
+        # 캐시된 응답이 있는 경우 요청 없이 반환
+        # (회로가 열린 서비스는 만료된 응답이라도 반환)
+        if self._cache is not None and not refresh:
+            stale = (
+                self._breaker is not None
+                and self._breaker.state(svc) == CircuitBreaker.OPEN
+            )
+            content = await self._cache.load_async(svc, query, stale=stale)
+            if content is not None:
+                result = decode(svc, content, self._url(svc), query, parse)
+                self._metrics.page(svc, "cache")
+                return result
+
+        attempt = 0
+        while True:
+            # 회로가 열린 서비스는 요청하지 않고 즉시 실패
+            if self._breaker is not None and not self._breaker.allow(svc):
+                return await self._reject(svc, query, parse)
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve()
+                # 제한 시간 안에 토큰을 얻을 수 없는 경우 기다리지 않고 실패
+                if deadline is not None and monotonic() + wait >= deadline:
+                    self._rate_limiter.release()
+                    raise DeadlineExceededError(self._url(svc))
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            # 키 풀을 사용하는 경우 요청마다 사용량이 가장 적은 키를 선택
+            if self._keys is not None:
+                query["KEY"] = self._keys.acquire()
+            try:
+                result = await self._request_once(svc, query, parse, deadline)
+            except DataNotFoundException:
+                if self._breaker is not None:
+                    self._breaker.record(svc)
+                raise
+            except (InternalServiceError, ServiceUnavailableError) as e:
+                if self._breaker is not None:
+                    self._breaker.record(svc, e)
+                    # 이 오류로 회로가 열린 경우, 만료된 응답이라도 있으면 대신 반환
+                    if self._breaker.state(svc) == CircuitBreaker.OPEN:
+                        result = await self._stale(svc, query, parse)
+                        if result is not None:
+                            return result
+                # 키 때문에 발생한 오류인 경우 해당 키를 제외하고 다른 키로 즉시 재요청
+                if self._keys is not None and self._keys.report(query["KEY"], e):
+                    continue
+                # 재시도할 수 없거나 재시도 횟수를 모두 사용한 경우 재전파
+                if attempt >= self._retry.retries or not self._retry.is_retryable(e):
+                    raise
+                # 제한 시간 안에 재시도할 수 없는 경우
+                delay = self._retry.delay(attempt)
+                if deadline is not None and monotonic() + delay >= deadline:
+                    raise DeadlineExceededError(self._url(svc)) from e
+                # 공유된 토큰 버킷을 비워 다른 요청들도 함께 속도를 늦추도록 함
+                if self._rate_limiter is not None:
+                    self._rate_limiter.drain()
+            else:
+                if self._breaker is not None:
+                    self._breaker.record(svc)
+                self._metrics.page(svc, "network")
+                return result
+            self._metrics.retry(svc)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _reject(
+        self, svc: Services, query: dict, parse: Callable[[dict], T] | None = None
+    ) -> tuple[int, list[dict] | tuple[T, ...]]:
+        """
+        회로가 열린 서비스에 대한 요청을 처리합니다.
+
+        캐시에 만료된 응답이라도 남아 있는 경우 그 응답을 반환하고, 그렇지 않으면
+        즉시 실패합니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: dict
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+        :rtype: tuple[int, list[dict] | tuple[T, ...]]
+        :raises CircuitOpenError: 캐시된 응답이 없는 경우
+        """
+        result = await self._stale(svc, query, parse)
+        if result is None:
+            raise CircuitOpenError(self._url(svc), self._breaker.retry_after(svc))
+        return result
+
+    async def _stale(
+        self, svc: Services, query: dict, parse: Callable[[dict], T] | None = None
+    ) -> tuple[int, list[dict] | tuple[T, ...]] | None:
+        """
+        캐시에 남아 있는 응답을 만료 여부와 관계없이 반환합니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: dict
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플,
+            캐시된 응답이 없는 경우 None
+        :rtype: tuple[int, list[dict] | tuple[T, ...]] 또는 None
+        """
+        if self._cache is None:
+            return None
+        content = await self._cache.load_async(svc, query, stale=True)
+        if content is None:
+            return None
+        result = decode(svc, content, self._url(svc), query, parse)
+        self._metrics.page(svc, "stale")
+        return result
+
+    async def _request_once(
+        self,
+        svc: Services,
+        query: dict,
+        parse: Callable[[dict], T] | None = None,
+        deadline: float | None = None,
+    ) -> tuple[int, list[dict] | tuple[T, ...]]:
+        """
+        나이스 교육정보 OPEN API에 재시도 없이 단일 페이지 요청을 1회 수행합니다.
+
+        서비스 데이터가 포함된 응답은 캐시에 저장됩니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: dict
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param deadline: 응답을 받아야 하는 시각 (`time.monotonic` 기준)
+        :type deadline: float 또는 None
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+        :rtype: tuple[int, list[dict] | tuple[T, ...]]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises DeadlineExceededError: 제한 시간 안에 응답을 받지 못한 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 닫힌 경우
+        """
+        # 세션 상태 체크
+        if not self._session or self._closed:
+            raise SessionClosedException
+
+        # 제한 시간이 설정된 경우 남은 시간을 HTTP 요청의 제한 시간으로 사용
+        timeout = self._session.timeout
+        if deadline is not None:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededError(self._url(svc))
+            timeout = aiohttp.ClientTimeout(total=remaining)
+
+        # 동시성 제어기를 거쳐 서비스에 쿼리 요청 후 결과 처리
+        with self._metrics.request(svc) as probe:
+            async with self._concurrency:
+                start = monotonic()
+                try:
+                    async with self._session.get(
+                        self._url(svc),
+                        params=query,
+                        timeout=timeout,
+                    ) as resp:
+                        if resp.status != 200:
+                            # 서버 오류 또는 트래픽 제한인 경우 혼잡 신호로 간주
+                            if resp.status >= 500 or resp.status == 429:
+                                self._concurrency.on_congestion()
+                            raise ServiceUnavailableError(self._url(svc), resp.status)
+                        content = await resp.read()
+                # 연결 오류는 상태 코드가 없는 ServiceUnavailableError로 변환
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if deadline is not None and monotonic() >= deadline:
+                        raise DeadlineExceededError(self._url(svc)) from e
+                    raise ServiceUnavailableError(self._url(svc)) from e
+                latency = monotonic() - start
+                probe.received(content, latency)
+                if self._hedge is not None:
+                    self._hedge.record(latency)
+
+            # 응답 본문 해석 후 결과에 따라 동시성 제어기에 신호 전달
+            try:
+                result = decode(svc, content, self._url(svc), query, parse)
+            except DataNotFoundException:
+                self._concurrency.on_success(latency)
+                raise
+            except InternalServiceError as e:
+                if e.code in _CONGESTION_CODES:
+                    self._concurrency.on_congestion()
+                raise
+            self._concurrency.on_success(latency)
+
+        # 서비스 데이터가 포함된 응답을 캐시에 저장
+        if self._cache is not None:
+            await self._cache.store_async(svc, query, content)
+        return result
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """
+        연결 풀 설정이 적용된 aiohttp 세션을 생성합니다.
 
-        # 서비스 데이터가 누락된 경우 예외 처리
-        if svc.value not in payload:
-            code = payload["RESULT"]["CODE"]
-            if code == InternalServiceCode.NOT_FOUND.value:
-                raise DataNotFoundException(svc.url, query)
-            msg = payload["RESULT"]["MESSAGE"]
-            raise InternalServiceError(code, msg)
+        :return: 생성된 aiohttp 세션
+        :rtype: aiohttp.ClientSession
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self._concurrency.maximum,
+            keepalive_timeout=self._keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self._ttl_dns_cache,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    def _url(self, svc: Services) -> str:
+        """
+        서비스의 url을 반환합니다.
 
-        # 응답 서비스 데이터 반환
-        header, body = payload[svc.value]
-        return header["head"][0]["list_total_count"], body["row"]
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :return: 서비스의 url
+        :rtype: str
+        """
+        return urljoin(self._base_url, svc.value)
 
     async def close(self):
         """
@@ -222,6 +912,8 @@ class AsyncSession:
         """
         if self._session and not self._closed:
             await self._session.close()
+        if self._keys is not None and not self._closed:
+            await asyncio.to_thread(self._keys.save)
         self._closed = True
 
     @property
@@ -233,3 +925,13 @@ class AsyncSession:
         :rtype: bool
         """
         return self._closed
+
+    @property
+    def concurrency(self) -> AdaptiveConcurrency:
+        """
+        페이지 요청에 사용되는 동시성 제어기입니다.
+
+        :return: 동시성 제어기
+        :rtype: AdaptiveConcurrency
+        """
+        return self._concurrency
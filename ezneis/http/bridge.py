@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from threading import Lock, Thread
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
+from .asynchronous import AsyncSession
+from .cache import CountHints, ResponseCache
+from .concurrency import AdaptiveConcurrency
+from .keys import KeyPool
+from .service import BASE_URL, Services
+from .synchronous import SyncSession
+from .throttle import CircuitBreaker, HedgePolicy, RetryPolicy, TokenBucket
+from ..exceptions import SessionClosedException
+from ..utils.metrics import REGISTRY, MetricsRegistry
+import asyncio
+
+__all__ = ["BridgeSession"]
+
+T = TypeVar("T")
+
+
+async def _next(iterator: AsyncIterator[T]) -> T:
+    """
+    비동기 이터레이터의 다음 항목을 반환하는 코루틴입니다.
+    """
+    return await iterator.__anext__()
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class BridgeSession(SyncSession):
+    """
+    하나의 백그라운드 이벤트 루프에서 `AsyncSession`을 실행하는 동기식 세션입니다.
+
+    `SyncSession`은 페이지마다 작업자 스레드를 사용하지만, 이 세션은 모든 요청을
+    전용 스레드에서 실행되는 이벤트 루프 하나와 aiohttp 연결 풀로 처리합니다.
+    따라서 동기 코드에서도 비동기 세션과 같은 연결 재사용, 적응형 동시성 제어,
+    페이지 요청 파이프라이닝을 그대로 사용할 수 있습니다.
+
+    `SyncSession`을 상속하므로 `SyncSession`을 받는 모든 곳(가령, 빌더의 `>>` 연산자)에
+    그대로 사용할 수 있습니다.
+
+    **사용례**::
+
+        from ezneis.http import BridgeSession, Services
+
+        with BridgeSession("your_api_key", max_concurrency=32) as sess:
+            data = sess.get(Services.SCHOOL_INFO, limit=10)
+    """
+
+    def __init__(
+        self,
+        key: str | KeyPool,
+        *,
+        max_concurrency: int = 16,
+        adaptive: bool = True,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int | None = 300,
+        rate_limiter: TokenBucket | None = None,
+        retry: RetryPolicy | None = RetryPolicy(),
+        cache: ResponseCache | None = None,
+        base_url: str = BASE_URL,
+        hints: CountHints | None = None,
+        hedge: HedgePolicy | None = None,
+        metrics: MetricsRegistry | None = REGISTRY,
+        breaker: CircuitBreaker | None = None,
+    ):
+        """
+        BridgeSession 인스턴스를 초기화합니다.
+
+        매개변수는 모두 내부의 `AsyncSession`에 그대로 전달되며, 이벤트 루프
+        스레드는 첫번째 요청 시 시작되어 세션이 닫힐 때까지 유지됩니다.
+
+        :param key: 나이스 교육정보 OPEN API 인증 키 또는 여러 키에 요청을 분산할 키 풀
+        :type key: str 또는 KeyPool
+        :param max_concurrency: 동시에 실행할 수 있는 최대 페이지 요청 수 및 소켓 수
+        :type max_concurrency: int
+        :param adaptive: 동시 실행 수를 AIMD 방식으로 자동 조정할지 여부
+        :type adaptive: bool
+        :param keepalive_timeout: 유휴 keep-alive 연결을 유지할 시간(초)
+        :type keepalive_timeout: float
+        :param ttl_dns_cache: DNS 조회 결과를 캐싱할 시간(초), None인 경우 무기한
+        :type ttl_dns_cache: int 또는 None
+        :param rate_limiter: 페이지 요청에 적용할 토큰 버킷 (여러 세션이 공유 가능)
+        :type rate_limiter: TokenBucket 또는 None
+        :param retry: 일시적인 오류에 대한 재시도 정책 (None인 경우 재시도하지 않음)
+        :type retry: RetryPolicy 또는 None
+        :param cache: 페이지 응답을 저장할 캐시 (None인 경우 캐싱하지 않음)
+        :type cache: ResponseCache 또는 None
+        :param base_url: 나이스 교육정보 OPEN API의 기본 url (테스트용 서버 등)
+        :type base_url: str
+        :param hints: 질의별 총 레코드 개수 힌트 (None인 경우 세션마다 새로 생성,
+            여러 세션이 공유 가능)
+        :type hints: CountHints 또는 None
+        :param hedge: 응답이 늦는 페이지에 중복 요청을 보낼 정책 (None인 경우 사용하지
+            않음, 여러 세션이 공유 가능)
+        :type hedge: HedgePolicy 또는 None
+        :param metrics: 요청 수, 응답 시간 등의 지표를 기록할 저장소 (None인 경우
+            기록하지 않음, 기본값은 전역 저장소)
+        :type metrics: MetricsRegistry 또는 None
+        :param breaker: 오류가 잦은 서비스에 대한 요청을 차단할 회로 차단기 (None인 경우
+            사용하지 않음, 여러 세션이 공유 가능)
+        :type breaker: CircuitBreaker 또는 None
+        """
+        super().__init__(
+            key,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            cache=cache,
+            base_url=base_url,
+            hints=hints,
+            metrics=None,
+        )
+        self._engine = AsyncSession(
+            key,
+            max_concurrency=max_concurrency,
+            adaptive=adaptive,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=ttl_dns_cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            cache=cache,
+            base_url=base_url,
+            hints=self._hints,
+            hedge=hedge,
+            metrics=metrics,
+            breaker=breaker,
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: Thread | None = None
+        self._lock = Lock()
+
+    def get(
+        self,
+        svc: Services,
+        *,
+        limit: int | None = None,
+        parse: Callable[[dict], T] | None = None,
+        timeout: float | None = None,
+        refresh: bool = False,
+        **kwargs,
+    ) -> list[dict] | tuple[T, ...]:
+        """
+        나이스 교육정보 OPEN API에서 데이터를 조회합니다.
+
+        :meth:`AsyncSession.get`을 백그라운드 이벤트 루프에서 실행하고 결과를
+        기다립니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
+        :type limit: int 또는 None
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param timeout: 모든 페이지를 받기까지의 제한 시간(초) (None인 경우 제한하지 않음)
+        :type timeout: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청하여 캐시를 갱신
+        :type refresh: bool
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 조회된 데이터 레코드 목록 또는 모델 튜플
+        :rtype: list[dict] 또는 tuple[T, ...]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises DeadlineExceededError: 제한 시간 안에 조회를 마치지 못한 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+        """
+        return self._run(
+            self._engine.get(
+                svc,
+                limit=limit,
+                parse=parse,
+                timeout=timeout,
+                refresh=refresh,
+                **kwargs,
+            )
+        )
+
+    def count(self, svc: Services, **kwargs) -> int:
+        """
+        조회 조건에 해당하는 총 레코드 개수를 반환합니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 총 레코드 개수 (데이터가 없는 경우 0)
+        :rtype: int
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+        """
+        return self._run(self._engine.count(svc, **kwargs))
+
+    def get_many(
+        self,
+        queries: (
+            Mapping[Hashable, tuple[Services, Mapping[str, Any]]]
+            | Sequence[tuple[Services, Mapping[str, Any]]]
+        ),
+        *,
+        return_exceptions: bool = False,
+    ) -> dict[Hashable, list[dict] | Exception]:
+        """
+        나이스 교육정보 OPEN API에 여러 질의를 한 번에 요청합니다.
+
+        :param queries: (서비스, 매개변수) 튜플의 시퀀스 또는 이를 값으로 하는 매핑
+        :type queries: Mapping 또는 Sequence
+        :param return_exceptions: True인 경우 실패한 질의의 예외를 결과로 반환하고,
+            False인 경우 첫번째 예외를 재전파하고 남은 요청을 취소합니다.
+        :type return_exceptions: bool
+        :return: 질의의 키(시퀀스인 경우 인덱스)별 데이터 레코드 목록
+        :rtype: dict[Hashable, list[dict] | Exception]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+        """
+        return self._run(
+            self._engine.get_many(queries, return_exceptions=return_exceptions)
+        )
+
+    def iter_pages(
+        self,
+        svc: Services,
+        *,
+        limit: int | None = None,
+        prefetch: int = 1,
+        parse: Callable[[dict], T] | None = None,
+        **kwargs,
+    ) -> Iterator[list[dict] | tuple[T, ...]]:
+        """
+        나이스 교육정보 OPEN API에서 데이터를 페이지 단위로 순차 조회합니다.
+
+        백그라운드 이벤트 루프의 비동기 이터레이터에서 페이지를 하나씩 꺼내 반환하며,
+        순회가 중단되면 남은 페이지 요청을 취소합니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
+        :type limit: int 또는 None
+        :param prefetch: 미리 요청해 둘 페이지 수 (최소 1)
+        :type prefetch: int
+        :param parse: 레코드를 모델로 변환할 함수 (주어진 경우 페이지마다 도착하는 즉시
+            모델 튜플로 변환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 페이지별 데이터 레코드 목록 또는 모델 튜플의 이터레이터
+        :rtype: Iterator[list[dict] | tuple[T, ...]]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+        """
+        pages = self._engine.iter_pages(
+            svc, limit=limit, prefetch=prefetch, parse=parse, **kwargs
+        )
+        try:
+            while True:
+                try:
+                    rows = self._run(_next(pages))
+                except StopAsyncIteration:
+                    return
+                yield rows
+        finally:
+            if not self._closed:
+                self._run(pages.aclose())
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        코루틴을 백그라운드 이벤트 루프에서 실행하고 결과를 기다립니다.
+
+        호출한 스레드가 기다리는 도중 중단(가령, KeyboardInterrupt)되면 실행 중인
+        코루틴도 취소합니다.
+
+        :param coro: 실행할 코루틴
+        :type coro: Coroutine[Any, Any, T]
+        :return: 코루틴의 결과
+        :rtype: T
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+        """
+        if self._closed:
+            coro.close()
+            raise SessionClosedException
+        self._prepare()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _prepare(self):
+        """
+        이벤트 루프 스레드를 준비합니다.
+
+        이미 준비된 경우 기존 이벤트 루프를 그대로 재사용합니다.
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = Thread(
+                    target=self._loop.run_forever, name="ezneis-loop", daemon=True
+                )
+                self._thread.start()
+
+    def close(self):
+        """
+        세션을 닫고 관련 리소스를 해제합니다.
+
+        내부의 `AsyncSession`을 닫은 뒤 이벤트 루프 스레드를 종료합니다. 키 풀을
+        사용하는 경우 요청을 한 번도 하지 않았더라도 키 사용량을 저장합니다.
+        세션이 이미 닫혀 있는 경우에도 안전하게 호출할 수 있습니다.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        try:
+            if loop is not None:
+                asyncio.run_coroutine_threadsafe(self._engine.close(), loop).result()
+        finally:
+            if loop is not None:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+            # 이벤트 루프가 시작되지 않았거나 내부 세션을 닫지 못한 경우에도
+            # 키 사용량은 저장
+            if self._keys is not None and not self._engine.closed:
+                self._keys.save()
+
+    @property
+    def concurrency(self) -> AdaptiveConcurrency:
+        """
+        페이지 요청에 사용되는 동시성 제어기입니다.
+
+        :return: 동시성 제어기
+        :rtype: AdaptiveConcurrency
+        """
+        return self._engine.concurrency
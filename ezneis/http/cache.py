@@ -0,0 +1,562 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from hashlib import sha256
+from itertools import islice
+from pathlib import Path
+from threading import Lock, get_ident
+from time import time
+from typing import Mapping
+from urllib.parse import urlencode
+from .expiry import ExpiryPolicy
+from .service import TIME_TO_LIVE, Services
+import asyncio
+import os
+import sqlite3
+import struct
+
+__all__ = [
+    "CountHints",
+    "ResponseCache",
+    "MemoryResponseCache",
+    "SQLiteResponseCache",
+    "FileResponseCache",
+]
+
+# 캐시 키에서 제외할 매개변수 (응답 내용에 영향을 주지 않음)
+_IGNORED_PARAMS = frozenset(("KEY", "Type"))
+
+# 용량 초과 시 삭제할 응답을 고를 때 살펴볼 가장 오래 사용하지 않은 응답 수
+_EVICTION_SAMPLE = 5
+
+# 만료된 응답을 회로가 열린 경우에 대신 사용하기 위해 보관할 기간의 기본값(초)
+_STALE_TTL = 86400.0
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class CountHints:
+    """
+    질의별 전체 레코드 수(`list_total_count`)를 기억하는 LRU 저장소입니다.
+
+    `limit`이 없는 조회는 페이지 수를 알기 위해 첫번째 페이지를 먼저 요청해야 하지만,
+    같은 질의의 전체 레코드 수를 이미 알고 있다면 첫번째 묶음의 페이지를 곧바로
+    병렬로 요청할 수 있습니다. 힌트가 실제와 다르더라도 세션이 응답에 포함된 전체
+    레코드 수로 남은 페이지를 보정하므로 조회 결과는 달라지지 않습니다.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        CountHints 인스턴스를 초기화합니다.
+
+        :param maxsize: 기억할 최대 질의 수
+        :type maxsize: int
+        """
+        self._maxsize = maxsize
+        self._totals: OrderedDict[str, int] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, svc: Services, params: Mapping) -> int | None:
+        """
+        질의의 전체 레코드 수 힌트를 반환합니다.
+
+        :param svc: 요청할 서비스
+        :type svc: Services
+        :param params: 서비스별 매개변수
+        :type params: Mapping
+        :return: 전체 레코드 수, 힌트가 없는 경우 None
+        :rtype: int 또는 None
+        """
+        key = ResponseCache.make_key(svc, params)
+        with self._lock:
+            total = self._totals.get(key)
+            if total is not None:
+                self._totals.move_to_end(key)
+            return total
+
+    def set(self, svc: Services, params: Mapping, total: int):
+        """
+        질의의 전체 레코드 수 힌트를 저장합니다.
+
+        :param svc: 요청한 서비스
+        :type svc: Services
+        :param params: 서비스별 매개변수
+        :type params: Mapping
+        :param total: 응답에 포함된 전체 레코드 수
+        :type total: int
+        """
+        key = ResponseCache.make_key(svc, params)
+        with self._lock:
+            self._totals[key] = total
+            self._totals.move_to_end(key)
+            while len(self._totals) > self._maxsize:
+                self._totals.popitem(last=False)
+
+    def discard(self, svc: Services, params: Mapping):
+        """
+        질의의 전체 레코드 수 힌트를 삭제합니다.
+
+        :param svc: 요청한 서비스
+        :type svc: Services
+        :param params: 서비스별 매개변수
+        :type params: Mapping
+        """
+        key = ResponseCache.make_key(svc, params)
+        with self._lock:
+            self._totals.pop(key, None)
+
+    def clear(self):
+        """
+        저장된 모든 힌트를 삭제합니다.
+        """
+        with self._lock:
+            self._totals.clear()
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class ResponseCache(metaclass=ABCMeta):
+    """
+    나이스 교육정보 OPEN API의 페이지 응답을 저장하는 캐시의 기본 클래스입니다.
+
+    캐시 키는 서비스와 정규화된 query(인증 키를 제외하고 정렬한 매개변수)로
+    구성되며, 값으로는 서비스 데이터가 포함된 응답 본문(bytes)을 그대로 저장합니다.
+    기본적으로 `ExpiryPolicy`에 따라 지난 일자의 응답은 무기한, 오늘과 이후 일자의
+    응답은 다음 날 0시(KST) 전까지 유효하며, 고정된 유효 기간을 서비스별로 지정할
+    수도 있습니다.
+
+    만료된 응답은 바로 삭제되지 않고 `stale_ttl`초 동안 더 보관되어, 서비스 장애로
+    회로가 열린 경우 요청 대신 반환됩니다. 보관 기간이 지난 응답은 다음에 읽을 때
+    삭제됩니다.
+
+    `blocking`이 True인 캐시(디스크를 사용하는 캐시)는 `load_async`와
+    `store_async`에서 작업자 스레드로 옮겨 실행되므로, 비동기 세션의 이벤트 루프를
+    막지 않습니다.
+
+    **사용례**::
+
+        cache = SQLiteResponseCache(
+            "neis.sqlite3",
+            ttl={Services.SCHOOL_INFO: 7 * 86400, Services.MEALS: 3600},
+        )
+        with SyncSession("your_api_key", cache=cache) as sess:
+            ...
+    """
+
+    blocking: bool = True
+    """캐시 작업이 입출력으로 인해 스레드를 막는지 여부"""
+
+    def __init__(
+        self,
+        ttl: int | Mapping[Services, int] | ExpiryPolicy | None = None,
+        *,
+        stale_ttl: float = _STALE_TTL,
+    ):
+        """
+        ResponseCache 인스턴스를 초기화합니다.
+
+        :param ttl: 캐시의 유효 기간(초), 서비스별 유효 기간 매핑 또는 만료 정책.
+            매핑에 없는 서비스에는 `TIME_TO_LIVE`가 적용됩니다. (None인 경우 기본
+            설정의 `ExpiryPolicy`)
+        :type ttl: int 또는 Mapping[Services, int] 또는 ExpiryPolicy 또는 None
+        :param stale_ttl: 만료된 응답을 삭제하지 않고 보관할 기간(초)
+        :type stale_ttl: float
+        """
+        self._ttl = ExpiryPolicy() if ttl is None else ttl
+        self._stale_ttl = stale_ttl
+
+    @staticmethod
+    def make_key(svc: Services, query: Mapping) -> str:
+        """
+        서비스와 query로부터 캐시 키를 생성합니다.
+
+        :param svc: 요청할 서비스
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: Mapping
+        :return: 캐시 키
+        :rtype: str
+        """
+        params = sorted(
+            (k, str(v)) for k, v in query.items() if k not in _IGNORED_PARAMS
+        )
+        return f"{svc.value}?{urlencode(params)}"
+
+    def ttl_for(self, svc: Services) -> int:
+        """
+        서비스에 적용할 캐시 유효 기간을 반환합니다. 만료 정책을 사용하는 경우 일자별
+        데이터가 아닌 서비스에 적용할 유효 기간입니다.
+
+        :param svc: 요청할 서비스
+        :type svc: Services
+        :return: 캐시 유효 기간(초)
+        :rtype: int
+        """
+        if isinstance(self._ttl, ExpiryPolicy):
+            return self._ttl.ttl_for(svc)
+        if isinstance(self._ttl, Mapping):
+            return self._ttl.get(svc, TIME_TO_LIVE)
+        return self._ttl
+
+    def load(
+        self, svc: Services, query: Mapping, *, stale: bool = False
+    ) -> bytes | None:
+        """
+        캐시된 응답 본문을 불러옵니다.
+
+        :param svc: 요청할 서비스
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: Mapping
+        :param stale: True인 경우 보관 기간 안의 만료된 응답도 반환
+            (가령, 서비스 장애로 회로가 열린 경우)
+        :type stale: bool
+        :return: 캐시된 응답 본문, 없거나 만료된 경우 None
+        :rtype: bytes 또는 None
+        """
+        now = time()
+        entry = self._get(self.make_key(svc, query), now)
+        if entry is None or not (stale or entry[1] > now):
+            return None
+        return entry[0]
+
+    def store(self, svc: Services, query: Mapping, content: bytes):
+        """
+        응답 본문을 캐시에 저장합니다.
+
+        :param svc: 요청한 서비스
+        :type svc: Services
+        :param query: 요청한 서비스에 전달한 query
+        :type query: Mapping
+        :param content: 응답 본문
+        :type content: bytes
+        """
+        now = time()
+        if isinstance(self._ttl, ExpiryPolicy):
+            expires = self._ttl.expires(svc, query, now)
+        else:
+            expires = now + self.ttl_for(svc)
+        if expires <= now:
+            return
+        self._set(self.make_key(svc, query), content, expires)
+
+    async def load_async(
+        self, svc: Services, query: Mapping, *, stale: bool = False
+    ) -> bytes | None:
+        """
+        이벤트 루프를 막지 않고 캐시된 응답 본문을 불러옵니다.
+
+        :param svc: 요청할 서비스
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: Mapping
+        :param stale: True인 경우 보관 기간 안의 만료된 응답도 반환
+        :type stale: bool
+        :return: 캐시된 응답 본문, 없거나 만료된 경우 None
+        :rtype: bytes 또는 None
+        """
+        if not self.blocking:
+            return self.load(svc, query, stale=stale)
+        return await asyncio.to_thread(self.load, svc, query, stale=stale)
+
+    async def store_async(self, svc: Services, query: Mapping, content: bytes):
+        """
+        이벤트 루프를 막지 않고 응답 본문을 캐시에 저장합니다.
+
+        :param svc: 요청한 서비스
+        :type svc: Services
+        :param query: 요청한 서비스에 전달한 query
+        :type query: Mapping
+        :param content: 응답 본문
+        :type content: bytes
+        """
+        if self.blocking:
+            await asyncio.to_thread(self.store, svc, query, content)
+        else:
+            self.store(svc, query, content)
+
+    @abstractmethod
+    def _get(self, key: str, now: float) -> tuple[bytes, float] | None:
+        """
+        캐시 키에 해당하는 값과 만료 시각을 반환합니다.
+
+        만료된 값도 반환하며, 만료 후 `stale_ttl`초가 지난 값은 삭제하고 None을
+        반환합니다.
+
+        :param key: 캐시 키
+        :type key: str
+        :param now: 현재 시각 (UNIX 시간)
+        :type now: float
+        :return: (저장된 값, 만료 시각) 튜플, 없거나 보관 기간이 지난 경우 None
+        :rtype: tuple[bytes, float] 또는 None
+        """
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, value: bytes, expires: float):
+        """
+        캐시 키에 값을 저장합니다.
+
+        :param key: 캐시 키
+        :type key: str
+        :param value: 저장할 값
+        :type value: bytes
+        :param expires: 만료 시각 (UNIX 시간)
+        :type expires: float
+        """
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """
+        캐시에 저장된 모든 값을 삭제합니다.
+        """
+        pass
+
+    def close(self):
+        """
+        캐시가 사용하는 자원을 해제합니다.
+        """
+        pass
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class MemoryResponseCache(ResponseCache):
+    """
+    프로세스 메모리에 응답을 저장하는 LRU 캐시입니다.
+
+    응답 하나의 크기는 레코드 몇 개부터 수천 개까지 크게 다르므로, `maxbytes`로
+    저장된 응답 본문과 키의 길이 합계를 제한할 수 있습니다. 합계가 넘치면 가장 오래
+    사용하지 않은 몇 개의 응답 중 가장 큰 응답부터 삭제하며, `maxbytes`보다 큰
+    응답은 저장하지 않습니다.
+
+    **사용례**::
+
+        # 응답 수와 관계없이 약 64MiB까지만 저장
+        cache = MemoryResponseCache(maxsize=100_000, maxbytes=64 * 1024 * 1024)
+    """
+
+    blocking = False
+
+    def __init__(
+        self,
+        ttl: int | Mapping[Services, int] | ExpiryPolicy | None = None,
+        maxsize: int = 1024,
+        maxbytes: int | None = None,
+        *,
+        stale_ttl: float = _STALE_TTL,
+    ):
+        """
+        MemoryResponseCache 인스턴스를 초기화합니다.
+
+        :param ttl: 캐시의 유효 기간(초), 서비스별 유효 기간 매핑 또는 만료 정책
+            (None인 경우 기본 설정의 `ExpiryPolicy`)
+        :type ttl: int 또는 Mapping[Services, int] 또는 ExpiryPolicy 또는 None
+        :param maxsize: 저장할 최대 응답 수
+        :type maxsize: int
+        :param maxbytes: 저장할 응답 크기의 최대 합계(바이트) (None인 경우 제한하지 않음)
+        :type maxbytes: int 또는 None
+        :param stale_ttl: 만료된 응답을 삭제하지 않고 보관할 기간(초)
+        :type stale_ttl: float
+        """
+        super().__init__(ttl, stale_ttl=stale_ttl)
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._nbytes = 0
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        저장된 응답 본문과 키의 길이 합계(바이트)를 반환합니다.
+
+        :return: 저장된 응답의 크기 합계
+        :rtype: int
+        """
+        return self._nbytes
+
+    def _get(self, key: str, now: float) -> tuple[bytes, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] + self._stale_ttl <= now:
+                self._discard(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, value: bytes, expires: float):
+        with self._lock:
+            self._discard(key)
+            # 크기 제한보다 큰 응답은 저장하지 않음
+            if self._maxbytes is not None and len(key) + len(value) > self._maxbytes:
+                return
+            self._entries[key] = (value, expires)
+            self._nbytes += len(key) + len(value)
+            # 캐시가 가득찬 경우, 가장 오래 사용하지 않은 응답 삭제
+            while len(self._entries) > self._maxsize:
+                self._discard(next(iter(self._entries)))
+            # 크기 합계가 넘치는 경우, 오래 사용하지 않은 응답 중 큰 응답부터 삭제
+            # (방금 저장한 응답은 제외하며, 그 크기는 제한 이하이므로 후보는 항상 있음)
+            while self._maxbytes is not None and self._nbytes > self._maxbytes:
+                others = (item for item in self._entries.items() if item[0] != key)
+                candidates = islice(others, _EVICTION_SAMPLE)
+                self._discard(max(candidates, key=lambda item: len(item[1][0]))[0])
+
+    def _discard(self, key: str):
+        """
+        응답을 삭제하고 크기 합계를 갱신합니다. 잠금을 획득한 상태에서 호출해야 합니다.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= len(key) + len(entry[0])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class SQLiteResponseCache(ResponseCache):
+    """
+    SQLite 데이터베이스에 응답을 저장하는 영구 캐시입니다.
+
+    프로세스가 재시작되어도 캐시가 유지되며, 여러 스레드에서 안전하게 사용할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: int | Mapping[Services, int] | ExpiryPolicy | None = None,
+        *,
+        stale_ttl: float = _STALE_TTL,
+    ):
+        """
+        SQLiteResponseCache 인스턴스를 초기화합니다.
+
+        :param path: SQLite 데이터베이스 파일 경로
+        :type path: str 또는 os.PathLike
+        :param ttl: 캐시의 유효 기간(초), 서비스별 유효 기간 매핑 또는 만료 정책
+            (None인 경우 기본 설정의 `ExpiryPolicy`)
+        :type ttl: int 또는 Mapping[Services, int] 또는 ExpiryPolicy 또는 None
+        :param stale_ttl: 만료된 응답을 삭제하지 않고 보관할 기간(초)
+        :type stale_ttl: float
+        """
+        super().__init__(ttl, stale_ttl=stale_ttl)
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def _get(self, key: str, now: float) -> tuple[bytes, float] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] + self._stale_ttl <= now:
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            return row
+
+    def _set(self, key: str, value: bytes, expires: float):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                (key, value, expires),
+            )
+
+    def purge(self):
+        """
+        보관 기간이 지난 응답을 모두 삭제합니다.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE expires <= ?", (time() - self._stale_ttl,)
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class FileResponseCache(ResponseCache):
+    """
+    디렉터리에 응답을 파일로 저장하는 영구 캐시입니다.
+
+    각 응답은 캐시 키의 SHA-256 해시를 이름으로 하는 파일에 만료 시각과 함께
+    저장되며, 임시 파일을 교체하는 방식으로 기록되어 동시에 읽더라도 손상되지 않습니다.
+    """
+
+    _HEADER = struct.Struct(">d")
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: int | Mapping[Services, int] | ExpiryPolicy | None = None,
+        *,
+        stale_ttl: float = _STALE_TTL,
+    ):
+        """
+        FileResponseCache 인스턴스를 초기화합니다.
+
+        :param path: 응답을 저장할 디렉터리 경로
+        :type path: str 또는 os.PathLike
+        :param ttl: 캐시의 유효 기간(초), 서비스별 유효 기간 매핑 또는 만료 정책
+            (None인 경우 기본 설정의 `ExpiryPolicy`)
+        :type ttl: int 또는 Mapping[Services, int] 또는 ExpiryPolicy 또는 None
+        :param stale_ttl: 만료된 응답을 삭제하지 않고 보관할 기간(초)
+        :type stale_ttl: float
+        """
+        super().__init__(ttl, stale_ttl=stale_ttl)
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self._path / f"{sha256(key.encode()).hexdigest()}.bin"
+
+    def _get(self, key: str, now: float) -> tuple[bytes, float] | None:
+        file = self._file(key)
+        try:
+            data = file.read_bytes()
+        except FileNotFoundError:
+            return None
+        (expires,) = self._HEADER.unpack_from(data)
+        if expires + self._stale_ttl <= now:
+            file.unlink(missing_ok=True)
+            return None
+        return data[self._HEADER.size :], expires
+
+    def _set(self, key: str, value: bytes, expires: float):
+        file = self._file(key)
+        temp = file.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        temp.write_bytes(self._HEADER.pack(expires) + value)
+        os.replace(temp, file)
+
+    def clear(self):
+        for file in self._path.glob("*.bin"):
+            file.unlink(missing_ok=True)
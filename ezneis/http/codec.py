@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from typing import Callable, TypeVar
+from .service import Services
+from ..exceptions import (
+    DataNotFoundException,
+    InternalServiceCode,
+    InternalServiceError,
+)
+import orjson
+
+__all__ = ["decode"]
+
+T = TypeVar("T")
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+def decode(
+    svc: Services,
+    content: bytes,
+    url: str,
+    query: dict,
+    parse: Callable[[dict], T] | None = None,
+) -> tuple[int, list[dict] | tuple[T, ...]]:
+    """
+    나이스 교육정보 OPEN API의 응답 본문을 해석합니다.
+
+    `parse`가 주어진 경우 레코드 목록을 반환하지 않고, 응답 본문에서 꺼낸 레코드를
+    곧바로 모델로 변환하여 모델 튜플을 반환합니다.
+
+    :param svc: 요청한 서비스
+    :type svc: Services
+    :param content: 응답 본문
+    :type content: bytes
+    :param url: 요청한 서비스의 url
+    :type url: str
+    :param query: 요청한 서비스에 전달한 query
+    :type query: dict
+    :param parse: 레코드를 모델로 변환할 함수 (가령, `SchoolInfo.from_dict`),
+        None인 경우 레코드를 그대로 반환
+    :type parse: Callable[[dict], T] 또는 None
+    :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+    :rtype: tuple[int, list[dict] | tuple[T, ...]]
+    :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+    :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+    """
+    payload = orjson.loads(content)
+
+    # 서비스 데이터가 누락된 경우 예외 처리
+    if svc.value not in payload:
+        code = payload["RESULT"]["CODE"]
+        if code == InternalServiceCode.NOT_FOUND.value:
+            raise DataNotFoundException(url, query)
+        msg = payload["RESULT"]["MESSAGE"]
+        raise InternalServiceError(code, msg)
+
+    # 응답 서비스 데이터 반환
+    header, body = payload[svc.value]
+    total = header["head"][0]["list_total_count"]
+    if parse is None:
+        return total, body["row"]
+    return total, tuple(map(parse, body["row"]))
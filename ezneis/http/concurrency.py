@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from time import monotonic
+import asyncio
+
+__all__ = ["AdaptiveConcurrency"]
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class AdaptiveConcurrency:
+    """
+    비동기 요청의 동시 실행 수를 제한하는 AIMD 방식의 동시성 제어기입니다.
+
+    지연 시간이 기준 지연 시간과 비슷하게 유지되는 동안에는 동시 실행 창을
+    조금씩(가산적으로) 넓히고, 서버가 혼잡 신호(트래픽 제한, 5xx 응답 등)를
+    보내면 창을 곱셈적으로 줄입니다. `adaptive`가 False인 경우 창의 크기는
+    `maximum`으로 고정됩니다.
+
+    **사용례**::
+
+        limiter = AdaptiveConcurrency(maximum=32)
+
+        async with limiter:
+            start = time.monotonic()
+            ...  # 요청 수행
+            limiter.on_success(time.monotonic() - start)
+    """
+
+    def __init__(
+        self,
+        maximum: int = 16,
+        minimum: int = 1,
+        *,
+        initial: int | None = None,
+        adaptive: bool = True,
+        tolerance: float = 1.5,
+        decrease: float = 0.5,
+    ):
+        """
+        AdaptiveConcurrency 인스턴스를 초기화합니다.
+
+        :param maximum: 동시 실행 창의 최대 크기
+        :type maximum: int
+        :param minimum: 동시 실행 창의 최소 크기
+        :type minimum: int
+        :param initial: 동시 실행 창의 초기 크기 (None인 경우 자동 결정)
+        :type initial: int 또는 None
+        :param adaptive: 지연 시간과 혼잡 신호에 따라 창의 크기를 조정할지 여부
+        :type adaptive: bool
+        :param tolerance: 기준 지연 시간 대비 "평탄"하다고 판단할 최대 배율
+        :type tolerance: float
+        :param decrease: 혼잡 신호를 받았을 때 창에 곱할 감소 비율
+        :type decrease: float
+        """
+        if minimum < 1 or maximum < minimum:
+            raise ValueError("0 < minimum <= maximum 조건을 만족해야 합니다.")
+        self._max = maximum
+        self._min = minimum
+        self._adaptive = adaptive
+        self._tolerance = tolerance
+        self._decrease = decrease
+        if initial is None:
+            initial = min(maximum, max(minimum, 4)) if adaptive else maximum
+        self._window = float(min(maximum, max(minimum, initial)))
+        self._inflight = 0
+        self._baseline: float | None = None
+        self._last_decrease = 0.0
+        self._condition: asyncio.Condition | None = None
+
+    async def __aenter__(self) -> AdaptiveConcurrency:
+        """
+        동시 실행 슬롯을 획득합니다. 창이 가득 찬 경우 슬롯이 반환될 때까지 대기합니다.
+
+        :return: 현재 제어기 인스턴스
+        :rtype: AdaptiveConcurrency
+        """
+        # Condition은 처음 사용하는 이벤트 루프에 묶이므로 지연 생성
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._inflight < self.limit)
+            self._inflight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        동시 실행 슬롯을 반환하고 대기 중인 요청을 깨웁니다.
+
+        :param exc_type: 예외 타입
+        :param exc_val: 예외 값
+        :param exc_tb: 예외 트레이스백
+        """
+        async with self._condition:
+            self._inflight -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float):
+        """
+        요청 성공과 그 지연 시간을 기록합니다.
+
+        지연 시간이 기준 지연 시간의 `tolerance`배 이내인 경우, 창을 한 번의
+        왕복(창 전체가 완료되는 시간)마다 약 1만큼 넓힙니다.
+
+        :param latency: 요청의 지연 시간(초)
+        :type latency: float
+        """
+        # 기준 지연 시간은 빠르게 낮아지고, 느리게 높아지도록 갱신
+        if self._baseline is None:
+            self._baseline = latency
+        else:
+            ewma = self._baseline + (latency - self._baseline) * 0.05
+            self._baseline = min(latency, ewma)
+        if not self._adaptive:
+            return
+        if latency <= self._baseline * self._tolerance:
+            self._window = min(float(self._max), self._window + 1 / self._window)
+
+    def on_congestion(self):
+        """
+        서버의 혼잡 신호(트래픽 제한, 5xx 응답 등)를 기록합니다.
+
+        창을 `decrease` 비율만큼 줄입니다. 동시에 실패한 요청들로 인해 창이
+        연속으로 줄어들지 않도록, 기준 지연 시간 안에는 한 번만 줄입니다.
+        """
+        if not self._adaptive:
+            return
+        now = monotonic()
+        if now - self._last_decrease < (self._baseline or 0.0):
+            return
+        self._last_decrease = now
+        self._window = max(float(self._min), self._window * self._decrease)
+
+    @property
+    def limit(self) -> int:
+        """
+        현재 동시 실행 창의 크기입니다.
+
+        :return: 동시에 실행할 수 있는 최대 요청 수
+        :rtype: int
+        """
+        return int(self._window)
+
+    @property
+    def maximum(self) -> int:
+        """
+        동시 실행 창의 최대 크기입니다.
+
+        :return: 동시 실행 창의 최대 크기
+        :rtype: int
+        """
+        return self._max
+
+    @property
+    def inflight(self) -> int:
+        """
+        현재 실행 중인 요청 수입니다.
+
+        :return: 실행 중인 요청 수
+        :rtype: int
+        """
+        return self._inflight
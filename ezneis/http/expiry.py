@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Mapping
+from .service import DATE_FIELDS, KST, TIME_TO_LIVE, Services, date_range
+
+__all__ = ["ExpiryPolicy"]
+
+_INFINITY = float("inf")
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class ExpiryPolicy:
+    """
+    서비스와 query가 조회하는 일자 범위에 따라 캐시의 만료 시각을 정하는 정책입니다.
+
+    일자별 데이터를 제공하는 서비스(`DATE_FIELDS`)의 응답은 조회 범위와 오늘(KST)을
+    비교하여 다음과 같이 만료됩니다.
+
+    - 지난 일자만 조회한 응답: 더 이상 변경되지 않으므로 `past`초 동안 (기본값은 무기한)
+    - 오늘을 포함하는 응답: 다음 날 0시(KST) 또는 `today`초 뒤 중 이른 시각
+    - 이후 일자만 조회한 응답: 다음 날 0시(KST) 또는 `future`초 뒤 중 이른 시각
+
+    오늘과 이후 일자의 응답은 날짜가 바뀌면 구간이 달라지므로 항상 다음 날 0시 전에
+    만료되며, 범위가 열려 있거나 일자를 알 수 없는 query는 오늘을 포함하는 것으로
+    간주합니다. 그 외 서비스(학교 정보, 학과 정보 등)의 응답은 `ttl`초 동안 유효합니다.
+    각 유효 기간은 서비스별 매핑으로도 지정할 수 있습니다.
+
+    **사용례**::
+
+        policy = ExpiryPolicy(
+            ttl={Services.SCHOOL_INFO: 30 * 86400},
+            today={Services.MEALS: 3600},   # 당일 식단은 수정될 수 있으므로 1시간
+            future=6 * 3600,
+        )
+        cache = SQLiteResponseCache("neis.sqlite3", ttl=policy)
+    """
+
+    def __init__(
+        self,
+        ttl: float | Mapping[Services, float] = TIME_TO_LIVE,
+        *,
+        today: float | Mapping[Services, float] | None = None,
+        future: float | Mapping[Services, float] | None = 3600,
+        past: float | Mapping[Services, float] | None = None,
+    ):
+        """
+        ExpiryPolicy 인스턴스를 초기화합니다.
+
+        :param ttl: 일자별 데이터가 아닌 서비스의 유효 기간(초) 또는 서비스별 매핑.
+            매핑에 없는 서비스에는 `TIME_TO_LIVE`가 적용됩니다.
+        :type ttl: float 또는 Mapping[Services, float]
+        :param today: 오늘을 포함하는 응답의 최대 유효 기간(초) 또는 서비스별 매핑
+            (None이거나 매핑에 없는 서비스는 다음 날 0시까지)
+        :type today: float 또는 Mapping[Services, float] 또는 None
+        :param future: 이후 일자만 조회한 응답의 최대 유효 기간(초) 또는 서비스별 매핑
+            (None이거나 매핑에 없는 서비스는 다음 날 0시까지)
+        :type future: float 또는 Mapping[Services, float] 또는 None
+        :param past: 지난 일자만 조회한 응답의 유효 기간(초) 또는 서비스별 매핑
+            (None이거나 매핑에 없는 서비스는 무기한)
+        :type past: float 또는 Mapping[Services, float] 또는 None
+        """
+        self._ttl = ttl
+        self._today = today
+        self._future = future
+        self._past = past
+
+    @staticmethod
+    def _lookup(
+        value: float | Mapping[Services, float] | None,
+        svc: Services,
+        default: float | None,
+    ) -> float | None:
+        """
+        서비스에 적용할 유효 기간을 반환합니다.
+        """
+        if isinstance(value, Mapping):
+            return value.get(svc, default)
+        return value
+
+    def ttl_for(self, svc: Services) -> float:
+        """
+        일자별 데이터가 아닌 서비스에 적용할 유효 기간을 반환합니다.
+
+        :param svc: 요청할 서비스
+        :type svc: Services
+        :return: 유효 기간(초)
+        :rtype: float
+        """
+        return self._lookup(self._ttl, svc, TIME_TO_LIVE)
+
+    def expires(self, svc: Services, query: Mapping, now: float) -> float:
+        """
+        응답의 만료 시각을 반환합니다.
+
+        :param svc: 요청한 서비스
+        :type svc: Services
+        :param query: 요청한 서비스에 전달한 query
+        :type query: Mapping
+        :param now: 응답을 저장하는 시각 (UNIX 시간)
+        :type now: float
+        :return: 만료 시각 (UNIX 시간, 무기한인 경우 `inf`, 저장하지 않아야 하는 경우
+            `now` 이하)
+        :rtype: float
+        """
+        if svc not in DATE_FIELDS:
+            return now + self.ttl_for(svc)
+        current = datetime.fromtimestamp(now, KST)
+        today = current.date()
+        start, end = date_range(svc, query)
+        # 지난 일자만 조회한 응답은 변경되지 않음
+        if end is not None and end < today:
+            ttl = self._lookup(self._past, svc, None)
+            return _INFINITY if ttl is None else now + ttl
+        # 오늘 또는 이후 일자의 응답은 날짜가 바뀌기 전에 만료
+        midnight = datetime.combine(
+            today + timedelta(days=1), datetime.min.time(), KST
+        ).timestamp()
+        if start is not None and start > today:
+            ttl = self._lookup(self._future, svc, None)
+        else:
+            ttl = self._lookup(self._today, svc, None)
+        return midnight if ttl is None else min(midnight, now + ttl)
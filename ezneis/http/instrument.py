@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from time import monotonic
+from .service import Services
+from ..exceptions import (
+    DataNotFoundException,
+    DeadlineExceededError,
+    InternalServiceCode,
+    InternalServiceError,
+    ServiceUnavailableError,
+)
+from ..utils.metrics import MetricsRegistry
+import asyncio
+
+__all__ = ["SessionMetrics"]
+
+
+def _result_code(exc: BaseException | None) -> str:
+    """
+    요청 결과를 `code` 레이블 값으로 변환합니다.
+
+    응답을 받은 경우 내부 서비스 코드(가령, `INFO-000`, `ERROR-337`)를,
+    HTTP 오류인 경우 `HTTP-<상태 코드>`를, 그 외에는 실패 원인을 나타내는 이름을
+    사용합니다.
+    """
+    if exc is None:
+        return InternalServiceCode.OK.value
+    if isinstance(exc, InternalServiceError):
+        return exc.code.value
+    if isinstance(exc, DataNotFoundException):
+        return InternalServiceCode.NOT_FOUND.value
+    if isinstance(exc, ServiceUnavailableError):
+        return "CONNECTION_ERROR" if exc.status is None else f"HTTP-{exc.status}"
+    if isinstance(exc, DeadlineExceededError):
+        return "DEADLINE_EXCEEDED"
+    if isinstance(exc, asyncio.CancelledError):
+        return "CANCELLED"
+    return type(exc).__name__
+
+
+class _Probe:
+    """
+    HTTP 요청 1회의 결과, 응답 시간, 수신 바이트 수를 기록하는 컨텍스트 매니저입니다.
+    """
+
+    __slots__ = ("_metrics", "_service", "_start", "_latency", "_size")
+
+    def __init__(self, metrics: SessionMetrics, svc: Services):
+        self._metrics = metrics
+        self._service = svc.name
+        self._start = 0.0
+        self._latency = None
+        self._size = 0
+
+    def __enter__(self) -> _Probe:
+        self._start = monotonic()
+        return self
+
+    def received(self, content: bytes, latency: float):
+        """
+        응답 본문의 크기와 응답 시간을 기록합니다. 호출하지 않은 경우 응답 시간은
+        블록 전체의 실행 시간으로 측정됩니다.
+
+        :param content: 응답 본문
+        :type content: bytes
+        :param latency: 요청을 보낸 뒤 응답 본문을 받기까지의 시간(초)
+        :type latency: float
+        """
+        self._latency = latency
+        self._size = len(content)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        latency = self._latency
+        if latency is None:
+            latency = monotonic() - self._start
+        metrics = self._metrics
+        metrics.requests.inc(self._service, _result_code(exc_val))
+        metrics.latency.observe(latency, self._service)
+        if self._size:
+            metrics.received.inc(self._service, amount=self._size)
+        return False
+
+
+class _NullProbe:
+    """
+    지표 수집이 비활성화된 경우 사용하는 아무것도 기록하지 않는 컨텍스트 매니저입니다.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullProbe:
+        return self
+
+    def received(self, content: bytes, latency: float):
+        pass
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_PROBE = _NullProbe()
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class SessionMetrics:
+    """
+    세션의 트래픽 지표를 지표 저장소에 기록합니다.
+
+    모든 지표는 `service` 레이블(Services 열거형 멤버의 이름)을 가지며, 여러 세션이
+    같은 저장소를 사용하면 값이 합산됩니다. 기록되는 지표는 다음과 같습니다.
+
+    - `ezneis_requests_total{service, code}`: 결과 코드별 HTTP 요청 수
+    - `ezneis_request_duration_seconds{service}`: HTTP 요청의 응답 시간
+    - `ezneis_received_bytes_total{service}`: 수신한 응답 본문의 바이트 수
+    - `ezneis_pages_total{service, source}`: 네트워크, 캐시 또는 만료된 캐시(회로가
+      열린 경우)에서 가져온 페이지 수
+    - `ezneis_retries_total{service}`: 재시도 횟수
+    - `ezneis_hedged_requests_total{service}`: 응답이 늦어 보낸 중복 요청 수
+    """
+
+    def __init__(self, registry: MetricsRegistry | None):
+        """
+        SessionMetrics 인스턴스를 초기화합니다.
+
+        :param registry: 지표를 기록할 저장소 (None인 경우 기록하지 않음)
+        :type registry: MetricsRegistry 또는 None
+        """
+        self._enabled = registry is not None
+        if registry is None:
+            return
+        self.requests = registry.counter(
+            "ezneis_requests_total",
+            "나이스 교육정보 OPEN API에 보낸 HTTP 요청 수 (결과 코드별)",
+            ("service", "code"),
+        )
+        self.latency = registry.histogram(
+            "ezneis_request_duration_seconds",
+            "나이스 교육정보 OPEN API 요청의 응답 시간(초)",
+            ("service",),
+        )
+        self.received = registry.counter(
+            "ezneis_received_bytes_total",
+            "나이스 교육정보 OPEN API로부터 수신한 응답 본문의 바이트 수",
+            ("service",),
+        )
+        self.pages = registry.counter(
+            "ezneis_pages_total",
+            "가져온 페이지 수 (network, cache 또는 stale)",
+            ("service", "source"),
+        )
+        self.retries = registry.counter(
+            "ezneis_retries_total",
+            "일시적인 오류로 다시 보낸 요청 수",
+            ("service",),
+        )
+        self.hedges = registry.counter(
+            "ezneis_hedged_requests_total",
+            "응답이 늦은 페이지에 보낸 중복 요청 수",
+            ("service",),
+        )
+
+    def request(self, svc: Services) -> _Probe | _NullProbe:
+        """
+        HTTP 요청 1회를 기록할 컨텍스트 매니저를 반환합니다.
+
+        블록을 벗어날 때 발생한 예외에 따라 결과 코드가 결정됩니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :return: 요청 기록용 컨텍스트 매니저
+
+        **사용례**::
+
+            with self._metrics.request(svc) as probe:
+                content = ...
+                probe.received(content, latency)
+                result = decode(...)
+        """
+        if not self._enabled:
+            return _NULL_PROBE
+        return _Probe(self, svc)
+
+    def page(self, svc: Services, source: str):
+        """
+        가져온 페이지 1개를 기록합니다.
+
+        :param svc: 요청한 서비스 (Services 열거형)
+        :type svc: Services
+        :param source: 페이지를 가져온 곳 (`network`, `cache` 또는 `stale`)
+        :type source: str
+        """
+        if self._enabled:
+            self.pages.inc(svc.name, source)
+
+    def retry(self, svc: Services):
+        """
+        재시도 1회를 기록합니다.
+
+        :param svc: 요청한 서비스 (Services 열거형)
+        :type svc: Services
+        """
+        if self._enabled:
+            self.retries.inc(svc.name)
+
+    def hedge(self, svc: Services):
+        """
+        중복 요청 1회를 기록합니다.
+
+        :param svc: 요청한 서비스 (Services 열거형)
+        :type svc: Services
+        """
+        if self._enabled:
+            self.hedges.inc(svc.name)
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock, Thread, get_ident
+from time import monotonic, time
+from typing import Iterable
+from .service import KST
+from ..exceptions import (
+    InternalServiceCode,
+    InternalServiceError,
+    KeyPoolExhaustedError,
+    ServiceUnavailableError,
+)
+import json
+import os
+
+__all__ = ["KeyPool"]
+
+# 키를 일정 시간 사용 중지할 내부 서비스 코드 (인증 실패, 관리자에 의한 사용 제한)
+_REJECTED_CODES = frozenset(
+    (InternalServiceCode.UNAUTHORIZED, InternalServiceCode.FORBIDDEN)
+)
+
+
+def _today() -> str:
+    """
+    나이스 교육정보 OPEN API의 일별 트래픽 기준이 되는 오늘 날짜(KST)를 반환합니다.
+    """
+    return datetime.now(KST).date().isoformat()
+
+
+def _tomorrow() -> float:
+    """
+    다음 날 0시(KST)의 UNIX 시간을 반환합니다.
+    """
+    now = datetime.now(KST)
+    return datetime.combine(
+        now.date() + timedelta(days=1), datetime.min.time(), KST
+    ).timestamp()
+
+
+def _fingerprint(key: str) -> str:
+    """
+    파일에 인증 키 대신 저장할 키의 지문을 반환합니다.
+    """
+    return sha256(key.encode()).hexdigest()[:16]
+
+
+@dataclass
+class _KeyState:
+    """
+    인증 키 하나의 오늘 사용량과 사용 중지 상태입니다.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    blocked_until: float = 0.0
+    reason: str | None = None
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class KeyPool:
+    """
+    여러 인증 키에 페이지 요청을 분산하고 키별 사용량을 관리하는 키 풀입니다.
+
+    요청마다 사용 가능한 키 중 오늘(KST) 요청 수가 가장 적은 키를 선택하므로, 모든
+    키의 할당량이 고르게 소모됩니다. 키가 오류를 반환하면 다음과 같이 일정 시간
+    순환에서 제외됩니다.
+
+    - ERROR-290, INFO-300 (인증 실패, 사용 제한): `cooldown`초 동안
+    - ERROR-337 (일별 트래픽 초과): 다음 날 0시(KST)까지
+    - HTTP 429: `throttle_cooldown`초 동안
+
+    `path`가 주어진 경우 키별 사용량과 사용 중지 상태를 JSON 파일에 저장하여,
+    프로그램을 다시 시작해도 이어서 사용합니다. 파일에는 인증 키 대신 키의 해시가
+    저장됩니다. 요청 중의 저장은 백그라운드 스레드에서 이루어지므로 요청(비동기
+    세션의 이벤트 루프 포함)을 막지 않으며, 세션을 닫을 때 `save()`로 마지막 상태를
+    저장합니다.
+
+    스레드 안전하게 구현되어 있어 하나의 인스턴스를 여러 세션이 공유할 수 있습니다.
+
+    **사용례**::
+
+        keys = KeyPool(["key1", "key2", "key3"], daily_quota=10000, path="keys.json")
+        with SyncSession(keys) as sess:
+            data = sess.get(Services.TIMETABLES_H, **params)
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        *,
+        daily_quota: int | None = None,
+        cooldown: float = 3600.0,
+        throttle_cooldown: float = 60.0,
+        path: str | os.PathLike | None = None,
+        flush_interval: float = 5.0,
+    ):
+        """
+        KeyPool 인스턴스를 초기화합니다.
+
+        :param keys: 나이스 교육정보 OPEN API 인증 키 목록
+        :type keys: Iterable[str]
+        :param daily_quota: 키별 하루 최대 요청 수 (None인 경우 ERROR-337을 받을 때까지
+            제한하지 않음)
+        :type daily_quota: int 또는 None
+        :param cooldown: 인증 실패 또는 사용 제한된 키를 제외할 시간(초)
+        :type cooldown: float
+        :param throttle_cooldown: HTTP 429 응답을 받은 키를 제외할 시간(초)
+        :type throttle_cooldown: float
+        :param path: 사용량을 저장할 JSON 파일 경로 (None인 경우 저장하지 않음)
+        :type path: str 또는 os.PathLike 또는 None
+        :param flush_interval: 사용량을 파일에 저장하는 최소 간격(초)
+        :type flush_interval: float
+        :raises ValueError: 인증 키가 없거나 빈 키가 포함된 경우
+        """
+        self._keys = list(dict.fromkeys(keys))
+        if not self._keys or not all(self._keys):
+            raise ValueError("키 풀에는 비어 있지 않은 인증 키가 하나 이상 필요합니다.")
+        self._daily_quota = daily_quota
+        self._cooldown = cooldown
+        self._throttle_cooldown = throttle_cooldown
+        self._path = None if path is None else Path(path)
+        self._flush_interval = flush_interval
+        self._states = {key: _KeyState() for key in self._keys}
+        self._date = _today()
+        self._cursor = 0
+        self._dirty = False
+        self._flushing = False
+        self._flushed = monotonic()
+        self._lock = Lock()
+        self._io_lock = Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def acquire(self) -> str:
+        """
+        다음 요청에 사용할 인증 키를 선택하고 요청 수를 1 증가시킵니다.
+
+        :return: 인증 키
+        :rtype: str
+        :raises KeyPoolExhaustedError: 사용할 수 있는 키가 없는 경우
+        """
+        with self._lock:
+            self._rollover()
+            now = time()
+            chosen = None
+            count = len(self._keys)
+            # 동률인 키들은 돌아가며 선택되도록 마지막으로 선택한 다음 키부터 확인
+            for offset in range(count):
+                key = self._keys[(self._cursor + offset) % count]
+                state = self._states[key]
+                if state.blocked_until > now:
+                    continue
+                if (
+                    self._daily_quota is not None
+                    and state.requests >= self._daily_quota
+                ):
+                    continue
+                if chosen is None or state.requests < self._states[chosen].requests:
+                    chosen = key
+            if chosen is None:
+                raise KeyPoolExhaustedError(self._available_at(now))
+            self._cursor = (self._keys.index(chosen) + 1) % count
+            self._states[chosen].requests += 1
+            self._touch()
+            return chosen
+
+    def report(self, key: str, error: Exception) -> bool:
+        """
+        인증 키로 보낸 요청의 오류를 기록합니다.
+
+        키 때문에 발생한 오류(인증 실패, 사용 제한, 트래픽 초과)인 경우 키를 순환에서
+        제외하고 True를 반환합니다. 이 경우 다른 키로 즉시 다시 요청할 수 있습니다.
+
+        :param key: 요청에 사용한 인증 키
+        :type key: str
+        :param error: 요청 중 발생한 오류
+        :type error: Exception
+        :return: 키 때문에 발생한 오류인 경우 True, 그렇지 않으면 False
+        :rtype: bool
+        """
+        blocked_until, reason = None, None
+        if isinstance(error, InternalServiceError):
+            reason = error.code.value
+            if error.code in _REJECTED_CODES:
+                blocked_until = time() + self._cooldown
+            elif error.code == InternalServiceCode.TOO_MANY_REQUESTS:
+                blocked_until = _tomorrow()
+        elif isinstance(error, ServiceUnavailableError) and error.status == 429:
+            reason = "HTTP-429"
+            blocked_until = time() + self._throttle_cooldown
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return False
+            state.errors += 1
+            if blocked_until is not None:
+                state.blocked_until = max(state.blocked_until, blocked_until)
+                state.reason = reason
+            self._touch(force=blocked_until is not None)
+        return blocked_until is not None
+
+    def usage(self) -> dict[str, dict]:
+        """
+        키별 오늘(KST) 사용량과 사용 중지 상태를 반환합니다.
+
+        :return: 인증 키별 `requests`, `errors`, `blocked_until`(UNIX 시간 또는 None),
+            `reason`(사용 중지 원인 코드 또는 None)을 키로 하는 딕셔너리
+        :rtype: dict[str, dict]
+        """
+        with self._lock:
+            self._rollover()
+            now = time()
+            return {
+                key: {
+                    "requests": state.requests,
+                    "errors": state.errors,
+                    "blocked_until": (
+                        state.blocked_until if state.blocked_until > now else None
+                    ),
+                    "reason": state.reason if state.blocked_until > now else None,
+                }
+                for key, state in self._states.items()
+            }
+
+    def save(self):
+        """
+        키별 사용량과 사용 중지 상태를 파일에 저장합니다.
+
+        `path`가 주어지지 않은 경우 아무것도 하지 않습니다.
+
+        :raises OSError: 파일을 저장하지 못한 경우
+        """
+        self._flush()
+
+    def _available_at(self, now: float) -> float | None:
+        """
+        가장 먼저 다시 사용할 수 있게 되는 키의 사용 재개 시각을 반환합니다.
+        """
+        times = []
+        for state in self._states.values():
+            if self._daily_quota is not None and state.requests >= self._daily_quota:
+                times.append(_tomorrow())
+            elif state.blocked_until > now:
+                times.append(state.blocked_until)
+        return min(times, default=None)
+
+    def _rollover(self):
+        """
+        날짜(KST)가 바뀐 경우 키별 요청 수와 오류 수를 초기화합니다.
+        """
+        today = _today()
+        if today != self._date:
+            self._date = today
+            for state in self._states.values():
+                state.requests = state.errors = 0
+            self._touch(force=True)
+
+    def _touch(self, force: bool = False):
+        """
+        상태가 바뀌었음을 표시하고, 저장 간격이 지난 경우 백그라운드 스레드에서
+        파일에 저장합니다. 잠금을 획득한 상태에서 호출해야 합니다.
+        """
+        self._dirty = True
+        if self._path is None or self._flushing:
+            return
+        if force or monotonic() - self._flushed >= self._flush_interval:
+            self._flushing = True
+            Thread(target=self._flush_background, daemon=True).start()
+
+    def _flush_background(self):
+        """
+        백그라운드 스레드에서 상태를 저장합니다. 저장하지 못한 경우 다음 저장 때
+        다시 시도합니다.
+        """
+        try:
+            self._flush()
+        except OSError:
+            pass
+
+    def _flush(self):
+        """
+        변경된 상태를 파일에 저장합니다. 잠금을 획득하지 않은 상태에서 호출해야
+        합니다.
+
+        상태는 잠금 안에서 복사하고 파일은 잠금 밖에서 기록하므로, 기록하는 동안에도
+        키를 선택할 수 있습니다. 기록은 한 번에 하나씩, 복사한 순서대로 이루어집니다.
+        """
+        with self._io_lock:
+            with self._lock:
+                self._flushing = False
+                if self._path is None or not self._dirty:
+                    return
+                data = {
+                    "date": self._date,
+                    "keys": {
+                        _fingerprint(key): {
+                            "requests": state.requests,
+                            "errors": state.errors,
+                            "blocked_until": state.blocked_until,
+                            "reason": state.reason,
+                        }
+                        for key, state in self._states.items()
+                    },
+                }
+                self._dirty = False
+                self._flushed = monotonic()
+            try:
+                # 임시 파일을 교체하여 기록 도중 읽더라도 손상되지 않도록 함
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                temp = self._path.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+                temp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                os.replace(temp, self._path)
+            except OSError:
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def _load(self):
+        """
+        파일에 저장된 상태를 불러옵니다. 저장된 날짜가 오늘(KST)이 아닌 경우
+        사용 중지 상태만 불러옵니다.
+        """
+        if self._path is None:
+            return
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return
+        saved = data.get("keys", {})
+        same_day = data.get("date") == self._date
+        for key, state in self._states.items():
+            entry = saved.get(_fingerprint(key))
+            if entry is None:
+                continue
+            state.blocked_until = float(entry.get("blocked_until", 0.0))
+            state.reason = entry.get("reason")
+            if same_day:
+                state.requests = int(entry.get("requests", 0))
+                state.errors = int(entry.get("errors", 0))
@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
+from __future__ import annotations
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import date, timedelta, timezone
 from enum import Enum
+from typing import Mapping
 
 from requests.compat import urljoin
 
@@ -7,7 +12,12 @@ __all__ = [
     "BASE_URL",
     "MAX_CACHE",
     "TIME_TO_LIVE",
+    "KST",
     "Services",
+    "DateFields",
+    "DATE_FIELDS",
+    "parse_date",
+    "date_range",
     "urljoin",
 ]
 
@@ -15,6 +25,7 @@ __all__ = [
 BASE_URL = "https://open.neis.go.kr/hub/"
 MAX_CACHE = 64
 TIME_TO_LIVE = 86400
+KST = timezone(timedelta(hours=9), "KST")
 
 
 # noinspection SpellCheckingInspection
@@ -49,3 +60,80 @@ class Services(Enum):
     """학교 학과 정보입니다."""
     ACADEMY_INFO = "acaInsTiInfo"
     """학원 교습소 정보입니다."""
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+@dataclass(frozen=True)
+class DateFields:
+    """
+    일자별 데이터를 제공하는 서비스의 일자 관련 매개변수 이름을 나타내는 데이터 클래스입니다.
+    """
+
+    start: str
+    """조회 시작 일자 매개변수 이름"""
+    end: str
+    """조회 종료 일자 매개변수 이름"""
+    day: str
+    """조회 일자 매개변수 및 레코드의 일자 필드 이름"""
+
+
+DATE_FIELDS = {
+    Services.SCHEDULES: DateFields("AA_FROM_YMD", "AA_TO_YMD", "AA_YMD"),
+    Services.MEALS: DateFields("MLSV_FROM_YMD", "MLSV_TO_YMD", "MLSV_YMD"),
+    Services.TIMETABLES_E: DateFields("TI_FROM_YMD", "TI_TO_YMD", "ALL_TI_YMD"),
+    Services.TIMETABLES_M: DateFields("TI_FROM_YMD", "TI_TO_YMD", "ALL_TI_YMD"),
+    Services.TIMETABLES_H: DateFields("TI_FROM_YMD", "TI_TO_YMD", "ALL_TI_YMD"),
+    Services.TIMETABLES_S: DateFields("TI_FROM_YMD", "TI_TO_YMD", "ALL_TI_YMD"),
+}
+"""일자별 데이터를 제공하는 서비스와 그 일자 관련 매개변수 이름입니다."""
+
+
+def parse_date(value: object, last: bool = False) -> date | None:
+    """
+    일자 매개변수 값(YYYYMMDD, YYYYMM 또는 YYYY)을 일자로 변환합니다.
+
+    월이나 연도만 주어진 경우 `last`에 따라 그 기간의 첫날 또는 마지막 날을
+    반환합니다.
+
+    :param value: 일자 매개변수 값
+    :type value: object
+    :param last: True인 경우 기간의 마지막 날, False인 경우 첫날을 반환
+    :type last: bool
+    :return: 일자, 형식이 올바르지 않은 경우 None
+    :rtype: date 또는 None
+    """
+    text = str(value)
+    if not text.isdigit():
+        return None
+    try:
+        if len(text) == 8:
+            return date(int(text[:4]), int(text[4:6]), int(text[6:]))
+        if len(text) == 6:
+            year, month = int(text[:4]), int(text[4:])
+            return date(year, month, monthrange(year, month)[1] if last else 1)
+        if len(text) == 4:
+            return date(int(text), 12, 31) if last else date(int(text), 1, 1)
+    except ValueError:
+        return None
+    return None
+
+
+def date_range(svc: Services, query: Mapping) -> tuple[date | None, date | None]:
+    """
+    일자별 데이터를 제공하는 서비스의 query가 조회하는 일자 범위를 반환합니다.
+
+    :param svc: 일자별 데이터를 제공하는 서비스 (`DATE_FIELDS`의 키)
+    :type svc: Services
+    :param query: 서비스에 전달할 query
+    :type query: Mapping
+    :return: (시작 일자, 종료 일자) 튜플, 범위가 열려 있거나 알 수 없는 쪽은 None
+    :rtype: tuple[date | None, date | None]
+    """
+    fields = DATE_FIELDS[svc]
+    if fields.day in query:
+        return parse_date(query[fields.day]), parse_date(query[fields.day], True)
+    start = parse_date(query[fields.start]) if fields.start in query else None
+    end = parse_date(query[fields.end], True) if fields.end in query else None
+    return start, end
@@ -1,21 +1,35 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+from collections import deque
 from concurrent import futures
-from .service import Service
+from itertools import chain
+from typing import Any, Callable, Hashable, Iterator, Mapping, Sequence, TypeVar
+from requests.adapters import HTTPAdapter
+from .cache import CountHints, ResponseCache
+from .codec import decode
+from .instrument import SessionMetrics
+from .keys import KeyPool
+from .service import BASE_URL, Services, urljoin
+from .throttle import CircuitBreaker, HedgePolicy, RetryPolicy, TokenBucket
 from ..exceptions import (
+    CircuitOpenError,
     DataNotFoundException,
-    InternalServiceCode,
+    DeadlineExceededError,
     InternalServiceError,
     ServiceUnavailableError,
     SessionClosedException,
 )
+from ..utils.metrics import REGISTRY, MetricsRegistry
+import os
 import requests
-import orjson
+import time
 
 __all__ = [
     "SyncSession",
 ]
 
+T = TypeVar("T")
+
 
 class SyncSession:
     """
@@ -23,7 +37,7 @@ class SyncSession:
 
     **사용례**::
 
-        from ezneis.http import SyncSession, Service
+        from ezneis.http import SyncSession, Services
 
 
         key = "your_api_key"
@@ -32,20 +46,76 @@ class SyncSession:
 
         # 컨텍스트 매니저를 이용하여 세션 생성
         with SyncSession(key) as sess:
-           data = sess.get(Service.SCHOOL_INFO, expected=10)
+           data = sess.get(Services.SCHOOL_INFO, expected=10)
     """
 
-    def __init__(self, key: str):
+    def __init__(
+        self,
+        key: str | KeyPool,
+        *,
+        max_workers: int | None = None,
+        pool_maxsize: int | None = None,
+        rate_limiter: TokenBucket | None = None,
+        retry: RetryPolicy | None = RetryPolicy(),
+        cache: ResponseCache | None = None,
+        base_url: str = BASE_URL,
+        hints: CountHints | None = None,
+        hedge: HedgePolicy | None = None,
+        metrics: MetricsRegistry | None = REGISTRY,
+        breaker: CircuitBreaker | None = None,
+    ):
         """
         SyncSession 인스턴스를 초기화합니다.
 
-        :param key: 나이스 교육정보 OPEN API 인증 키
-        :type key: str
+        페이지 요청을 병렬로 실행하는 스레드 풀은 세션이 닫힐 때까지 유지되며,
+        HTTP 연결 풀의 크기는 기본적으로 작업자 수와 같게 설정되어 모든 작업자가
+        keep-alive 연결을 재사용할 수 있습니다.
+
+        :param key: 나이스 교육정보 OPEN API 인증 키 또는 여러 키에 요청을 분산할 키 풀
+        :type key: str 또는 KeyPool
+        :param max_workers: 페이지 요청에 사용할 최대 작업자 스레드 수
+            (None인 경우 `min(32, CPU 수 + 4)`)
+        :type max_workers: int 또는 None
+        :param pool_maxsize: 호스트당 유지할 최대 HTTP 연결 수
+            (None인 경우 `max_workers`와 동일)
+        :type pool_maxsize: int 또는 None
+        :param rate_limiter: 페이지 요청에 적용할 토큰 버킷 (여러 세션이 공유 가능)
+        :type rate_limiter: TokenBucket 또는 None
+        :param retry: 일시적인 오류에 대한 재시도 정책 (None인 경우 재시도하지 않음)
+        :type retry: RetryPolicy 또는 None
+        :param cache: 페이지 응답을 저장할 캐시 (None인 경우 캐싱하지 않음)
+        :type cache: ResponseCache 또는 None
+        :param base_url: 나이스 교육정보 OPEN API의 기본 url (테스트용 서버 등)
+        :type base_url: str
+        :param hints: 질의별 총 레코드 개수 힌트 (None인 경우 세션마다 새로 생성,
+            여러 세션이 공유 가능)
+        :type hints: CountHints 또는 None
+        :param hedge: 응답이 늦는 페이지에 중복 요청을 보낼 정책 (None인 경우 사용하지
+            않음, 여러 세션이 공유 가능)
+        :type hedge: HedgePolicy 또는 None
+        :param metrics: 요청 수, 응답 시간 등의 지표를 기록할 저장소 (None인 경우
+            기록하지 않음, 기본값은 전역 저장소)
+        :type metrics: MetricsRegistry 또는 None
+        :param breaker: 오류가 잦은 서비스에 대한 요청을 차단할 회로 차단기 (None인 경우
+            사용하지 않음, 여러 세션이 공유 가능)
+        :type breaker: CircuitBreaker 또는 None
         """
-        self._key = key
+        self._keys = key if isinstance(key, KeyPool) else None
+        self._key = "" if self._keys is not None else key
         self._max_req = 5 if not key else 1000
         self._session: requests.Session | None = None
         self._closed = False
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._pool_maxsize = pool_maxsize or self._max_workers
+        self._executor: futures.ThreadPoolExecutor | None = None
+        self._rate_limiter = rate_limiter
+        self._retry = retry or RetryPolicy(retries=0)
+        self._cache = cache
+        self._base_url = base_url
+        self._hints = hints or CountHints()
+        self._hedge = hedge
+        self._metrics = SessionMetrics(metrics)
+        self._breaker = breaker
 
     def __enter__(self) -> SyncSession:
         """
@@ -57,7 +127,7 @@ class SyncSession:
         """
         if self._closed:
             raise SessionClosedException
-        self._session = requests.Session()
+        self._prepare()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -70,20 +140,44 @@ class SyncSession:
         """
         self.close()
 
-    def get(self, svc: Service, *, limit: int | None = None, **kwargs) -> list[dict]:
+    def get(
+        self,
+        svc: Services,
+        *,
+        limit: int | None = None,
+        parse: Callable[[dict], T] | None = None,
+        timeout: float | None = None,
+        refresh: bool = False,
+        **kwargs,
+    ) -> list[dict] | tuple[T, ...]:
         """
         나이스 교육정보 OPEN API에서 데이터를 조회합니다.
 
         이 메서드는 지정된 서비스에서 데이터를 가져오며, 필요한 경우 여러 페이지에 걸쳐 데이터를 수집합니다.
-
-        :param svc: 조회할 서비스 (Service 열거형)
-        :type svc: Service
+        각 페이지는 병렬로 요청되지만, 레코드는 항상 페이지 번호 순서대로 반환됩니다.
+        치명적인 오류가 발생하거나 `limit`에 도달하면 남은 페이지 요청은 즉시 취소됩니다.
+        `limit`이 없는 경우 총 레코드 개수를 확인하기 위해 첫번째 페이지를 먼저 요청하지만,
+        같은 조건으로 이전에 조회했거나 `count`를 호출한 적이 있다면 처음부터 여러
+        페이지를 병렬로 요청합니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
         :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
         :type limit: int 또는 None
+        :param parse: 레코드를 모델로 변환할 함수 (가령, `SchoolInfo.from_dict`).
+            주어진 경우 각 페이지의 응답 본문을 곧바로 모델로 변환하며, 중간 레코드
+            목록 없이 모델 튜플을 반환
+        :type parse: Callable[[dict], T] 또는 None
+        :param timeout: 모든 페이지를 받기까지의 제한 시간(초), 재시도와 각 페이지
+            요청에도 적용 (None인 경우 제한하지 않음)
+        :type timeout: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청하여 캐시를 갱신
+        :type refresh: bool
         :param kwargs: 서비스별 추가 매개변수
-        :return: 조회된 데이터 레코드 목록
-        :rtype: list[dict]
+        :return: 조회된 데이터 레코드 목록 또는 모델 튜플
+        :rtype: list[dict] 또는 tuple[T, ...]
         :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises DeadlineExceededError: 제한 시간 안에 조회를 마치지 못한 경우
         :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
         :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
         :raises SessionClosedException: 세션이 이미 닫힌 경우
@@ -93,7 +187,7 @@ class SyncSession:
             with SyncSession("your_api_key") as sess:
                 # 학교 정보 조회
                 schools = sess.get(
-                    Service.SCHOOL_INFO,
+                    Services.SCHOOL_INFO,
                     expected=None,             # 모든 데이터 조회
                     ATPT_OFCDC_SC_CODE="B10",  # 서울특별시교육청
                     SCHUL_KND_SC_NM="고등학교"   # 학교 종류
@@ -101,7 +195,7 @@ class SyncSession:
 
                 # 급식 정보 조회
                 meals = sess.get(
-                    Service.MEALS,
+                    Services.MEALS,
                     expected=10,               # 10개 데이터 조회
                     ATPT_OFCDC_SC_CODE="J10",  # 경기도교육청
                     SD_SCHUL_CODE="1234567",   # 학교 코드
@@ -115,75 +209,531 @@ class SyncSession:
         # 세션 상태 체크
         if self._closed:
             raise SessionClosedException
-        if self._session is None:
-            self._session = requests.Session()
+        self._prepare()
+
+        # 페이지 번호 순서대로 레코드 수집
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pages = self._pages(
+            svc, limit, self._max_workers, parse, deadline, refresh, **kwargs
+        )
+        try:
+            if parse is not None:
+                # 페이지별 모델 튜플을 중간 목록 없이 하나의 튜플로 연결
+                records = tuple(chain.from_iterable(pages))
+            else:
+                records = []
+                for rows in pages:
+                    records.extend(rows)
+        except DeadlineExceededError:
+            raise DeadlineExceededError(self._url(svc), timeout) from None
+
+        # 레코드가 없는 경우 예외 발생
+        if len(records) == 0:
+            raise DataNotFoundException(self._url(svc), kwargs)
+        return records
+
+    def count(self, svc: Services, **kwargs) -> int:
+        """
+        조회 조건에 해당하는 총 레코드 개수를 반환합니다.
+
+        레코드 하나만 요청하여 응답의 `list_total_count`를 확인하므로 데이터를
+        조회하는 것보다 훨씬 가볍습니다. 확인한 값은 힌트로 저장되어, 이후 같은
+        조건의 `get` 호출은 첫번째 페이지를 기다리지 않고 바로 여러 페이지를 병렬로
+        요청합니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 총 레코드 개수 (데이터가 없는 경우 0)
+        :rtype: int
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+
+        **사용례**::
+
+            with SyncSession("your_api_key") as sess:
+                total = sess.count(Services.SCHOOL_INFO, ATPT_OFCDC_SC_CODE="J10")
+        """
+        # 세션 상태 체크
+        if self._closed:
+            raise SessionClosedException
+        self._prepare()
+
+        try:
+            total, _ = self._request(svc, 1, 1, **kwargs)
+        except DataNotFoundException:
+            self._hints.discard(svc, kwargs)
+            return 0
+        self._hints.set(svc, kwargs, total)
+        return total
+
+    def get_many(
+        self,
+        queries: (
+            Mapping[Hashable, tuple[Services, Mapping[str, Any]]]
+            | Sequence[tuple[Services, Mapping[str, Any]]]
+        ),
+        *,
+        return_exceptions: bool = False,
+    ) -> dict[Hashable, list[dict] | Exception]:
+        """
+        나이스 교육정보 OPEN API에 여러 질의를 한 번에 요청합니다.
+
+        모든 질의의 모든 페이지가 세션의 작업자 스레드 풀 하나에서 함께 실행되므로,
+        전체 소요 시간은 질의 시간의 합이 아닌 가장 느린 질의의 시간에 가까워집니다.
+        먼저 모든 질의의 첫번째 페이지를 동시에 요청하여 총 레코드 개수를 확인하고,
+        확인된 질의부터 나머지 페이지를 요청합니다. 이전에 총 레코드 개수를 확인한
+        질의는 첫번째 페이지와 함께 나머지 페이지도 바로 요청합니다.
+
+        :param queries: (서비스, 매개변수) 튜플의 시퀀스 또는 이를 값으로 하는 매핑.
+            매개변수에는 `get` 메서드와 같이 `limit`을 포함할 수 있습니다.
+        :type queries: Mapping 또는 Sequence
+        :param return_exceptions: True인 경우 실패한 질의의 예외를 결과로 반환하고,
+            False인 경우 첫번째 예외를 재전파하고 남은 요청을 취소합니다.
+        :type return_exceptions: bool
+        :return: 질의의 키(시퀀스인 경우 인덱스)별 데이터 레코드 목록
+        :rtype: dict[Hashable, list[dict] | Exception]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+
+        **사용례**::
 
-        # 요청 작업 생성
-        tasks = []
-        records = []
+            with SyncSession("your_api_key") as sess:
+                school = {"ATPT_OFCDC_SC_CODE": "J10", "SD_SCHUL_CODE": "1234567"}
+                results = sess.get_many({
+                    "meals": (Services.MEALS, {**school, "MLSV_YMD": "202505"}),
+                    "schedules": (Services.SCHEDULES, {**school, "AA_YMD": "202505"}),
+                })
+                print(len(results["meals"]), len(results["schedules"]))
+        """
+        # 세션 상태 체크
+        if self._closed:
+            raise SessionClosedException
+        self._prepare()
+
+        if isinstance(queries, Mapping):
+            items = list(queries.items())
+        else:
+            items = list(enumerate(queries))
+
+        # 질의별 (서비스, 매개변수, 페이지 크기, limit, 페이지 요청 목록)
+        jobs = {}
+        probes = {}
+        try:
+            for key, (svc, params) in items:
+                params = dict(params)
+                limit = params.pop("limit", None)
+                size = self._max_req if limit is None else min(self._max_req, limit)
+                jobs[key] = (svc, params, size, limit, [])
+                # 예상 레코드 수가 설정된 경우 모든 페이지를 바로 요청
+                if limit is not None:
+                    for i in range(1, (limit + size - 1) // size + 1):
+                        jobs[key][4].append(
+                            self._executor.submit(self._request, svc, i, size, **params)
+                        )
+                # 그렇지 않은 경우 총 레코드 개수를 확인하기 위해 첫번째 페이지 요청
+                else:
+                    probe = self._executor.submit(self._request, svc, 1, size, **params)
+                    probes[probe] = key
+                    jobs[key][4].append(probe)
+                    # 이전에 확인한 총 레코드 개수가 있는 경우 나머지 페이지도 함께 요청
+                    hint = self._hints.get(svc, params)
+                    for i in range(2, ((hint or 0) + size - 1) // size + 1):
+                        jobs[key][4].append(
+                            self._executor.submit(self._request, svc, i, size, **params)
+                        )
+
+            # 완료된 요청부터 처리: 총 레코드 개수가 확인된 질의는 나머지 페이지를
+            # 요청하고, 예외를 재전파하는 경우 첫번째 실패에서 바로 중단
+            pending = {task for *_, tasks in jobs.values() for task in tasks}
+            firsts = {tasks[0] for *_, tasks in jobs.values() if tasks}
+            while pending:
+                done, pending = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if task in probes:
+                        svc, params, size, _, tasks = jobs[probes[task]]
+                        if isinstance(error, DataNotFoundException):
+                            self._hints.discard(svc, params)
+                        if error is None:
+                            total, _ = task.result()
+                            self._hints.set(svc, params, total)
+                            for i in range(
+                                len(tasks) + 1, (total + size - 1) // size + 1
+                            ):
+                                tasks.append(
+                                    self._executor.submit(
+                                        self._request, svc, i, size, **params
+                                    )
+                                )
+                                pending.add(tasks[-1])
+                    if error is None or return_exceptions:
+                        continue
+                    # 첫번째 페이지가 아닌 페이지의 데이터가 없는 경우는 마지막 페이지
+                    if isinstance(error, DataNotFoundException) and task not in firsts:
+                        continue
+                    raise error
+
+            # 질의별로 페이지 번호 순서대로 레코드 수집
+            results = {}
+            for key, (svc, params, size, limit, tasks) in jobs.items():
+                try:
+                    records = []
+                    for task in tasks:
+                        try:
+                            _, rows = task.result()
+                        # 데이터가 없는 경우 마지막 페이지로 간주
+                        except DataNotFoundException:
+                            break
+                        records.extend(rows)
+                        if len(rows) < size:
+                            break
+                    if limit is not None:
+                        del records[limit:]
+                    # 레코드가 없는 경우 예외 발생
+                    if len(records) == 0:
+                        raise DataNotFoundException(self._url(svc), params)
+                    results[key] = records
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[key] = e
+                finally:
+                    for task in tasks:
+                        task.cancel()
+            return results
+        finally:
+            # 남은 요청 취소
+            for probe in probes:
+                probe.cancel()
+            for *_, tasks in jobs.values():
+                for task in tasks:
+                    task.cancel()
+
+    def iter_pages(
+        self,
+        svc: Services,
+        *,
+        limit: int | None = None,
+        prefetch: int = 1,
+        parse: Callable[[dict], T] | None = None,
+        **kwargs,
+    ) -> Iterator[list[dict] | tuple[T, ...]]:
+        """
+        나이스 교육정보 OPEN API에서 데이터를 페이지 단위로 순차 조회합니다.
+
+        `get` 메서드와 달리 모든 페이지를 모으지 않고, 각 페이지가 도착하는 즉시
+        페이지 번호 순서대로 반환합니다. 현재 페이지를 처리하는 동안 최대 `prefetch`개의
+        다음 페이지를 미리 요청하므로, 메모리에는 그 이상의 페이지가 유지되지 않습니다.
 
-        with futures.ThreadPoolExecutor() as executor:
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
+        :type limit: int 또는 None
+        :param prefetch: 미리 요청해 둘 페이지 수 (최소 1)
+        :type prefetch: int
+        :param parse: 레코드를 모델로 변환할 함수 (주어진 경우 페이지마다 도착하는 즉시
+            모델 튜플로 변환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 페이지별 데이터 레코드 목록 또는 모델 튜플의 이터레이터
+        :rtype: Iterator[list[dict] | tuple[T, ...]]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+
+        **사용례**::
+
+            with SyncSession("your_api_key") as sess:
+                for page in sess.iter_pages(Services.TIMETABLES_H, **params):
+                    print(f"{len(page)}개의 레코드 수신")
+        """
+        # 세션 상태 체크
+        if self._closed:
+            raise SessionClosedException
+        self._prepare()
+
+        pages = self._pages(svc, limit, max(1, prefetch), parse, **kwargs)
+        empty = True
+        try:
+            for rows in pages:
+                empty = False
+                yield rows
+        finally:
+            pages.close()
+        # 레코드가 없는 경우 예외 발생
+        if empty:
+            raise DataNotFoundException(self._url(svc), kwargs)
+
+    def iter_records(
+        self, svc: Services, *, limit: int | None = None, prefetch: int = 1, **kwargs
+    ) -> Iterator[dict]:
+        """
+        나이스 교육정보 OPEN API에서 데이터를 레코드 단위로 순차 조회합니다.
+
+        `iter_pages` 메서드를 이용하므로, 각 페이지가 도착하는 즉시 레코드를 반환합니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
+        :type limit: int 또는 None
+        :param prefetch: 미리 요청해 둘 페이지 수 (최소 1)
+        :type prefetch: int
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 데이터 레코드의 이터레이터
+        :rtype: Iterator[dict]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 이미 닫힌 경우
+
+        **사용례**::
+
+            with SyncSession("your_api_key") as sess:
+                for row in sess.iter_records(Services.MEALS, **params):
+                    print(row["DDISH_NM"])
+        """
+        for rows in self.iter_pages(svc, limit=limit, prefetch=prefetch, **kwargs):
+            yield from rows
+
+    def _pages(
+        self,
+        svc: Services,
+        limit: int | None,
+        window: int,
+        parse: Callable[[dict], T] | None = None,
+        deadline: float | None = None,
+        refresh: bool = False,
+        **kwargs,
+    ) -> Iterator[list[dict] | tuple[T, ...]]:
+        """
+        페이지를 최대 `window`개까지 병렬로 요청하고, 페이지 번호 순서대로 반환합니다.
+
+        다음 페이지는 앞선 페이지가 반환된 뒤에만 창에 추가되므로, 도착 순서와
+        관계없이 최대 `window`개의 페이지만 메모리에 유지됩니다. 중복 요청 정책이
+        설정된 경우, 다음 차례의 페이지가 늦어지면 같은 페이지를 한 번 더 요청합니다.
+        오류가 발생하거나
+        `limit`에 도달하거나 순회가 중단되면, 아직 실행되지 않은 요청은 즉시 취소됩니다.
+
+        :param svc: 조회할 서비스 (Services 열거형)
+        :type svc: Services
+        :param limit: 가져올 최대 레코드 수 (None인 경우 모든 레코드 조회)
+        :type limit: int 또는 None
+        :param window: 동시에 요청해 둘 최대 페이지 수
+        :type window: int
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param deadline: 모든 페이지를 받아야 하는 시각 (`time.monotonic` 기준)
+        :type deadline: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청
+        :type refresh: bool
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 페이지별 데이터 레코드 목록의 이터레이터
+        :rtype: Iterator[list[dict]]
+        """
+        size = self._max_req if limit is None else min(self._max_req, limit)
+        pending = deque()
+        hint = None if limit is not None else self._hints.get(svc, kwargs)
+        try:
             # 예상 레코드 수가 설정된 경우
             if limit is not None:
-                pages = (limit + self._max_req - 1) // self._max_req
-                size = min(self._max_req, limit)
-                start = 1
+                total, first, index = limit, None, 1
+            # 이전에 확인한 총 레코드 개수가 있는 경우 첫 페이지부터 바로 병렬 요청
+            elif hint is not None:
+                total, first, index = hint, None, 1
             # 예상 레코드 수가 설정되지 않은 경우
             else:
                 # 단일 요청을 통해 총 레코드 개수를 가져오기
-                limit, rows = self._request(svc, 1, self._max_req, **kwargs)
-                records.extend(rows)
-                # 첫번째 요청을 기반으로 페이지 계산
-                pages = (limit + self._max_req - 1) // self._max_req
-                size = self._max_req
-                start = 2
-            # 페이지 갯수에 맞춰 요청 작업 생성
-            for i in range(start, pages + 1):
-                tasks.append(executor.submit(self._request, svc, i, size, **kwargs))
-
-            # 병렬 요청 결과 처리
-            for future in futures.as_completed(tasks):
                 try:
-                    result = future.result()
-                    _, rows = result
-                    records.extend(rows)
-                # 데이터가 없는 경우는 무시
+                    total, first = self._request(
+                        svc, 1, size, parse, deadline, refresh, **kwargs
+                    )
                 except DataNotFoundException:
-                    continue
-                # 그 외 예외는 재전파
-                except Exception as e:
-                    raise e
+                    return
+                self._hints.set(svc, kwargs, total)
+                index = 2
+            pages = (total + size - 1) // size
+            remain = total
+            while True:
+                # 다음 페이지들을 창의 크기만큼 미리 요청
+                while index <= pages and len(pending) < window:
+                    future = self._executor.submit(
+                        self._request,
+                        svc,
+                        index,
+                        size,
+                        parse,
+                        deadline,
+                        refresh,
+                        **kwargs,
+                    )
+                    pending.append((future, index, time.monotonic()))
+                    index += 1
+                if first is not None:
+                    rows, first = first, None
+                elif pending:
+                    try:
+                        count, rows = self._wait_page(
+                            pending.popleft(),
+                            svc,
+                            size,
+                            parse,
+                            deadline,
+                            refresh,
+                            kwargs,
+                        )
+                    # 데이터가 없는 경우 마지막 페이지로 간주
+                    except DataNotFoundException:
+                        if hint is not None:
+                            self._hints.discard(svc, kwargs)
+                        return
+                    # 힌트와 실제 총 레코드 개수가 다른 경우 남은 페이지 수를 보정
+                    if limit is None and count != total:
+                        self._hints.set(svc, kwargs, count)
+                        remain += count - total
+                        total = count
+                        pages = (total + size - 1) // size
+                        if remain <= 0:
+                            return
+                else:
+                    return
+                # 레코드를 최대 limit만큼 반환
+                yield rows if len(rows) <= remain else rows[:remain]
+                remain -= len(rows)
+                # limit에 도달했거나 마지막 페이지인 경우 종료
+                if remain <= 0 or len(rows) < size:
+                    return
+        finally:
+            # 남은 요청 취소
+            for future, *_ in pending:
+                future.cancel()
+
+    def _wait_page(
+        self,
+        entry: tuple[futures.Future, int, float],
+        svc: Services,
+        size: int,
+        parse: Callable[[dict], T] | None,
+        deadline: float | None,
+        refresh: bool,
+        kwargs: dict,
+    ) -> tuple[int, list[dict] | tuple[T, ...]]:
+        """
+        다음 차례의 페이지 응답을 기다립니다.
 
-            # 레코드가 없는 경우 예외 발생
-            if len(records) == 0:
-                raise DataNotFoundException(svc.url, kwargs)
-            # 레코드를 최대 expected만큼 반환
-            return records[:limit]
+        중복 요청 정책이 설정된 경우, 페이지를 요청한 뒤 정책의 지연 시간이 지나도록
+        응답이 없으면 같은 페이지를 한 번 더 요청하고 먼저 성공한 응답을 반환합니다.
+
+        :param entry: (페이지 요청, 페이지 번호, 요청 시각) 튜플
+        :type entry: tuple[futures.Future, int, float]
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :param size: 페이지당 레코드 수
+        :type size: int
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param deadline: 응답을 받아야 하는 시각 (`time.monotonic` 기준)
+        :type deadline: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청
+        :type refresh: bool
+        :param kwargs: 서비스별 추가 매개변수
+        :type kwargs: dict
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+        :rtype: tuple[int, list[dict] | tuple[T, ...]]
+        :raises DeadlineExceededError: 제한 시간 안에 응답을 받지 못한 경우
+        """
+        future, index, started = entry
+        candidates = {future}
+        delay = None if self._hedge is None else self._hedge.delay()
+        try:
+            if delay is not None:
+                wait = started + delay - time.monotonic()
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                done, _ = futures.wait(candidates, timeout=max(0.0, wait))
+                # 응답이 늦는 경우 예산이 허용하는 만큼 중복 요청
+                if not done and self._hedge.acquire():
+                    self._metrics.hedge(svc)
+                    candidates.add(
+                        self._executor.submit(
+                            self._request,
+                            svc,
+                            index,
+                            size,
+                            parse,
+                            deadline,
+                            refresh,
+                            **kwargs,
+                        )
+                    )
+            while True:
+                timeout = None
+                if deadline is not None:
+                    timeout = max(0.0, deadline - time.monotonic())
+                done, candidates = futures.wait(
+                    candidates, timeout=timeout, return_when=futures.FIRST_COMPLETED
+                )
+                if not done:
+                    raise DeadlineExceededError(self._url(svc))
+                # 먼저 성공한 응답을 반환하고, 모두 실패한 경우 오류를 재전파
+                failed = None
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    failed = task
+                if not candidates:
+                    return failed.result()
+        finally:
+            for task in candidates:
+                task.cancel()
 
     def _request(
-        self, svc: Service, index: int, size: int, **kwargs
-    ) -> tuple[int, list[dict]]:
+        self,
+        svc: Services,
+        index: int,
+        size: int,
+        parse: Callable[[dict], T] | None = None,
+        deadline: float | None = None,
+        refresh: bool = False,
+        **kwargs,
+    ) -> tuple[int, list[dict] | tuple[T, ...]]:
         """
         나이스 교육정보 OPEN API에 단일 페이지 요청을 수행합니다.
 
-        :param svc: 요청할 서비스 (Service 열거형)
-        :type svc: Service
+        캐시에 유효한 응답이 있는 경우 요청 없이 캐시된 응답을 반환합니다
+        (`refresh`가 True인 경우 새로 요청하여 캐시를 갱신).
+        요청 전에 토큰 버킷에서 토큰을 획득하며, 재시도할 수 있는 오류가 발생한
+        경우 재시도 정책에 따라 대기한 뒤 다시 요청합니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
         :param index: 요청할 페이지 번호
         :type index: int
         :param size: 페이지당 레코드 수
         :type size: int
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param deadline: 응답을 받아야 하는 시각 (`time.monotonic` 기준)
+        :type deadline: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청
+        :type refresh: bool
         :param kwargs: 서비스별 추가 매개변수
-        :return: (전체 레코드 수, 현재 페이지 레코드 목록) 튜플
-        :rtype: tuple[int, list[dict]]
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+        :rtype: tuple[int, list[dict] | tuple[T, ...]]
         :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises DeadlineExceededError: 제한 시간 안에 응답을 받지 못한 경우
+        :raises CircuitOpenError: 서비스의 회로가 열려 있고 캐시된 응답도 없는 경우
         :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises KeyPoolExhaustedError: 키 풀에 사용할 수 있는 키가 남아 있지 않은 경우
         :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
         :raises SessionClosedException: 세션이 닫힌 경우
         """
-        # 세션 상태 체크
-        if not self._session or self._closed:
-            raise SessionClosedException
-
         # 쿼리 생성
         query = {
             **kwargs,
@@ -193,23 +743,213 @@ class SyncSession:
             "pSize": size,
         }
 
+        # 캐시된 응답이 있는 경우 요청 없이 반환
+        # (회로가 열린 서비스는 만료된 응답이라도 반환)
+        if self._cache is not None and not refresh:
+            stale = (
+                self._breaker is not None
+                and self._breaker.state(svc) == CircuitBreaker.OPEN
+            )
+            content = self._cache.load(svc, query, stale=stale)
+            if content is not None:
+                result = decode(svc, content, self._url(svc), query, parse)
+                self._metrics.page(svc, "cache")
+                return result
+
+        attempt = 0
+        while True:
+            # 회로가 열린 서비스는 요청하지 않고 즉시 실패
+            if self._breaker is not None and not self._breaker.allow(svc):
+                return self._reject(svc, query, parse)
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve()
+                # 제한 시간 안에 토큰을 얻을 수 없는 경우 기다리지 않고 실패
+                if deadline is not None and time.monotonic() + wait >= deadline:
+                    self._rate_limiter.release()
+                    raise DeadlineExceededError(self._url(svc))
+                if wait > 0:
+                    time.sleep(wait)
+            # 키 풀을 사용하는 경우 요청마다 사용량이 가장 적은 키를 선택
+            if self._keys is not None:
+                query["KEY"] = self._keys.acquire()
+            try:
+                result = self._request_once(svc, query, parse, deadline)
+            except DataNotFoundException:
+                if self._breaker is not None:
+                    self._breaker.record(svc)
+                raise
+            except (InternalServiceError, ServiceUnavailableError) as e:
+                if self._breaker is not None:
+                    self._breaker.record(svc, e)
+                    # 이 오류로 회로가 열린 경우, 만료된 응답이라도 있으면 대신 반환
+                    if self._breaker.state(svc) == CircuitBreaker.OPEN:
+                        result = self._stale(svc, query, parse)
+                        if result is not None:
+                            return result
+                # 키 때문에 발생한 오류인 경우 해당 키를 제외하고 다른 키로 즉시 재요청
+                if self._keys is not None and self._keys.report(query["KEY"], e):
+                    continue
+                # 재시도할 수 없거나 재시도 횟수를 모두 사용한 경우 재전파
+                if attempt >= self._retry.retries or not self._retry.is_retryable(e):
+                    raise
+                # 제한 시간 안에 재시도할 수 없는 경우
+                delay = self._retry.delay(attempt)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise DeadlineExceededError(self._url(svc)) from e
+                # 공유된 토큰 버킷을 비워 다른 요청들도 함께 속도를 늦추도록 함
+                if self._rate_limiter is not None:
+                    self._rate_limiter.drain()
+            else:
+                if self._breaker is not None:
+                    self._breaker.record(svc)
+                self._metrics.page(svc, "network")
+                return result
+            self._metrics.retry(svc)
+            time.sleep(delay)
+            attempt += 1
+
+    def _reject(
+        self, svc: Services, query: dict, parse: Callable[[dict], T] | None = None
+    ) -> tuple[int, list[dict] | tuple[T, ...]]:
+        """
+        회로가 열린 서비스에 대한 요청을 처리합니다.
+
+        캐시에 만료된 응답이라도 남아 있는 경우 그 응답을 반환하고, 그렇지 않으면
+        즉시 실패합니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: dict
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+        :rtype: tuple[int, list[dict] | tuple[T, ...]]
+        :raises CircuitOpenError: 캐시된 응답이 없는 경우
+        """
+        result = self._stale(svc, query, parse)
+        if result is None:
+            raise CircuitOpenError(self._url(svc), self._breaker.retry_after(svc))
+        return result
+
+    def _stale(
+        self, svc: Services, query: dict, parse: Callable[[dict], T] | None = None
+    ) -> tuple[int, list[dict] | tuple[T, ...]] | None:
+        """
+        캐시에 남아 있는 응답을 만료 여부와 관계없이 반환합니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: dict
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플,
+            캐시된 응답이 없는 경우 None
+        :rtype: tuple[int, list[dict] | tuple[T, ...]] 또는 None
+        """
+        if self._cache is None:
+            return None
+        content = self._cache.load(svc, query, stale=True)
+        if content is None:
+            return None
+        result = decode(svc, content, self._url(svc), query, parse)
+        self._metrics.page(svc, "stale")
+        return result
+
+    def _request_once(
+        self,
+        svc: Services,
+        query: dict,
+        parse: Callable[[dict], T] | None = None,
+        deadline: float | None = None,
+    ) -> tuple[int, list[dict] | tuple[T, ...]]:
+        """
+        나이스 교육정보 OPEN API에 재시도 없이 단일 페이지 요청을 1회 수행합니다.
+
+        서비스 데이터가 포함된 응답은 캐시에 저장됩니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :param query: 요청할 서비스에 전달할 query
+        :type query: dict
+        :param parse: 레코드를 모델로 변환할 함수 (None인 경우 레코드를 그대로 반환)
+        :type parse: Callable[[dict], T] 또는 None
+        :param deadline: 응답을 받아야 하는 시각 (`time.monotonic` 기준)
+        :type deadline: float 또는 None
+        :return: (전체 레코드 수, 현재 페이지 레코드 목록 또는 모델 튜플) 튜플
+        :rtype: tuple[int, list[dict] | tuple[T, ...]]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises SessionClosedException: 세션이 닫힌 경우
+        """
+        # 세션 상태 체크
+        if not self._session or self._closed:
+            raise SessionClosedException
+
+        # 제한 시간이 설정된 경우 남은 시간을 HTTP 요청의 제한 시간으로 사용
+        timeout = None
+        if deadline is not None:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                raise DeadlineExceededError(self._url(svc))
+
         # 서비스에 쿼리 요청 후 결과 처리
-        with self._session.get(svc.url, params=query) as resp:
-            if resp.status_code != 200:
-                raise ServiceUnavailableError(svc.url)
-            payload = orjson.loads(resp.content)
-
-        # 서비스 데이터가 누락된 경우 예외 처리
-        if svc.value not in payload:
-            code = payload["RESULT"]["CODE"]
-            if code == InternalServiceCode.NOT_FOUND.value:
-                raise DataNotFoundException(svc.url, query)
-            msg = payload["RESULT"]["MESSAGE"]
-            raise InternalServiceError(code, msg)
-
-        # 응답 서비스 데이터 반환
-        header, body = payload[svc.value]
-        return header["head"][0]["list_total_count"], body["row"]
+        with self._metrics.request(svc) as probe:
+            start = time.monotonic()
+            try:
+                with self._session.get(
+                    self._url(svc), params=query, timeout=timeout
+                ) as resp:
+                    if resp.status_code != 200:
+                        raise ServiceUnavailableError(self._url(svc), resp.status_code)
+                    content = resp.content
+            # 연결 오류는 상태 코드가 없는 ServiceUnavailableError로 변환
+            except requests.RequestException as e:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise DeadlineExceededError(self._url(svc)) from e
+                raise ServiceUnavailableError(self._url(svc)) from e
+            latency = time.monotonic() - start
+            probe.received(content, latency)
+            if self._hedge is not None:
+                self._hedge.record(latency)
+
+            # 응답 본문 해석
+            result = decode(svc, content, self._url(svc), query, parse)
+
+        # 서비스 데이터가 포함된 응답을 캐시에 저장
+        if self._cache is not None:
+            self._cache.store(svc, query, content)
+        return result
+
+    def _prepare(self):
+        """
+        HTTP 세션과 작업자 스레드 풀을 준비합니다.
+
+        이미 준비된 경우 기존 자원을 그대로 재사용합니다.
+        """
+        if self._session is None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_maxsize)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="ezneis"
+            )
+
+    def _url(self, svc: Services) -> str:
+        """
+        서비스의 url을 반환합니다.
+
+        :param svc: 요청할 서비스 (Services 열거형)
+        :type svc: Services
+        :return: 서비스의 url
+        :rtype: str
+        """
+        return urljoin(self._base_url, svc.value)
 
     def close(self):
         """
@@ -218,8 +958,13 @@ class SyncSession:
         이 메서드는 세션과 관련된 모든 리소스를 정리하고 세션을 닫습니다.
         세션이 이미 닫혀 있는 경우에도 안전하게 호출할 수 있습니다.
         """
+        if self._executor and not self._closed:
+            # 대기 중인 요청은 취소하고, 실행 중인 요청이 끝날 때까지 대기
+            self._executor.shutdown(wait=True, cancel_futures=True)
         if self._session and not self._closed:
             self._session.close()
+        if self._keys is not None and not self._closed:
+            self._keys.save()
         self._closed = True
 
     @property
@@ -0,0 +1,534 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic, sleep
+from typing import Hashable
+from ..exceptions import (
+    InternalServiceCode,
+    InternalServiceError,
+    ServiceUnavailableError,
+)
+import asyncio
+import random
+
+__all__ = ["TokenBucket", "RetryPolicy", "HedgePolicy", "CircuitBreaker"]
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class TokenBucket:
+    """
+    초당 요청 수를 제한하는 토큰 버킷입니다.
+
+    스레드 안전하게 구현되어 있어 하나의 인스턴스를 여러 `SyncSession`과
+    `AsyncSession`이 함께 공유할 수 있습니다. 토큰이 부족한 경우 토큰을 미리
+    예약(차감)한 뒤 부족한 만큼만 대기하므로, 대기 중인 요청들은 도착한 순서대로
+    일정한 간격을 두고 실행됩니다.
+
+    **사용례**::
+
+        limiter = TokenBucket(rate=20, capacity=40)
+        sync_sess = SyncSession(key, rate_limiter=limiter)
+        async_sess = AsyncSession(key, rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        TokenBucket 인스턴스를 초기화합니다.
+
+        :param rate: 초당 보충되는 토큰 수 (초당 허용 요청 수)
+        :type rate: float
+        :param capacity: 버킷의 최대 토큰 수 (순간적으로 허용되는 요청 수),
+            None인 경우 `rate`와 동일
+        :type capacity: float 또는 None
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self._rate = float(rate)
+        self._capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self._capacity
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 예약하고, 예약한 토큰을 사용하기 전까지 대기해야 할 시간을 반환합니다.
+
+        :param tokens: 예약할 토큰 수
+        :type tokens: float
+        :return: 대기해야 할 시간(초)
+        :rtype: float
+        """
+        with self._lock:
+            now = monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def release(self, tokens: float = 1.0):
+        """
+        예약한 토큰을 사용하지 않고 되돌려 놓습니다.
+
+        :param tokens: 되돌려 놓을 토큰 수
+        :type tokens: float
+        """
+        with self._lock:
+            self._tokens = min(self._capacity, self._tokens + tokens)
+
+    def drain(self):
+        """
+        남은 토큰을 모두 비웁니다.
+
+        서버로부터 혼잡 신호를 받았을 때 호출되어, 이 버킷을 공유하는 모든 세션이
+        토큰이 다시 보충될 때까지 요청을 늦추도록 합니다.
+        """
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+
+    def acquire(self, tokens: float = 1.0):
+        """
+        토큰을 획득할 때까지 현재 스레드를 대기시킵니다.
+
+        :param tokens: 획득할 토큰 수
+        :type tokens: float
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0):
+        """
+        토큰을 획득할 때까지 현재 코루틴을 대기시킵니다.
+
+        :param tokens: 획득할 토큰 수
+        :type tokens: float
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @property
+    def rate(self) -> float:
+        """
+        초당 보충되는 토큰 수입니다.
+
+        :return: 초당 토큰 수
+        :rtype: float
+        """
+        return self._rate
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    실패한 페이지 요청의 재시도 정책을 나타내는 데이터 클래스입니다.
+
+    재시도 간격은 지수적으로 증가하며(exponential backoff), 여러 요청이 동시에
+    재시도하지 않도록 `[0, 간격]` 범위에서 무작위로 선택됩니다(full jitter).
+    """
+
+    retries: int = 3
+    """최초 요청 이후 최대 재시도 횟수 (0인 경우 재시도하지 않음)"""
+    base_delay: float = 0.5
+    """첫번째 재시도의 최대 대기 시간(초)"""
+    max_delay: float = 8.0
+    """재시도 대기 시간의 상한(초)"""
+    codes: frozenset[InternalServiceCode] = frozenset(
+        (
+            InternalServiceCode.SERVER_ERROR,
+            InternalServiceCode.DATABASE_ERROR,
+        )
+    )
+    """재시도할 내부 서비스 오류 코드"""
+    statuses: frozenset[int] = frozenset((429, 500, 502, 503, 504))
+    """재시도할 HTTP 상태 코드"""
+
+    def delay(self, attempt: int) -> float:
+        """
+        재시도 전에 대기할 시간을 계산합니다.
+
+        :param attempt: 지금까지 재시도한 횟수 (0부터 시작)
+        :type attempt: int
+        :return: 대기할 시간(초)
+        :rtype: float
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        주어진 오류가 재시도할 수 있는 오류인지 확인합니다.
+
+        상태 코드가 없는 `ServiceUnavailableError`는 연결 오류를 나타내므로
+        항상 재시도합니다.
+
+        :param error: 페이지 요청 중 발생한 오류
+        :type error: Exception
+        :return: 재시도할 수 있으면 True, 그렇지 않으면 False
+        :rtype: bool
+        """
+        if isinstance(error, InternalServiceError):
+            return error.code in self.codes
+        if isinstance(error, ServiceUnavailableError):
+            return error.status is None or error.status in self.statuses
+        return False
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class HedgePolicy:
+    """
+    응답이 늦는 페이지 요청에 중복 요청을 보내는 정책(hedged request)입니다.
+
+    최근 페이지 응답 시간의 `percentile` 백분위수를 넘도록 응답하지 않은 페이지에
+    같은 요청을 한 번 더 보내고, 먼저 도착한 응답을 사용합니다. 추가 부하는
+    예산으로 제한되며, 응답을 하나 받을 때마다 `ratio`만큼의 예산이 쌓이고
+    (최대 `burst`) 중복 요청마다 1씩 차감되므로, 중복 요청은 장기적으로 전체 요청의
+    `ratio` 비율을 넘지 않습니다.
+
+    스레드 안전하게 구현되어 있어 하나의 인스턴스를 여러 세션이 공유할 수 있습니다.
+
+    **사용례**::
+
+        hedge = HedgePolicy(percentile=95, ratio=0.05)
+        with SyncSession(key, hedge=hedge) as sess:
+            data = sess.get(Services.TIMETABLES_H, timeout=10, **params)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        *,
+        ratio: float = 0.1,
+        burst: float = 10.0,
+        min_delay: float = 0.0,
+        min_samples: int = 20,
+        window: int = 256,
+    ):
+        """
+        HedgePolicy 인스턴스를 초기화합니다.
+
+        :param percentile: 중복 요청을 보낼 기준이 되는 응답 시간 백분위수 (0 ~ 100)
+        :type percentile: float
+        :param ratio: 전체 요청 대비 허용할 중복 요청의 비율
+        :type ratio: float
+        :param burst: 한 번에 보낼 수 있는 최대 중복 요청 수
+        :type burst: float
+        :param min_delay: 중복 요청을 보내기 전에 기다릴 최소 시간(초)
+        :type min_delay: float
+        :param min_samples: 중복 요청을 보내기 위해 필요한 최소 응답 시간 표본 수
+        :type min_samples: int
+        :param window: 백분위수 계산에 사용할 최근 응답 시간 표본 수
+        :type window: int
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile은 0보다 크고 100 이하여야 합니다.")
+        self._percentile = percentile
+        self._ratio = ratio
+        self._burst = burst
+        self._min_delay = min_delay
+        self._min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._budget = burst
+        self._hedged = 0
+        self._lock = Lock()
+
+    def record(self, latency: float):
+        """
+        페이지 응답 시간을 기록하고 중복 요청 예산을 적립합니다.
+
+        :param latency: 응답 시간(초)
+        :type latency: float
+        """
+        with self._lock:
+            self._samples.append(latency)
+            self._budget = min(self._burst, self._budget + self._ratio)
+
+    def delay(self) -> float | None:
+        """
+        중복 요청을 보내기 전까지 기다릴 시간을 반환합니다.
+
+        :return: 기다릴 시간(초), 표본이 부족한 경우 None
+        :rtype: float 또는 None
+        """
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            samples = sorted(self._samples)
+        index = min(len(samples) - 1, int(len(samples) * self._percentile / 100))
+        return max(self._min_delay, samples[index])
+
+    def acquire(self) -> bool:
+        """
+        중복 요청 예산을 1만큼 사용합니다.
+
+        :return: 예산이 남아 중복 요청을 보낼 수 있으면 True, 그렇지 않으면 False
+        :rtype: bool
+        """
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self._hedged += 1
+            return True
+
+    @property
+    def hedged(self) -> int:
+        """
+        지금까지 보낸 중복 요청 수입니다.
+
+        :return: 중복 요청 수
+        :rtype: int
+        """
+        return self._hedged
+
+
+class _Circuit:
+    """
+    서비스 하나의 회로 상태입니다.
+    """
+
+    __slots__ = ("state", "outcomes", "opened_at", "probes", "probed_at")
+
+    def __init__(self, window: int):
+        self.state = CircuitBreaker.CLOSED
+        # 최근 요청의 실패 여부 (True인 경우 실패)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        # 반열림 상태에서 보낸 시험 요청 수와 마지막 시험 요청 시각
+        self.probes = 0
+        self.probed_at = 0.0
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class CircuitBreaker:
+    """
+    서비스별로 오류율을 감시하여, 오류가 잦은 서비스에 대한 요청을 차단하는
+    회로 차단기(circuit breaker)입니다.
+
+    최근 `window`개 요청 중 `failure_rate` 이상이 실패하면 해당 서비스의 회로가
+    열리고(open), `reset_timeout`초 동안 요청을 보내지 않고 즉시 실패합니다.
+    (캐시에 만료된 응답이라도 있으면 그 응답을 반환합니다.) 이후 반열림(half-open)
+    상태가 되어 최대 `probes`개의 시험 요청을 보내고, 모두 성공하면 회로를 닫고
+    하나라도 실패하면 다시 엽니다. 회로는 서비스마다 따로 관리되므로, 한 서비스에
+    장애가 발생해도 다른 서비스의 처리량에는 영향을 주지 않습니다.
+
+    스레드 안전하게 구현되어 있어 하나의 인스턴스를 여러 세션이 공유할 수 있습니다.
+
+    **사용례**::
+
+        breaker = CircuitBreaker(failure_rate=0.5, reset_timeout=30)
+        with SyncSession(key, breaker=breaker, cache=cache) as sess:
+            try:
+                data = sess.get(Services.TIMETABLES_H, **params)
+            except CircuitOpenError as e:
+                print(f"{e.retry_after:.0f}초 후 다시 시도")
+    """
+
+    CLOSED = "closed"
+    """요청을 정상적으로 보내는 상태"""
+    OPEN = "open"
+    """요청을 보내지 않고 즉시 실패하는 상태"""
+    HALF_OPEN = "half_open"
+    """시험 요청으로 서비스의 회복 여부를 확인하는 상태"""
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        *,
+        window: int = 20,
+        min_requests: int = 10,
+        reset_timeout: float = 30.0,
+        probes: int = 1,
+        codes: frozenset[InternalServiceCode] = frozenset(
+            (
+                InternalServiceCode.SERVER_ERROR,
+                InternalServiceCode.DATABASE_ERROR,
+                InternalServiceCode.SQL_SYNTAX_ERROR,
+            )
+        ),
+        statuses: frozenset[int] = frozenset((500, 502, 503, 504)),
+    ):
+        """
+        CircuitBreaker 인스턴스를 초기화합니다.
+
+        :param failure_rate: 회로를 열 최근 요청의 실패 비율 (0 ~ 1)
+        :type failure_rate: float
+        :param window: 실패 비율을 계산할 최근 요청 수
+        :type window: int
+        :param min_requests: 회로를 열기 위해 필요한 최소 요청 수
+        :type min_requests: int
+        :param reset_timeout: 회로를 연 뒤 시험 요청을 보내기까지 기다릴 시간(초)
+        :type reset_timeout: float
+        :param probes: 반열림 상태에서 회로를 닫기 위해 성공해야 하는 시험 요청 수
+        :type probes: int
+        :param codes: 실패로 간주할 내부 서비스 오류 코드
+        :type codes: frozenset[InternalServiceCode]
+        :param statuses: 실패로 간주할 HTTP 상태 코드 (연결 오류는 항상 실패로 간주)
+        :type statuses: frozenset[int]
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate는 0보다 크고 1 이하여야 합니다.")
+        self._failure_rate = failure_rate
+        self._window = window
+        self._min_requests = min(min_requests, window)
+        self._reset_timeout = reset_timeout
+        self._probes = max(1, probes)
+        self._codes = codes
+        self._statuses = statuses
+        self._circuits: dict[Hashable, _Circuit] = {}
+        self._lock = Lock()
+
+    def is_failure(self, error: Exception | None) -> bool:
+        """
+        요청 결과가 서비스 장애를 나타내는지 확인합니다.
+
+        :param error: 요청 중 발생한 오류 (성공한 경우 None)
+        :type error: Exception 또는 None
+        :return: 장애를 나타내면 True, 그렇지 않으면 False
+        :rtype: bool
+        """
+        if isinstance(error, InternalServiceError):
+            return error.code in self._codes
+        if isinstance(error, ServiceUnavailableError):
+            return error.status is None or error.status in self._statuses
+        return False
+
+    def allow(self, svc: Hashable) -> bool:
+        """
+        서비스에 요청을 보내도 되는지 확인합니다.
+
+        열린 회로의 대기 시간이 지난 경우 반열림 상태로 전환하고, 시험 요청 1개를
+        허용합니다. 허용된 요청의 결과는 반드시 `record`로 기록해야 합니다.
+
+        :param svc: 요청할 서비스
+        :type svc: Hashable
+        :return: 요청을 보내도 되면 True, 그렇지 않으면 False
+        :rtype: bool
+        """
+        with self._lock:
+            circuit = self._circuits.get(svc)
+            if circuit is None or circuit.state == self.CLOSED:
+                return True
+            now = monotonic()
+            if circuit.state == self.OPEN:
+                if now - circuit.opened_at < self._reset_timeout:
+                    return False
+                circuit.state = self.HALF_OPEN
+                circuit.probes = 0
+            # 결과가 기록되지 않은 시험 요청(가령, 취소된 요청)이 있더라도
+            # 대기 시간이 지나면 새 시험 요청을 허용
+            elif now - circuit.probed_at < self._reset_timeout:
+                return False
+            circuit.probed_at = now
+            return True
+
+    def record(self, svc: Hashable, error: Exception | None = None):
+        """
+        서비스에 보낸 요청의 결과를 기록하고, 필요한 경우 회로 상태를 전환합니다.
+
+        :param svc: 요청한 서비스
+        :type svc: Hashable
+        :param error: 요청 중 발생한 오류 (성공한 경우 None)
+        :type error: Exception 또는 None
+        """
+        failed = self.is_failure(error)
+        with self._lock:
+            circuit = self._circuits.get(svc)
+            if circuit is None:
+                # 성공만 기록된 서비스는 상태를 만들지 않음
+                if not failed:
+                    return
+                circuit = self._circuits[svc] = _Circuit(self._window)
+            if circuit.state == self.HALF_OPEN:
+                if failed:
+                    self._open(circuit)
+                    return
+                circuit.probes += 1
+                if circuit.probes >= self._probes:
+                    circuit.state = self.CLOSED
+                    circuit.outcomes.clear()
+                else:
+                    circuit.probed_at = 0.0
+                return
+            if circuit.state == self.OPEN:
+                return
+            circuit.outcomes.append(failed)
+            total = len(circuit.outcomes)
+            if (
+                failed
+                and total >= self._min_requests
+                and sum(circuit.outcomes) >= self._failure_rate * total
+            ):
+                self._open(circuit)
+
+    def state(self, svc: Hashable) -> str:
+        """
+        서비스의 회로 상태를 반환합니다.
+
+        :param svc: 서비스
+        :type svc: Hashable
+        :return: `CLOSED`, `OPEN`, `HALF_OPEN` 중 하나
+        :rtype: str
+        """
+        with self._lock:
+            circuit = self._circuits.get(svc)
+            if circuit is None:
+                return self.CLOSED
+            if (
+                circuit.state == self.OPEN
+                and monotonic() - circuit.opened_at >= self._reset_timeout
+            ):
+                return self.HALF_OPEN
+            return circuit.state
+
+    def retry_after(self, svc: Hashable) -> float | None:
+        """
+        열린 회로가 시험 요청을 허용하기까지 남은 시간을 반환합니다.
+
+        :param svc: 서비스
+        :type svc: Hashable
+        :return: 남은 시간(초), 회로가 열려 있지 않은 경우 None
+        :rtype: float 또는 None
+        """
+        with self._lock:
+            circuit = self._circuits.get(svc)
+            if circuit is None or circuit.state == self.CLOSED:
+                return None
+            started = (
+                circuit.opened_at if circuit.state == self.OPEN else circuit.probed_at
+            )
+            return max(0.0, started + self._reset_timeout - monotonic())
+
+    def reset(self, svc: Hashable | None = None):
+        """
+        회로를 닫힌 상태로 초기화합니다.
+
+        :param svc: 초기화할 서비스 (None인 경우 모든 서비스)
+        :type svc: Hashable 또는 None
+        """
+        with self._lock:
+            if svc is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(svc, None)
+
+    def _open(self, circuit: _Circuit):
+        """
+        회로를 엽니다. 잠금을 획득한 상태에서 호출해야 합니다.
+        """
+        circuit.state = self.OPEN
+        circuit.opened_at = monotonic()
+        circuit.outcomes.clear()
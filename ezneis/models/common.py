@@ -2,7 +2,7 @@
 from enum import Enum
 from typing import Optional
 
-from ..http.common import Services
+from ..http.service import Services
 
 __all__ = ["CourseType", "SchoolCategory", "Timing"]
 
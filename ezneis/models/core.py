@@ -21,13 +21,17 @@ CoreBuilder 클래스는 API 쿼리를 구성하는 빌더 클래스의 기본
     session = SyncSession("API_KEY")
     schools = builder >> session
 """
+
 from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
-from typing import Awaitable, Sequence
-from ..http import AsyncSession, Service, SyncSession
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Awaitable, Iterable, Iterator, Sequence
+from ..exceptions import DataNotFoundException
+from ..http import AsyncSession, Services, SyncSession
+from ..http.service import DATE_FIELDS, date_range
 
-__all__ = ["CoreModel", "CoreBuilder"]
+__all__ = ["CoreModel", "CoreBuilder", "QueryPlanner"]
 
 
 @dataclass(frozen=True)
@@ -80,6 +84,7 @@ class CoreBuilder(metaclass=ABCMeta):
         """
         new = self.__class__()
         new._param = self._param.copy()
+        new._limit = self._limit
         return new
 
     def copy(self) -> CoreBuilder:
@@ -103,12 +108,12 @@ class CoreBuilder(metaclass=ABCMeta):
 
     @property
     @abstractmethod
-    def _service(self) -> Service:
+    def _service(self) -> Services:
         """
         사용할 NEIS Open API 서비스를 반환합니다.
 
         :return: 사용할 NEIS Open API 서비스
-        :rtype: Service
+        :rtype: Services
         """
         pass
 
@@ -141,33 +146,132 @@ class CoreBuilder(metaclass=ABCMeta):
             return self.fetch_async(other)
         raise TypeError(f"unsupported operand type(s) for >>: '{type(other)}'")
 
-    def fetch(self, sess: SyncSession) -> Sequence[CoreModel]:
+    def fetch(
+        self, sess: SyncSession, timeout: float | None = None, refresh: bool = False
+    ) -> Sequence[CoreModel]:
         """
         동기 세션을 사용하여 데이터를 조회합니다.
 
         :param sess: 데이터를 조회할 동기 세션
         :type sess: SyncSession
+        :param timeout: 조회를 마쳐야 하는 제한 시간(초) (None인 경우 제한하지 않음)
+        :type timeout: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청하여 캐시를 갱신
+        :type refresh: bool
         :return: 조회된 모델 객체의 시퀀스
         :rtype: Sequence[CoreModel]
+        :raises DeadlineExceededError: 제한 시간 안에 조회를 마치지 못한 경우
         """
-        return tuple(
-            self._model.from_dict(i)
-            for i in sess.get(self._service, limit=self._limit, **self._param)
+        # 응답 본문을 페이지마다 곧바로 모델로 변환
+        return sess.get(
+            self._service,
+            limit=self._limit,
+            parse=self._model.from_dict,
+            timeout=timeout,
+            refresh=refresh,
+            **self._param,
         )
 
-    async def fetch_async(self, sess: AsyncSession) -> Sequence[CoreModel]:
+    async def fetch_async(
+        self, sess: AsyncSession, timeout: float | None = None, refresh: bool = False
+    ) -> Sequence[CoreModel]:
         """
         비동기 세션을 사용하여 데이터를 조회합니다.
 
         :param sess: 데이터를 조회할 비동기 세션
         :type sess: AsyncSession
+        :param timeout: 조회를 마쳐야 하는 제한 시간(초) (None인 경우 제한하지 않음)
+        :type timeout: float 또는 None
+        :param refresh: True인 경우 캐시된 응답을 사용하지 않고 새로 요청하여 캐시를 갱신
+        :type refresh: bool
         :return: 조회된 모델 객체의 시퀀스
         :rtype: Sequence[CoreModel]
+        :raises DeadlineExceededError: 제한 시간 안에 조회를 마치지 못한 경우
+        """
+        # 응답 본문을 페이지마다 곧바로 모델로 변환
+        return await sess.get(
+            self._service,
+            limit=self._limit,
+            parse=self._model.from_dict,
+            timeout=timeout,
+            refresh=refresh,
+            **self._param,
+        )
+
+    def iter(self, sess: SyncSession, prefetch: int = 1) -> Iterator[CoreModel]:
+        """
+        동기 세션을 사용하여 데이터를 조회하고, 모델 객체를 하나씩 반환합니다.
+
+        `fetch`와 달리 모든 페이지를 기다리지 않고, 각 페이지가 도착하는 즉시 모델로
+        변환하여 반환합니다. 현재 페이지를 처리하는 동안 최대 `prefetch`개의 다음
+        페이지만 미리 요청하므로, 조회 결과의 크기와 관계없이 메모리 사용량이 일정하게
+        유지됩니다. 순회를 중단하면 남은 페이지 요청은 취소됩니다.
+
+        :param sess: 데이터를 조회할 동기 세션
+        :type sess: SyncSession
+        :param prefetch: 미리 요청해 둘 페이지 수 (최소 1)
+        :type prefetch: int
+        :return: 모델 객체의 이터레이터
+        :rtype: Iterator[CoreModel]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+
+        **사용례**::
+
+            with SyncSession("API_KEY") as sess:
+                for school in SchoolInfoBuilder().iter(sess, prefetch=2):
+                    print(school.name)
+        """
+        pages = sess.iter_pages(
+            self._service,
+            limit=self._limit,
+            prefetch=prefetch,
+            parse=self._model.from_dict,
+            **self._param,
+        )
+        try:
+            for models in pages:
+                yield from models
+        finally:
+            pages.close()
+
+    async def aiter(
+        self, sess: AsyncSession, prefetch: int = 1
+    ) -> AsyncIterator[CoreModel]:
+        """
+        비동기 세션을 사용하여 데이터를 조회하고, 모델 객체를 하나씩 반환합니다.
+
+        `fetch_async`와 달리 모든 페이지를 기다리지 않고, 각 페이지가 도착하는 즉시
+        모델로 변환하여 반환합니다. 현재 페이지를 처리하는 동안 최대 `prefetch`개의
+        다음 페이지만 미리 요청하므로, 조회 결과의 크기와 관계없이 메모리 사용량이
+        일정하게 유지됩니다. 순회를 중단하면 남은 페이지 요청은 취소됩니다.
+
+        :param sess: 데이터를 조회할 비동기 세션
+        :type sess: AsyncSession
+        :param prefetch: 미리 요청해 둘 페이지 수 (최소 1)
+        :type prefetch: int
+        :return: 모델 객체의 비동기 이터레이터
+        :rtype: AsyncIterator[CoreModel]
+        :raises DataNotFoundException: 요청한 데이터를 찾을 수 없는 경우
+
+        **사용례**::
+
+            async with AsyncSession("API_KEY") as sess:
+                async for school in SchoolInfoBuilder().aiter(sess, prefetch=2):
+                    print(school.name)
         """
-        return tuple(
-            self._model.from_dict(i)
-            for i in await sess.get(self._service, limit=self._limit, **self._param)
+        pages = sess.iter_pages(
+            self._service,
+            limit=self._limit,
+            prefetch=prefetch,
+            parse=self._model.from_dict,
+            **self._param,
         )
+        try:
+            async for models in pages:
+                for model in models:
+                    yield model
+        finally:
+            await pages.aclose()
 
     @abstractmethod
     def __rrshift__(self, other) -> CoreBuilder:
@@ -192,3 +296,254 @@ class CoreBuilder(metaclass=ABCMeta):
         """
         self._limit = limit
         return self
+
+    @staticmethod
+    def fetch_many(
+        sess: SyncSession, builders: Iterable[CoreBuilder]
+    ) -> list[tuple[CoreModel, ...]]:
+        """
+        동기 세션을 사용하여 여러 빌더의 데이터를 한 번에 조회합니다.
+
+        같은 서비스와 학교에 대한 일자별 질의는 `QueryPlanner`로 합쳐서 요청합니다.
+
+        :param sess: 데이터를 조회할 동기 세션
+        :type sess: SyncSession
+        :param builders: 조회할 빌더 목록
+        :type builders: Iterable[CoreBuilder]
+        :return: 빌더 순서대로 조회된 모델 튜플 목록 (데이터가 없는 경우 빈 튜플)
+        :rtype: list[tuple[CoreModel, ...]]
+        """
+        return QueryPlanner(builders).fetch(sess)
+
+    @staticmethod
+    async def fetch_many_async(
+        sess: AsyncSession, builders: Iterable[CoreBuilder]
+    ) -> list[tuple[CoreModel, ...]]:
+        """
+        비동기 세션을 사용하여 여러 빌더의 데이터를 한 번에 조회합니다.
+
+        같은 서비스와 학교에 대한 일자별 질의는 `QueryPlanner`로 합쳐서 요청합니다.
+
+        :param sess: 데이터를 조회할 비동기 세션
+        :type sess: AsyncSession
+        :param builders: 조회할 빌더 목록
+        :type builders: Iterable[CoreBuilder]
+        :return: 빌더 순서대로 조회된 모델 튜플 목록 (데이터가 없는 경우 빈 튜플)
+        :rtype: list[tuple[CoreModel, ...]]
+        """
+        return await QueryPlanner(builders).fetch_async(sess)
+
+
+@dataclass
+class _Planned:
+    """
+    실제로 요청할 질의 하나와, 그 결과를 나누어 받을 빌더들입니다.
+    """
+
+    service: Services
+    params: dict[str, Any]
+    members: list[tuple[int, date | None, date | None]]
+    """(빌더 순서, 시작 일자, 종료 일자) 목록, 결과를 나누지 않는 경우 일자는 None"""
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class QueryPlanner:
+    """
+    여러 빌더의 질의를 모아, 일자 범위가 겹치거나 이어지는 질의를 하나의 범위
+    질의로 합쳐서 요청하는 계획기입니다.
+
+    일자별 데이터를 제공하는 서비스(급식, 학사일정, 시간표)의 질의 중 서비스와
+    일자 이외의 매개변수(학교, 식사 코드 등)가 같은 질의끼리 일자 범위를 정렬하여
+    겹치거나 맞닿은 범위를 합치고, 합친 범위를 시작/종료 일자 매개변수로 한 번만
+    요청합니다. 응답의 레코드는 한 번만 모델로 변환되며, 각 빌더에는 자신이 요청한
+    범위에 해당하는 레코드만 나누어 반환됩니다. 합친 질의들은 세션의 `get_many`로
+    함께 요청됩니다.
+
+    일자별 데이터가 아닌 서비스, `limit`이 설정된 빌더, 범위가 열려 있는 질의는
+    합치지 않고 그대로 요청합니다.
+
+    **사용례**::
+
+        # 아직 급식 빌더가 없으므로, 급식 서비스를 조회하는 빌더를 직접 정의
+        class MealBuilder(CoreBuilder):
+            _service = Services.MEALS
+            _model = Meal  # CoreModel을 상속한 급식 모델
+
+            def __rrshift__(self, other):
+                return self
+
+            def day(self, day: str) -> MealBuilder:
+                self._param.update(school, MLSV_YMD=day)
+                return self
+
+        # 한 달 동안의 일별 급식 질의 30개가 범위 질의 1개로 합쳐짐
+        planner = QueryPlanner(MealBuilder().day(day) for day in days)
+        with SyncSession("API_KEY") as sess:
+            for day, meals in zip(days, planner.fetch(sess)):
+                print(day, len(meals))
+    """
+
+    def __init__(
+        self, builders: Iterable[CoreBuilder] = (), *, max_days: int | None = None
+    ):
+        """
+        QueryPlanner 인스턴스를 초기화합니다.
+
+        :param builders: 조회할 빌더 목록
+        :type builders: Iterable[CoreBuilder]
+        :param max_days: 하나로 합칠 범위의 최대 일수 (None인 경우 제한하지 않음)
+        :type max_days: int 또는 None
+        """
+        self._builders: list[CoreBuilder] = []
+        self._max_days = max_days
+        for builder in builders:
+            self.add(builder)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def add(self, builder: CoreBuilder) -> QueryPlanner:
+        """
+        조회할 빌더를 추가합니다. 빌더의 현재 매개변수가 복사되어 사용됩니다.
+
+        :param builder: 조회할 빌더
+        :type builder: CoreBuilder
+        :return: 메서드 체이닝을 위한 계획기 인스턴스
+        :rtype: QueryPlanner
+        """
+        self._builders.append(builder.copy())
+        return self
+
+    def plan(self) -> list[tuple[Services, dict[str, Any]]]:
+        """
+        실제로 요청할 질의 목록을 반환합니다.
+
+        :return: (서비스, 매개변수) 튜플 목록
+        :rtype: list[tuple[Services, dict[str, Any]]]
+        """
+        return [(planned.service, planned.params) for planned in self._plan()]
+
+    def fetch(self, sess: SyncSession) -> list[tuple[CoreModel, ...]]:
+        """
+        동기 세션을 사용하여 모든 빌더의 데이터를 조회합니다.
+
+        :param sess: 데이터를 조회할 동기 세션
+        :type sess: SyncSession
+        :return: 빌더를 추가한 순서대로 조회된 모델 튜플 목록 (데이터가 없는 경우 빈 튜플)
+        :rtype: list[tuple[CoreModel, ...]]
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        """
+        plan = self._plan()
+        results = sess.get_many(
+            [(planned.service, planned.params) for planned in plan],
+            return_exceptions=True,
+        )
+        return self._distribute(plan, results)
+
+    async def fetch_async(self, sess: AsyncSession) -> list[tuple[CoreModel, ...]]:
+        """
+        비동기 세션을 사용하여 모든 빌더의 데이터를 조회합니다.
+
+        :param sess: 데이터를 조회할 비동기 세션
+        :type sess: AsyncSession
+        :return: 빌더를 추가한 순서대로 조회된 모델 튜플 목록 (데이터가 없는 경우 빈 튜플)
+        :rtype: list[tuple[CoreModel, ...]]
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        """
+        plan = self._plan()
+        results = await sess.get_many(
+            [(planned.service, planned.params) for planned in plan],
+            return_exceptions=True,
+        )
+        return self._distribute(plan, results)
+
+    def _plan(self) -> list[_Planned]:
+        """
+        빌더의 질의를 합쳐서 실제로 요청할 질의 목록을 만듭니다.
+        """
+        plan = []
+        groups: dict[tuple, tuple[dict, list]] = {}
+        for index, builder in enumerate(self._builders):
+            svc, params = builder._service, builder._param
+            fields = DATE_FIELDS.get(svc)
+            start, end = (None, None) if fields is None else date_range(svc, params)
+            # 합칠 수 없는 질의는 그대로 요청
+            if builder._limit is not None or start is None or end is None:
+                if builder._limit is not None:
+                    params = {**params, "limit": builder._limit}
+                plan.append(_Planned(svc, dict(params), [(index, None, None)]))
+                continue
+            others = {
+                k: v
+                for k, v in params.items()
+                if k not in (fields.start, fields.end, fields.day)
+            }
+            key = (svc, tuple(sorted((k, str(v)) for k, v in others.items())))
+            groups.setdefault(key, (others, []))[1].append((start, end, index))
+
+        for (svc, _), (others, spans) in groups.items():
+            fields = DATE_FIELDS[svc]
+            spans.sort()
+            # 겹치거나 맞닿은 범위를 합침
+            merged: list[list] = []
+            for start, end, index in spans:
+                if merged:
+                    first, last, members = merged[-1]
+                    joined = max(last, end)
+                    if start <= last + timedelta(days=1) and (
+                        self._max_days is None or (joined - first).days < self._max_days
+                    ):
+                        merged[-1][1] = joined
+                        members.append((index, start, end))
+                        continue
+                merged.append([start, end, [(index, start, end)]])
+            for start, end, members in merged:
+                # 합쳐지지 않은 질의는 캐시를 공유할 수 있도록 원래 매개변수로 요청
+                if len(members) == 1:
+                    index = members[0][0]
+                    params = dict(self._builders[index]._param)
+                    plan.append(_Planned(svc, params, [(index, None, None)]))
+                    continue
+                params = {
+                    **others,
+                    fields.start: start.strftime("%Y%m%d"),
+                    fields.end: end.strftime("%Y%m%d"),
+                }
+                plan.append(_Planned(svc, params, members))
+        return plan
+
+    def _distribute(
+        self, plan: list[_Planned], results: dict[int, list[dict] | Exception]
+    ) -> list[tuple[CoreModel, ...]]:
+        """
+        요청한 질의의 결과를 각 빌더가 요청한 범위로 나눕니다.
+        """
+        output: list[tuple[CoreModel, ...]] = [()] * len(self._builders)
+        for position, planned in enumerate(plan):
+            records = results[position]
+            # 데이터가 없는 경우 빈 튜플 (가령, 휴일)
+            if isinstance(records, DataNotFoundException):
+                continue
+            if isinstance(records, Exception):
+                raise records
+            model = self._builders[planned.members[0][0]]._model
+            day = (
+                DATE_FIELDS[planned.service].day
+                if planned.service in DATE_FIELDS
+                else None
+            )
+            # 레코드는 한 번만 변환하고, 범위가 겹치는 빌더끼리 공유
+            parsed = [(record.get(day), model.from_dict(record)) for record in records]
+            for index, start, end in planned.members:
+                if start is None:
+                    output[index] = tuple(item for _, item in parsed)
+                    continue
+                low, high = start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
+                output[index] = tuple(
+                    item for stamp, item in parsed if stamp and low <= stamp <= high
+                )
+        return output
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
+from __future__ import annotations
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
-from ..utils.region import Region
+from ..http.service import Services
+from ..region import Region
 from .common import SchoolCategory, Timing
+from .core import CoreBuilder, CoreModel
 
 __all__ = [
     "SchoolCategory",
@@ -17,6 +20,7 @@ __all__ = [
     "AdmissionPeriod",
     "GenderComposition",
     "SchoolInfo",
+    "SchoolInfoBuilder",
 ]
 
 
@@ -130,7 +134,7 @@ class GenderComposition(Enum):
 # noinspection GrazieInspection
 # PyCharm IDE의 오탈자/문법 관련 기능을 무시
 @dataclass(frozen=True)
-class SchoolInfo:
+class SchoolInfo(CoreModel):
     """
     학교 기본 정보를 나타내는 데이터 클래스입니다.
     """
@@ -179,3 +183,217 @@ class SchoolInfo:
     """설립 일자"""
     anniversary: date
     """개교 기념일"""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SchoolInfo:
+        """
+        학교 기본 정보 응답 레코드로부터 모델 객체를 생성합니다.
+
+        :param data: 학교 기본 정보 응답 레코드
+        :type data: dict
+        :return: 생성된 학교 기본 정보
+        :rtype: SchoolInfo
+        :raises ValueError: 처리할 수 없는 구분명이 포함된 경우
+        """
+        # 학교 종류명
+        match data["SCHUL_KND_SC_NM"]:
+            case "초등학교":
+                school_category = SchoolCategory.ELEMENTARY
+            case "중학교":
+                school_category = SchoolCategory.MIDDLE
+            case "고등학교":
+                school_category = SchoolCategory.HIGH
+            case "방송통신중학교":
+                school_category = SchoolCategory.SEC_MID
+            case "방송통신고등학교":
+                school_category = SchoolCategory.SEC_HIGH
+            case "각종학교(초)":
+                school_category = SchoolCategory.MISC_ELE
+            case "각종학교(중)":
+                school_category = SchoolCategory.MISC_MID
+            case "각종학교(고)":
+                school_category = SchoolCategory.MISC_HIGH
+            case "특수학교":
+                school_category = SchoolCategory.SPECIAL
+            case _:
+                school_category = SchoolCategory.OTHERS
+        # 설립명
+        match data["FOND_SC_NM"]:
+            case "공립":
+                foundation_type = FoundationType.PUBLIC
+            case "사립":
+                foundation_type = FoundationType.PRIVATE
+            case "국립":
+                foundation_type = FoundationType.NATIONAL
+            case _:
+                foundation_type = FoundationType.OTHERS
+        # 남녀공학 구분명
+        match data["COEDU_SC_NM"]:
+            case "남여공학":
+                gender_composition = GenderComposition.MIXED
+            case "남":
+                gender_composition = GenderComposition.BOYS_ONLY
+            case "여":
+                gender_composition = GenderComposition.GIRLS_ONLY
+            case _ as v:
+                raise ValueError(f"처리할 수 없는 남녀공학 구분명: {v}")
+        # 고등학교 구분명 (고등학교가 아닌 경우 None)
+        match data.get("HS_SC_NM"):
+            case "일반고":
+                subtype = HighSchoolSubtype.NORMAL
+            case "특성화고":
+                subtype = HighSchoolSubtype.SPECIALIZED
+            case "특목고":
+                subtype = HighSchoolSubtype.SPECIAL_PURPOSE
+            case "자율고":
+                subtype = HighSchoolSubtype.AUTONOMOUS
+            case "기타":
+                subtype = HighSchoolSubtype.OTHERS
+            case _:
+                subtype = None
+        # 고등학교 일반 전문 구분명 (고등학교가 아닌 경우 None)
+        match data.get("HS_GNRL_BUSNS_SC_NM"):
+            case "일반계":
+                high_school_category = HighSchoolCategory.NORMAL
+            case "전문계":
+                high_school_category = HighSchoolCategory.VOCATIONAL
+            case _:
+                high_school_category = None
+        # 특수 목적 고등학교 계열명 (특수 목적 고등학교가 아닌 경우 None)
+        match data.get("SPCLY_PURPS_HS_ORD_NM"):
+            case "국제계열":
+                purpose = SchoolPurpose.INTERNATIONAL
+            case "체육계열":
+                purpose = SchoolPurpose.PHYSICAL
+            case "예술계열":
+                purpose = SchoolPurpose.ART
+            case "과학계열":
+                purpose = SchoolPurpose.SCIENCE
+            case "외국어계열":
+                purpose = SchoolPurpose.LANGUAGE
+            case "산업수요맞춤형":
+                purpose = SchoolPurpose.INDUSTRY
+            case _:
+                purpose = None
+        # 입시 전후기 구분명
+        match data["ENE_BFE_SEHF_SC_NM"]:
+            case "전기":
+                admission_period = AdmissionPeriod.EARLY
+            case "후기":
+                admission_period = AdmissionPeriod.LATE
+            case "전후기":
+                admission_period = AdmissionPeriod.BOTH
+            case _ as v:
+                raise ValueError(f"처리할 수 없는 입시 전후기 구분명: {v}")
+        # 주야 구분명
+        match data["DGHT_SC_NM"]:
+            case "주간":
+                timing = Timing.DAY
+            case "야간":
+                timing = Timing.NIGHT
+            case "주야":
+                timing = Timing.BOTH
+            case _ as v:
+                raise ValueError(f"처리할 수 없는 주야 구분명: {v}")
+        return cls(
+            region=Region(data["ATPT_OFCDC_SC_CODE"]),
+            code=data["SD_SCHUL_CODE"],
+            name=data["SCHUL_NM"],
+            english_name=_optional(data, "ENG_SCHUL_NM"),
+            school_category=school_category,
+            jurisdiction_name=data["JU_ORG_NM"],
+            foundation_type=foundation_type,
+            zip_code=_optional(data, "ORG_RDNZC"),
+            address=_optional(data, "ORG_RDNMA"),
+            address_detail=_optional(data, "ORG_RDNDA"),
+            tel_number=data["ORG_TELNO"],
+            website=_optional(data, "HMPG_ADRES"),
+            gender_composition=gender_composition,
+            fax_number=_optional(data, "ORG_FAXNO"),
+            subtype=subtype,
+            industry_supports=data.get("INDST_SPECL_CCCCL_EXST_YN") == "Y",
+            high_school_category=high_school_category,
+            purpose=purpose,
+            admission_period=admission_period,
+            timing=timing,
+            founded_date=datetime.strptime(data["FOND_YMD"], "%Y%m%d").date(),
+            anniversary=datetime.strptime(data["FOAS_MEMRD"], "%Y%m%d").date(),
+        )
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class SchoolInfoBuilder(CoreBuilder):
+    """
+    학교 기본 정보를 조회하는 query를 구성하는 빌더 클래스입니다.
+
+    **사용례**::
+
+        builder = SchoolInfoBuilder().region(Region.GYEONGGI).name("가상고등학교")
+        with SyncSession("API_KEY") as sess:
+            schools = builder >> sess
+    """
+
+    _service = Services.SCHOOL_INFO
+    _model = SchoolInfo
+
+    def __rrshift__(self, other) -> SchoolInfoBuilder:
+        """
+        >> 연산자를 통해 학교 기본 정보 또는 시도 교육청으로부터 파라미터를 상속받습니다.
+
+        :param other: 파라미터를 상속받을 학교 기본 정보 또는 시도 교육청
+        :type other: SchoolInfo 또는 Region
+        :return: 파라미터가 업데이트된 빌더 인스턴스
+        :rtype: SchoolInfoBuilder
+        :raises TypeError: 지원되지 않는 타입의 객체가 전달된 경우
+        """
+        if isinstance(other, SchoolInfo):
+            return self.region(other.region).code(other.code)
+        elif isinstance(other, Region):
+            return self.region(other)
+        raise TypeError(f"unsupported operand type(s) for >>: '{type(other)}'")
+
+    def region(self, region: Region) -> SchoolInfoBuilder:
+        """
+        조회할 학교의 시도 교육청을 설정합니다.
+
+        :param region: 시도 교육청
+        :type region: Region
+        :return: 메서드 체이닝을 위한 빌더 인스턴스
+        :rtype: SchoolInfoBuilder
+        """
+        self._param["ATPT_OFCDC_SC_CODE"] = region.value
+        return self
+
+    def code(self, code: str) -> SchoolInfoBuilder:
+        """
+        조회할 학교의 행정 표준 코드를 설정합니다.
+
+        :param code: 행정 표준 코드
+        :type code: str
+        :return: 메서드 체이닝을 위한 빌더 인스턴스
+        :rtype: SchoolInfoBuilder
+        """
+        self._param["SD_SCHUL_CODE"] = code
+        return self
+
+    def name(self, name: str) -> SchoolInfoBuilder:
+        """
+        조회할 학교명을 설정합니다.
+
+        :param name: 학교명
+        :type name: str
+        :return: 메서드 체이닝을 위한 빌더 인스턴스
+        :rtype: SchoolInfoBuilder
+        """
+        self._param["SCHUL_NM"] = name
+        return self
+
+
+def _optional(data: dict, key: str) -> str | None:
+    """
+    레코드의 값이 비어 있는 경우 None을 반환합니다.
+    """
+    value = data.get(key)
+    return value if value and value.strip() else None
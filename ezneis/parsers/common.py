@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from abc import ABCMeta, abstractmethod
+from typing import Any
+
+__all__ = ["Parser"]
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class Parser(metaclass=ABCMeta):
+    """
+    API 응답 레코드를 모델 객체로 변환하는 파서의 기본이 되는 추상 클래스입니다.
+    """
+
+    @classmethod
+    @abstractmethod
+    def from_json(cls, data: dict) -> Any:
+        """
+        API 응답 레코드로부터 모델 객체를 생성합니다.
+
+        :param data: NEIS Open API의 응답 레코드
+        :type data: dict
+        :return: 생성된 모델 객체
+        :rtype: Any
+        """
+        pass
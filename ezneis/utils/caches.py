@@ -1,21 +1,38 @@
 # -*- coding: utf-8 -*-
 from collections import OrderedDict
-from functools import wraps
+from dataclasses import dataclass
+from functools import partial, wraps
+from heapq import heapify, heappop, heappush
 from inspect import iscoroutinefunction
+from itertools import count, islice
+from threading import Lock
 from time import time
+from typing import Callable
+from .metrics import REGISTRY, MetricsRegistry
+import asyncio
+import random
+import sys
 
-__all__ = ["ttl_cache"]
+__all__ = ["ttl_cache", "CacheStats", "estimate_size"]
+
+# 위치 인자와 키워드 인자를 구분하는 표식
+_KWARGS_MARK = object()
+
+# 용량 초과 시 삭제할 항목을 고를 때 살펴볼 가장 오래 사용하지 않은 항목 수
+_EVICTION_SAMPLE = 5
 
 
 # noinspection SpellCheckingInspection
 # noinspection GrazieInspection
 # PyCharm IDE의 오탈자/문법 관련 기능을 무시
-def _deep_freeze(value: dict | list | set):
+def _deep_freeze(value):
     """
     입력 값을 재귀적으로 해시 가능한 형태로 변환합니다.
 
-    변경 가능한(mutable) 자료형들을 재귀적으로 순회, 모두 튜플로 변환하여
-    변경 불가능한 상태(immutable)로 만듭니다.
+    변경 가능한(mutable) 자료형들을 재귀적으로 순회하며, 순서가 있는 자료형(리스트,
+    튜플)은 튜플로, 순서가 없는 자료형(딕셔너리, 집합)은 frozenset으로 변환하여
+    변경 불가능한 상태(immutable)로 만듭니다. 따라서 `[1, 2]`와 `[2, 1]`은 서로 다른
+    값으로 변환됩니다.
 
     :param value: 해시 가능한 형태로 변환할 입력 값.
     :return: 해시 가능한 형태로 변환된 입력 값.
@@ -23,7 +40,9 @@ def _deep_freeze(value: dict | list | set):
 
     if isinstance(value, dict):
         return frozenset((key, _deep_freeze(val)) for key, val in value.items())
-    elif isinstance(value, (list, set)):
+    elif isinstance(value, (list, tuple)):
+        return tuple(_deep_freeze(x) for x in value)
+    elif isinstance(value, (set, frozenset)):
         return frozenset(_deep_freeze(x) for x in value)
     return value
 
@@ -31,90 +50,449 @@ def _deep_freeze(value: dict | list | set):
 # noinspection SpellCheckingInspection
 # noinspection GrazieInspection
 # PyCharm IDE의 오탈자/문법 관련 기능을 무시
-def ttl_cache(ttl: int, maxsize: int = 64, is_method: bool = False):
+def estimate_size(value: object) -> int:
+    """
+    객체가 차지하는 메모리 크기(바이트)를 추정합니다.
+
+    `sys.getsizeof`로 객체 자신의 크기를 구하고, 컨테이너(튜플, 리스트, 딕셔너리,
+    집합)의 원소와 일반 객체(데이터 클래스 등)의 속성을 재귀적으로 더합니다. 여러 번
+    참조된 객체는 한 번만 셉니다. 모델 튜플이나 레코드 목록처럼 캐시에 저장되는
+    값의 크기를 비교하는 용도이며, 정확한 값은 아닙니다.
+
+    :param value: 크기를 추정할 객체
+    :return: 추정 크기(바이트)
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            # 일반 객체는 __dict__ 또는 __slots__의 속성을 포함
+            attrs = getattr(obj, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+            for name in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+    return total
+
+
+class _HashedKey(list):
+    """
+    해시 값을 한 번만 계산하여 저장하는 캐시 키입니다.
+
+    딕셔너리 조회 시 튜플의 해시 값을 매번 다시 계산하지 않도록 합니다.
+    (`functools.lru_cache`와 같은 방식)
+    """
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, items: tuple):
+        self._hash = hash(items)
+        self[:] = items
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+def _make_key(args: tuple, kwargs: dict) -> _HashedKey:
+    """
+    함수의 인자로부터 캐시 키를 생성합니다.
+
+    위치 인자는 순서를 유지하고, 키워드 인자는 이름 순으로 정렬하여 전달 순서와
+    관계없이 같은 키가 되도록 합니다. 모든 인자가 해시 가능한 경우 인자를 그대로
+    사용하며, 해시할 수 없는 인자(딕셔너리, 리스트 등)가 있는 경우에만
+    `_deep_freeze`로 변환합니다.
+
+    :param args: 위치 인자
+    :param kwargs: 키워드 인자
+    :return: 캐시 키
+    """
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK, *sorted(kwargs.items()))
+    try:
+        return _HashedKey(key)
+    except TypeError:
+        return _HashedKey(_deep_freeze(key))
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    `ttl_cache`로 데코레이팅된 함수의 캐시 통계입니다.
+    """
+
+    hits: int
+    """캐시 적중 횟수"""
+    misses: int
+    """캐시 실패 횟수"""
+    evictions: int
+    """만료되거나 공간이 부족하여 삭제된 항목 수"""
+    size: int
+    """현재 저장된 항목 수"""
+    maxsize: int
+    """저장할 수 있는 최대 항목 수"""
+    nbytes: int
+    """현재 저장된 항목의 크기 합계(바이트), 크기 제한이 없는 경우 0"""
+    maxbytes: int | None
+    """저장할 수 있는 항목의 최대 크기 합계(바이트)"""
+
+
+class _TTLStore:
+    """
+    `ttl_cache`의 저장소입니다.
+
+    항목은 최근 사용 순서를 유지하는 OrderedDict에, 삭제 시각은 힙에 함께 저장하여
+    만료된 항목을 전체 순회 없이 만료 시각 순으로 삭제합니다. 이미 삭제되었거나 다시
+    저장된 항목의 힙 기록은 꺼낼 때 무시하고, 힙이 항목 수에 비해 지나치게 커지면
+    다시 구성합니다.
+
+    만료된 항목은 `grace`초 동안 더 보관되어, 갱신 중이거나 갱신에 실패한 경우
+    이전 값을 반환하는 데 사용됩니다.
+
+    `maxbytes`가 설정된 경우 항목마다 `sizeof`로 크기를 구하여 합계를 유지하고,
+    합계가 넘치면 가장 오래 사용하지 않은 몇 개의 항목 중 가장 큰 항목부터
+    삭제합니다. 최근에 사용한 항목은 삭제 대상이 되지 않으면서도, 큰 항목 하나를
+    위해 작은 항목 여럿이 밀려나지 않습니다. `maxbytes`보다 큰 값은 저장하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int,
+        name: str,
+        metrics,
+        grace: float = 0.0,
+        jitter: float = 0.0,
+        maxbytes: int | None = None,
+        sizeof: Callable[[object], int] = estimate_size,
+    ):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._nbytes = 0
+        self._name = name
+        self._metrics = metrics
+        self._grace = grace
+        self._jitter = jitter
+        self._entries: OrderedDict = OrderedDict()
+        self._heap: list = []
+        self._sequence = count()
+        self._lock = Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key: _HashedKey, now: float) -> tuple | None:
+        """
+        캐시 키에 해당하는 항목을 반환합니다.
+
+        만료되었지만 아직 보관 중인 항목도 반환되며, 이 경우 캐시 실패로 집계됩니다.
+
+        :return: (값, 만료 시각, 일련번호, 크기) 튜플, 없는 경우 None
+        """
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                self._misses += 1
+                if self._metrics is not None:
+                    self._metrics[1].inc(self._name)
+                return entry
+            self._entries.move_to_end(key)
+            self._hits += 1
+            if self._metrics is not None:
+                self._metrics[0].inc(self._name)
+            return entry
+
+    def put(self, key: _HashedKey, value: object, now: float):
+        """
+        캐시 키에 값을 저장합니다.
+
+        `jitter`가 설정된 경우 유효 기간을 최대 그 비율만큼 무작위로 줄여, 함께
+        저장된 항목들이 한꺼번에 만료되지 않도록 합니다.
+        """
+        ttl = self._ttl
+        if self._jitter:
+            ttl *= 1 - self._jitter * random.random()
+        expires = now + ttl
+        sequence = next(self._sequence)
+        size = 0 if self._maxbytes is None else self._sizeof(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[3]
+            # 크기 제한보다 큰 값은 저장하지 않음
+            if self._maxbytes is not None and size > self._maxbytes:
+                return
+            self._entries[key] = (value, expires, sequence, size)
+            self._nbytes += size
+            heappush(self._heap, (expires + self._grace, sequence, key))
+            # 저장 공간이 가득찬 경우, 가장 오래 사용하지 않은 항목 삭제
+            while len(self._entries) > self._maxsize:
+                _, entry = self._entries.popitem(last=False)
+                self._nbytes -= entry[3]
+                self._evict("size")
+            # 크기 합계가 넘치는 경우, 오래 사용하지 않은 항목 중 큰 항목부터 삭제
+            # (방금 저장한 항목은 제외하며, 그 크기는 제한 이하이므로 후보는 항상 있음)
+            while self._maxbytes is not None and self._nbytes > self._maxbytes:
+                others = (item for item in self._entries.items() if item[0] != key)
+                candidates = islice(others, _EVICTION_SAMPLE)
+                victim = max(candidates, key=lambda item: item[1][3])[0]
+                self._nbytes -= self._entries.pop(victim)[3]
+                self._evict("bytes")
+            # 무시할 기록이 쌓여 힙이 지나치게 커진 경우 다시 구성
+            if len(self._heap) > 2 * self._maxsize + 16:
+                self._heap = [
+                    (entry[1] + self._grace, entry[2], k)
+                    for k, entry in self._entries.items()
+                ]
+                heapify(self._heap)
+
+    def clear(self):
+        """
+        저장된 모든 항목과 통계를 삭제합니다.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        캐시 통계를 반환합니다.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self._maxsize,
+                nbytes=self._nbytes,
+                maxbytes=self._maxbytes,
+            )
+
+    def _expire(self, now: float):
+        """
+        보관 기간이 지난 항목을 삭제 시각 순으로 삭제합니다. 잠금을 획득한 상태에서
+        호출해야 합니다.
+        """
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, sequence, key = heappop(heap)
+            entry = self._entries.get(key)
+            # 이미 삭제되었거나 다시 저장된 항목의 기록은 무시
+            if entry is not None and entry[2] == sequence:
+                del self._entries[key]
+                self._nbytes -= entry[3]
+                self._evict("expired")
+
+    def _evict(self, reason: str):
+        """
+        삭제된 항목 수를 기록합니다.
+        """
+        self._evictions += 1
+        if self._metrics is not None:
+            self._metrics[2].inc(self._name, reason)
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+def ttl_cache(
+    ttl: int,
+    maxsize: int = 64,
+    is_method: bool = False,
+    metrics: MetricsRegistry | None = REGISTRY,
+    *,
+    stale_while_revalidate: float = 0,
+    stale_if_error: float = 0,
+    jitter: float = 0,
+    maxbytes: int | None = None,
+    sizeof: Callable[[object], int] = estimate_size,
+):
     """
     TTL(Time-To-Live) 캐시를 구현한 데코레이터입니다.
 
     함수의 반환 값을 캐싱하여 설정된 기간 동안 재사용하며, 설정된 기간이 지난 후
-    다음 호출 시 자동으로 삭제됩니다.
+    다음 호출 시 자동으로 삭제됩니다. 만료된 항목은 만료 시각 순으로 삭제되므로,
+    캐시 크기와 관계없이 조회 비용이 일정하게 유지됩니다.
 
-    또한, 최대 캐시 크기를 설정하여 메모리 사용을 제한할 수 있습니다.
+    또한, 최대 캐시 크기를 설정하여 메모리 사용을 제한할 수 있으며, 가득찬 경우
+    가장 오래 사용하지 않은 항목부터 삭제됩니다. 항목마다 크기가 크게 다른 경우
+    `maxbytes`로 항목 크기의 합계를 제한할 수 있으며, 합계가 넘치면 오래 사용하지
+    않은 항목 중 큰 항목부터 삭제됩니다. 항목의 크기는 기본적으로 `estimate_size`로
+    추정하며, `sizeof`에 직렬화한 길이를 반환하는 함수 등을 지정할 수 있습니다.
 
     마지막으로, 클래스의 메소드인 경우 args의 첫번째를 생략합니다.
 
-    이 데코레이터는 동기 및 비동기 함수 모두에 사용할 수 있습니다.
+    이 데코레이터는 동기 및 비동기 함수 모두에 사용할 수 있습니다. 비동기 함수의
+    경우 같은 인자로 동시에 호출된 코루틴들은 함수를 한 번만 실행하고 그 결과를
+    함께 기다리므로, 자주 사용되는 항목이 만료되더라도 요청이 한꺼번에 몰리지
+    않습니다.
+
+    `stale_while_revalidate`가 설정된 비동기 함수는 만료 후 그 기간 안에 호출되면
+    이전 값을 바로 반환하고 백그라운드에서 한 번만 갱신합니다. `stale_if_error`가
+    설정된 경우, 만료 후 그 기간 안에 함수가 예외를 발생시키면 예외 대신 이전 값을
+    반환합니다. `jitter`는 항목마다 유효 기간을 최대 그 비율만큼 무작위로 줄여
+    만료 시점을 분산시킵니다.
+
+    데코레이팅된 함수는 캐시 통계를 반환하는 `stats()`와 캐시를 비우는 `clear()`
+    메소드를 가집니다.
+
+    캐시 적중, 실패, 삭제 횟수는 함수 이름을 `function` 레이블로 하여 `metrics`에
+    기록됩니다. (`ezneis_ttl_cache_hits_total`, `ezneis_ttl_cache_misses_total`,
+    `ezneis_ttl_cache_evictions_total`, 삭제 원인은 `expired`, `size`, `bytes`)
 
     :param ttl: 캐시의 유효 기간(초), 0일 경우 캐싱이 비활성화됩니다.
     :param maxsize: 캐시가 저장될 최대 스택 크기.
     :param is_method: 데코레이팅하는 함수가 클래스의 메소드인지 여부.
+    :param metrics: 캐시 지표를 기록할 저장소, None일 경우 기록하지 않습니다.
+    :param stale_while_revalidate: 만료 후 이전 값을 반환하며 백그라운드에서 갱신할
+        기간(초), 비동기 함수에만 적용됩니다.
+    :param stale_if_error: 만료 후 갱신에 실패했을 때 이전 값을 반환할 기간(초).
+    :param jitter: 유효 기간을 무작위로 줄일 최대 비율 (0 ~ 1).
+    :param maxbytes: 저장할 항목 크기의 최대 합계(바이트), None일 경우 제한하지 않습니다.
+    :param sizeof: 항목의 크기(바이트)를 구하는 함수, `maxbytes`가 설정된 경우에만
+        사용됩니다.
     :return: Time-To-Live 캐시 데코레이터.
+
+    **사용례**::
+
+        @ttl_cache(ttl=3600, maxsize=128)
+        def get_school(code: str) -> dict:
+            ...
+
+        get_school.stats()   # CacheStats(hits=..., misses=..., ...)
+        get_school.clear()
+
+        # 항목 수와 관계없이 약 32MiB까지만 저장
+        @ttl_cache(ttl=86400, maxsize=4096, maxbytes=32 * 1024 * 1024)
+        def get_timetable(region: str, date: str) -> tuple:
+            ...
+
+        # 만료 후 10분간은 이전 값을 반환하며 갱신하고, 장애 시 하루 동안 이전 값 사용
+        @ttl_cache(3600, stale_while_revalidate=600, stale_if_error=86400, jitter=0.1)
+        async def get_meals(code: str, date: str) -> list:
+            ...
     """
+    counters = None
+    if metrics is not None:
+        counters = (
+            metrics.counter(
+                "ezneis_ttl_cache_hits_total", "ttl_cache 적중 횟수", ("function",)
+            ),
+            metrics.counter(
+                "ezneis_ttl_cache_misses_total", "ttl_cache 실패 횟수", ("function",)
+            ),
+            metrics.counter(
+                "ezneis_ttl_cache_evictions_total",
+                "ttl_cache에서 삭제된 항목 수 (expired, size 또는 bytes)",
+                ("function", "reason"),
+            ),
+        )
 
     def decorator(func):
-        cache = OrderedDict()
+        name = f"{func.__module__}.{func.__qualname__}"
+        # stale-while-revalidate는 비동기 함수에만 적용
+        revalidate = stale_while_revalidate if iscoroutinefunction(func) else 0
+        store = _TTLStore(
+            ttl,
+            maxsize,
+            name,
+            counters,
+            grace=max(revalidate, stale_if_error),
+            jitter=jitter,
+            maxbytes=maxbytes,
+            sizeof=sizeof,
+        )
+        # 키별로 실행 중인 작업 (비동기 함수 전용)
+        inflight: dict[_HashedKey, asyncio.Task] = {}
+        # 클래스 메소드인 경우 args 첫번째 생략
+        skip = 1 if is_method else 0
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            # 파라미터를 키로 사용하기 위해 해시 가능하도록 변환
-            if is_method:
-                # 클래스 메소드인 경우 args 첫번째 생략
-                t_args = _deep_freeze([args[1:], kwargs])
-            else:
-                t_args = _deep_freeze([args, kwargs])
             # 캐시가 비활성화된 경우, 함수 실행 및 결과 반환
             if ttl == 0:
                 return func(*args, **kwargs)
-            # 현재 시간 저장
-            current = time()
-            # 만료된 캐시 삭제
-            keys = [k for k, (_, t) in cache.items() if current - t > ttl]
-            for key in keys:
-                del cache[key]
+            # 파라미터를 키로 사용하기 위해 해시 가능하도록 변환
+            key = _make_key(args[skip:], kwargs)
             # 캐시 히트 검사
-            if t_args in cache:
-                result, timestamp = cache.pop(t_args)
-                if current - timestamp < ttl:
-                    cache[t_args] = (result, timestamp)
-                    return result
+            now = time()
+            entry = store.get(key, now)
+            if entry is not None and entry[1] > now:
+                return entry[0]
             # 캐시 히트에 실패한 경우, 함수 실행
-            result = func(*args, **kwargs)
-            cache[t_args] = (result, current)
-            # 스택이 가득찬 경우, 가장 오래된 캐시 삭제
-            if len(cache) > maxsize:
-                cache.popitem(last=False)
-            # 결과 반환
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                # 갱신에 실패한 경우 허용 기간 안이면 이전 값 반환
+                if entry is not None and now < entry[1] + stale_if_error:
+                    return entry[0]
+                raise
+            store.put(key, result, time())
             return result
 
+        def settle(key: _HashedKey, task: asyncio.Task):
+            # 실행이 끝난 작업을 정리하고, 성공한 경우 결과를 저장
+            if inflight.get(key) is task:
+                del inflight[key]
+            if not task.cancelled() and task.exception() is None:
+                store.put(key, task.result(), time())
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            nonlocal ttl
-            # 파라미터를 키로 사용하기 위해 해시 가능하도록 변환
-            t_args = _deep_freeze([args, kwargs])
             # 캐시가 비활성화된 경우, 함수 실행 및 결과 반환
             if ttl == 0:
                 return await func(*args, **kwargs)
-            # 현재 시간 저장
-            current = time()
-            # 만료된 캐시 삭제
-            keys = [k for k, (_, t) in cache.items() if current - t > ttl]
-            for key in keys:
-                del cache[key]
+            # 파라미터를 키로 사용하기 위해 해시 가능하도록 변환
+            key = _make_key(args[skip:], kwargs)
             # 캐시 히트 검사
-            if t_args in cache:
-                result, timestamp = cache.pop(t_args)
-                if current - timestamp < ttl:
-                    cache[t_args] = (result, timestamp)
-                    return result
-            # 캐시 히트에 실패한 경우, 함수 실행
-            result = await func(*args, **kwargs)
-            cache[t_args] = (result, current)
-            # 스택이 가득찬 경우, 가장 오래된 캐시 삭제
-            if len(cache) > maxsize:
-                cache.popitem(last=False)
-            return result
+            now = time()
+            entry = store.get(key, now)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+            # 같은 키로 실행 중인 작업이 있으면 함께 기다리고, 없으면 새로 실행
+            # (작업은 이벤트 루프에 묶여 있으므로 같은 루프의 작업만 공유)
+            loop = asyncio.get_running_loop()
+            task = inflight.get(key)
+            if task is None or task.get_loop() is not loop:
+                task = loop.create_task(func(*args, **kwargs))
+                inflight[key] = task
+                task.add_done_callback(partial(settle, key))
+            # 허용 기간 안이면 이전 값을 바로 반환하고 갱신은 백그라운드에서 진행
+            if entry is not None and now < entry[1] + revalidate:
+                return entry[0]
+            try:
+                # 기다리던 코루틴 하나가 취소되더라도 공유된 작업은 계속 실행
+                return await asyncio.shield(task)
+            except Exception:
+                # 갱신에 실패한 경우 허용 기간 안이면 이전 값 반환
+                if entry is not None and now < entry[1] + stale_if_error:
+                    return entry[0]
+                raise
 
-        if iscoroutinefunction(func):
-            return async_wrapper
-        return sync_wrapper
+        wrapper = async_wrapper if iscoroutinefunction(func) else sync_wrapper
+        wrapper.stats = store.stats
+        wrapper.clear = store.clear
+        return wrapper
 
     return decorator
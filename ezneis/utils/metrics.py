@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Iterable
+
+__all__ = ["Counter", "Histogram", "MetricsRegistry", "REGISTRY"]
+
+# 응답 시간 히스토그램의 기본 구간 경계(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    """
+    Prometheus 레이블 값에 사용할 수 없는 문자를 변환합니다.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[Any]) -> str:
+    """
+    레이블 이름과 값을 Prometheus 텍스트 형식으로 나타냅니다.
+    """
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """
+    측정값을 Prometheus 텍스트 형식으로 나타냅니다.
+    """
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class Counter:
+    """
+    레이블 값의 조합마다 누적되는 카운터입니다.
+
+    **사용례**::
+
+        requests = REGISTRY.counter(
+            "ezneis_requests_total", "전송한 HTTP 요청 수", ("service",)
+        )
+        requests.inc("mealServiceDietInfo")
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        """
+        Counter 인스턴스를 초기화합니다.
+
+        :param name: 지표 이름
+        :type name: str
+        :param documentation: 지표 설명
+        :type documentation: str
+        :param labels: 레이블 이름 목록
+        :type labels: Iterable[str]
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: dict[tuple, float] = {}
+        self._lock = Lock()
+
+    def inc(self, *labels: Any, amount: float = 1.0):
+        """
+        레이블 값의 조합에 해당하는 카운터를 증가시킵니다.
+
+        :param labels: 레이블 값 (레이블 이름 순서대로)
+        :param amount: 증가시킬 값
+        :type amount: float
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: Any) -> float:
+        """
+        레이블 값의 조합에 해당하는 현재 값을 반환합니다.
+
+        :param labels: 레이블 값 (레이블 이름 순서대로)
+        :return: 현재 값
+        :rtype: float
+        """
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def reset(self):
+        """
+        모든 값을 초기화합니다.
+        """
+        with self._lock:
+            self._values.clear()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """
+        레이블 값의 조합별 현재 값을 반환합니다.
+
+        :return: `labels`, `value`를 키로 하는 딕셔너리 목록
+        :rtype: list[dict[str, Any]]
+        """
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            {"labels": dict(zip(self.labels, key)), "value": value}
+            for key, value in items
+        ]
+
+    def expose(self) -> list[str]:
+        """
+        현재 값을 Prometheus 텍스트 형식의 줄 목록으로 나타냅니다.
+
+        :return: 줄 목록
+        :rtype: list[str]
+        """
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class Histogram:
+    """
+    레이블 값의 조합마다 측정값의 분포를 고정된 구간으로 누적하는 히스토그램입니다.
+
+    측정값마다 구간 하나의 개수만 증가시키므로, 관측 비용은 구간 수의 로그에
+    비례합니다. 누적 개수는 내보낼 때 계산됩니다.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Histogram 인스턴스를 초기화합니다.
+
+        :param name: 지표 이름
+        :type name: str
+        :param documentation: 지표 설명
+        :type documentation: str
+        :param labels: 레이블 이름 목록
+        :type labels: Iterable[str]
+        :param buckets: 구간의 상한 목록 (오름차순)
+        :type buckets: Iterable[float]
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # 레이블 값의 조합별 [구간별 개수, 합계]
+        self._values: dict[tuple, list] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labels: Any):
+        """
+        측정값을 기록합니다.
+
+        :param value: 측정값
+        :type value: float
+        :param labels: 레이블 값 (레이블 이름 순서대로)
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * len(self.buckets), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def reset(self):
+        """
+        모든 값을 초기화합니다.
+        """
+        with self._lock:
+            self._values.clear()
+
+    def _items(self) -> list[tuple[tuple, list[int], float]]:
+        """
+        레이블 값의 조합별 (레이블 값, 누적 개수 목록, 합계)를 반환합니다.
+        """
+        with self._lock:
+            items = [(k, list(v[0]), v[1]) for k, v in self._values.items()]
+        result = []
+        for key, counts, total in items:
+            cumulative, running = [], 0
+            for count in counts:
+                running += count
+                cumulative.append(running)
+            result.append((key, cumulative, total))
+        return result
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """
+        레이블 값의 조합별 현재 분포를 반환합니다.
+
+        :return: `labels`, `count`, `sum`, `buckets`(구간 상한별 누적 개수)를 키로 하는
+            딕셔너리 목록
+        :rtype: list[dict[str, Any]]
+        """
+        return [
+            {
+                "labels": dict(zip(self.labels, key)),
+                "count": cumulative[-1],
+                "sum": total,
+                "buckets": dict(zip(map(_format_value, self.buckets), cumulative)),
+            }
+            for key, cumulative, total in self._items()
+        ]
+
+    def expose(self) -> list[str]:
+        """
+        현재 분포를 Prometheus 텍스트 형식의 줄 목록으로 나타냅니다.
+
+        :return: 줄 목록
+        :rtype: list[str]
+        """
+        lines = []
+        for key, cumulative, total in self._items():
+            for bound, count in zip(self.buckets, cumulative):
+                labels = _format_labels(
+                    self.labels + ("le",), key + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative[-1]}")
+        return lines
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class MetricsRegistry:
+    """
+    지표를 이름으로 관리하고, Prometheus 텍스트 형식 또는 딕셔너리로 내보냅니다.
+
+    세션과 `ttl_cache`는 기본적으로 전역 `REGISTRY`에 지표를 기록합니다.
+
+    **사용례**::
+
+        from ezneis.utils.metrics import REGISTRY
+
+        print(REGISTRY.to_prometheus())   # /metrics 엔드포인트 응답 본문
+        snapshot = REGISTRY.snapshot()    # 로그 또는 테스트용 딕셔너리
+    """
+
+    def __init__(self):
+        """
+        MetricsRegistry 인스턴스를 초기화합니다.
+        """
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = Lock()
+
+    def _register(self, cls: type, name: str, *args, **kwargs) -> Counter | Histogram:
+        """
+        지표를 등록합니다. 같은 이름의 지표가 이미 있으면 그 지표를 반환합니다.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"이미 다른 종류로 등록된 지표: {name}")
+            return metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Iterable[str] = ()
+    ) -> Counter:
+        """
+        카운터를 등록하거나, 이미 등록된 카운터를 반환합니다.
+
+        :param name: 지표 이름
+        :type name: str
+        :param documentation: 지표 설명
+        :type documentation: str
+        :param labels: 레이블 이름 목록
+        :type labels: Iterable[str]
+        :return: 카운터
+        :rtype: Counter
+        :raises ValueError: 같은 이름으로 다른 종류의 지표가 등록된 경우
+        """
+        return self._register(Counter, name, documentation, labels)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        히스토그램을 등록하거나, 이미 등록된 히스토그램을 반환합니다.
+
+        :param name: 지표 이름
+        :type name: str
+        :param documentation: 지표 설명
+        :type documentation: str
+        :param labels: 레이블 이름 목록
+        :type labels: Iterable[str]
+        :param buckets: 구간의 상한 목록
+        :type buckets: Iterable[float]
+        :return: 히스토그램
+        :rtype: Histogram
+        :raises ValueError: 같은 이름으로 다른 종류의 지표가 등록된 경우
+        """
+        return self._register(Histogram, name, documentation, labels, buckets)
+
+    def reset(self):
+        """
+        등록된 모든 지표의 값을 초기화합니다.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        등록된 모든 지표의 현재 값을 딕셔너리로 반환합니다.
+
+        :return: 지표 이름별 `type`, `help`, `samples`를 키로 하는 딕셔너리
+        :rtype: dict[str, dict[str, Any]]
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {
+                "type": metric.kind,
+                "help": metric.documentation,
+                "samples": metric.snapshot(),
+            }
+            for metric in metrics
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        등록된 모든 지표를 Prometheus 텍스트 형식(0.0.4)으로 나타냅니다.
+
+        :return: Prometheus 텍스트 형식의 문자열
+        :rtype: str
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+"""세션과 `ttl_cache`가 기본으로 사용하는 전역 지표 저장소"""
@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from datetime import date, datetime, timedelta
+from threading import Lock
+from time import time
+from typing import Any, Callable, Iterator, Mapping, TypeVar
+from urllib.parse import urlencode
+from ..exceptions import DataNotFoundException
+from ..http import AsyncSession, SyncSession
+from ..http.service import DATE_FIELDS, KST, TIME_TO_LIVE, Services
+from ..region import Region
+import asyncio
+import orjson
+import os
+import sqlite3
+
+__all__ = ["Mirror"]
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS windows (
+    service TEXT NOT NULL,
+    region TEXT NOT NULL,
+    school TEXT NOT NULL,
+    filters TEXT NOT NULL,
+    window TEXT NOT NULL,
+    fetched REAL NOT NULL,
+    PRIMARY KEY (service, region, school, filters, window)
+);
+CREATE TABLE IF NOT EXISTS records (
+    service TEXT NOT NULL,
+    region TEXT NOT NULL,
+    school TEXT NOT NULL,
+    filters TEXT NOT NULL,
+    window TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (service, region, school, filters, window, seq)
+);
+CREATE INDEX IF NOT EXISTS records_day
+    ON records (service, region, school, filters, day);
+"""
+
+# 동기화 범위를 정하므로 추가 매개변수로 지정할 수 없는 매개변수
+_RESERVED = frozenset(("ATPT_OFCDC_SC_CODE", "SD_SCHUL_CODE"))
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+def _windows(start: date, end: date) -> Iterator[tuple[str, date, date]]:
+    """
+    기간을 월 단위 창으로 나눕니다.
+
+    :param start: 기간의 시작 일자
+    :param end: 기간의 종료 일자
+    :return: (창 이름(YYYYMM), 창의 시작 일자, 창의 종료 일자) 튜플의 이터레이터
+    """
+    current = start.replace(day=1)
+    while current <= end:
+        following = (current + timedelta(days=32)).replace(day=1)
+        yield current.strftime("%Y%m"), current, following - timedelta(days=1)
+        current = following
+
+
+def _filters(svc: Services, kwargs: Mapping[str, Any]) -> str:
+    """
+    추가 매개변수를 정렬하여 저장 키로 사용할 문자열로 만듭니다.
+
+    :raises ValueError: 학교나 일자를 지정하는 매개변수가 포함된 경우
+    """
+    fields = DATE_FIELDS.get(svc)
+    if fields is None:
+        raise ValueError(f"일자별 데이터를 제공하지 않는 서비스: {svc}")
+    reserved = _RESERVED | {fields.start, fields.end, fields.day}
+    invalid = sorted(k for k in kwargs if k in reserved)
+    if invalid:
+        raise ValueError(f"추가 매개변수로 지정할 수 없는 매개변수: {invalid}")
+    return urlencode(sorted((k, str(v)) for k, v in kwargs.items()))
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class Mirror:
+    """
+    일자별 데이터(급식, 학사일정, 시간표)를 SQLite 데이터베이스에 복제하는 동기화 엔진입니다.
+
+    데이터는 (서비스, 시도교육청, 학교, 추가 매개변수, 월 단위 창)을 키로 저장되며,
+    창마다 마지막으로 가져온 시각이 기록됩니다. 식사 코드(`MMEAL_SC_CODE`)나 학년,
+    반처럼 추가 매개변수로 조건을 지정하여 동기화한 데이터는 같은 조건으로 읽어야
+    합니다. `sync` 메서드는 아직 가져오지 않았거나 오래된 창만 다시
+    요청하므로, 나이스 교육정보 OPEN API에는 변경되었을 수 있는 소수의 창만 요청됩니다.
+    이미 지난 달의 창은 그 달이 끝난 뒤에 한 번 가져왔다면 다시 요청하지 않습니다.
+
+    **사용례**::
+
+        mirror = Mirror("neis.sqlite3", max_age=3600)
+        with SyncSession("your_api_key") as sess:
+            mirror.sync(sess, Services.MEALS, Region.GYEONGGI, "1234567",
+                        date(2025, 3, 1), date(2025, 7, 31))
+            # 석식만 따로 동기화
+            mirror.sync(sess, Services.MEALS, Region.GYEONGGI, "1234567",
+                        date(2025, 3, 1), date(2025, 7, 31), MMEAL_SC_CODE="3")
+        meals = mirror.read(Services.MEALS, Region.GYEONGGI, "1234567",
+                            date(2025, 5, 1), date(2025, 5, 31))
+        dinners = mirror.read(Services.MEALS, Region.GYEONGGI, "1234567",
+                              date(2025, 5, 1), date(2025, 5, 31), MMEAL_SC_CODE="3")
+    """
+
+    def __init__(self, path: str | os.PathLike, max_age: float = TIME_TO_LIVE):
+        """
+        Mirror 인스턴스를 초기화합니다.
+
+        :param path: SQLite 데이터베이스 파일 경로
+        :type path: str 또는 os.PathLike
+        :param max_age: 창을 다시 가져오기 전까지 유효하다고 판단할 시간(초)
+        :type max_age: float
+        """
+        self._max_age = max_age
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def stale_windows(
+        self,
+        svc: Services,
+        region: Region | str,
+        school: str,
+        start: date,
+        end: date,
+        **kwargs,
+    ) -> list[tuple[str, date, date]]:
+        """
+        기간 중 아직 가져오지 않았거나 오래된 창을 반환합니다.
+
+        :param svc: 일자별 데이터를 제공하는 서비스
+        :type svc: Services
+        :param region: 시도교육청코드
+        :type region: Region 또는 str
+        :param school: 행정 표준 코드
+        :type school: str
+        :param start: 기간의 시작 일자
+        :type start: date
+        :param end: 기간의 종료 일자
+        :type end: date
+        :param kwargs: 동기화할 때 사용한 서비스별 추가 매개변수
+        :return: (창 이름, 창의 시작 일자, 창의 종료 일자) 튜플 목록
+            (시작 일자가 종료 일자보다 늦은 경우 빈 목록)
+        :rtype: list[tuple[str, date, date]]
+        :raises ValueError: 추가 매개변수에 학교나 일자를 지정하는 매개변수가 포함된 경우
+        """
+        region = getattr(region, "value", region)
+        filters = _filters(svc, kwargs)
+        if start > end:
+            return []
+        windows = list(_windows(start, end))
+        with self._lock:
+            fetched = dict(
+                self._conn.execute(
+                    "SELECT window, fetched FROM windows "
+                    "WHERE service = ? AND region = ? AND school = ? AND filters = ? "
+                    "AND window BETWEEN ? AND ?",
+                    (svc.value, region, school, filters, windows[0][0], windows[-1][0]),
+                ).fetchall()
+            )
+        now = time()
+        stale = []
+        for name, first, last in windows:
+            stamp = fetched.get(name)
+            if stamp is None:
+                stale.append((name, first, last))
+                continue
+            # 창이 끝난 뒤에 가져온 지난 창은 더 이상 변경되지 않는 것으로 간주
+            ended = datetime.combine(last + timedelta(days=1), datetime.min.time(), KST)
+            if stamp >= ended.timestamp():
+                continue
+            if now - stamp >= self._max_age:
+                stale.append((name, first, last))
+        return stale
+
+    def sync(
+        self,
+        sess: SyncSession,
+        svc: Services,
+        region: Region | str,
+        school: str,
+        start: date,
+        end: date,
+        **kwargs,
+    ) -> int:
+        """
+        동기 세션을 사용하여 기간 중 오래된 창을 다시 가져옵니다.
+
+        :param sess: 데이터를 조회할 동기 세션
+        :type sess: SyncSession
+        :param svc: 일자별 데이터를 제공하는 서비스
+        :type svc: Services
+        :param region: 시도교육청코드
+        :type region: Region 또는 str
+        :param school: 행정 표준 코드
+        :type school: str
+        :param start: 기간의 시작 일자
+        :type start: date
+        :param end: 기간의 종료 일자
+        :type end: date
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 다시 가져온 창의 수
+        :rtype: int
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises ValueError: 추가 매개변수에 학교나 일자를 지정하는 매개변수가 포함된 경우
+        """
+        queries = self._queries(svc, region, school, start, end, kwargs)
+        if not queries:
+            return 0
+        results = sess.get_many(queries, return_exceptions=True)
+        return self._store(svc, region, school, kwargs, results)
+
+    async def sync_async(
+        self,
+        sess: AsyncSession,
+        svc: Services,
+        region: Region | str,
+        school: str,
+        start: date,
+        end: date,
+        **kwargs,
+    ) -> int:
+        """
+        비동기 세션을 사용하여 기간 중 오래된 창을 다시 가져옵니다.
+
+        :param sess: 데이터를 조회할 비동기 세션
+        :type sess: AsyncSession
+        :param svc: 일자별 데이터를 제공하는 서비스
+        :type svc: Services
+        :param region: 시도교육청코드
+        :type region: Region 또는 str
+        :param school: 행정 표준 코드
+        :type school: str
+        :param start: 기간의 시작 일자
+        :type start: date
+        :param end: 기간의 종료 일자
+        :type end: date
+        :param kwargs: 서비스별 추가 매개변수
+        :return: 다시 가져온 창의 수
+        :rtype: int
+        :raises InternalServiceError: 서비스 내부 오류가 발생한 경우
+        :raises ServiceUnavailableError: 서비스 요청에 실패한 경우
+        :raises ValueError: 추가 매개변수에 학교나 일자를 지정하는 매개변수가 포함된 경우
+        """
+        # 인덱스 조회와 저장은 이벤트 루프를 막지 않도록 작업자 스레드에서 실행
+        queries = await asyncio.to_thread(
+            self._queries, svc, region, school, start, end, kwargs
+        )
+        if not queries:
+            return 0
+        results = await sess.get_many(queries, return_exceptions=True)
+        return await asyncio.to_thread(
+            self._store, svc, region, school, kwargs, results
+        )
+
+    def read(
+        self,
+        svc: Services,
+        region: Region | str,
+        school: str,
+        start: date,
+        end: date,
+        parser: Callable[[dict], T] | None = None,
+        **kwargs,
+    ) -> list[dict] | list[T]:
+        """
+        복제된 데이터 중 기간에 해당하는 레코드를 일자 순서대로 반환합니다.
+
+        이 메서드는 나이스 교육정보 OPEN API에 요청하지 않고 로컬 인덱스만 조회합니다.
+
+        :param svc: 일자별 데이터를 제공하는 서비스
+        :type svc: Services
+        :param region: 시도교육청코드
+        :type region: Region 또는 str
+        :param school: 행정 표준 코드
+        :type school: str
+        :param start: 기간의 시작 일자
+        :type start: date
+        :param end: 기간의 종료 일자
+        :type end: date
+        :param parser: 레코드를 모델로 변환할 함수 (가령, `TimetableParser.from_json`),
+            None인 경우 레코드를 그대로 반환
+        :type parser: Callable[[dict], T] 또는 None
+        :param kwargs: 동기화할 때 사용한 서비스별 추가 매개변수
+        :return: 레코드 또는 모델 목록
+        :rtype: list[dict] 또는 list[T]
+        :raises ValueError: 추가 매개변수에 학교나 일자를 지정하는 매개변수가 포함된 경우
+        """
+        region = getattr(region, "value", region)
+        filters = _filters(svc, kwargs)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM records "
+                "WHERE service = ? AND region = ? AND school = ? AND filters = ? "
+                "AND day BETWEEN ? AND ? ORDER BY day, window, seq",
+                (
+                    svc.value,
+                    region,
+                    school,
+                    filters,
+                    start.strftime("%Y%m%d"),
+                    end.strftime("%Y%m%d"),
+                ),
+            ).fetchall()
+        records = [orjson.loads(payload) for (payload,) in rows]
+        if parser is None:
+            return records
+        return [parser(record) for record in records]
+
+    def close(self):
+        """
+        데이터베이스 연결을 닫습니다.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def _queries(
+        self,
+        svc: Services,
+        region: Region | str,
+        school: str,
+        start: date,
+        end: date,
+        kwargs: dict[str, Any],
+    ) -> dict[str, tuple[Services, dict]]:
+        """
+        오래된 창마다 해당 창 전체를 조회하는 질의를 생성합니다.
+
+        :return: 창 이름별 (서비스, 매개변수) 튜플
+        :rtype: dict[str, tuple[Services, dict]]
+        """
+        stale = self.stale_windows(svc, region, school, start, end, **kwargs)
+        fields = DATE_FIELDS[svc]
+        return {
+            name: (
+                svc,
+                {
+                    **kwargs,
+                    "ATPT_OFCDC_SC_CODE": getattr(region, "value", region),
+                    "SD_SCHUL_CODE": school,
+                    fields.start: first.strftime("%Y%m%d"),
+                    fields.end: last.strftime("%Y%m%d"),
+                },
+            )
+            for name, first, last in stale
+        }
+
+    def _store(
+        self,
+        svc: Services,
+        region: Region | str,
+        school: str,
+        kwargs: dict[str, Any],
+        results: dict[str, list[dict] | Exception],
+    ) -> int:
+        """
+        가져온 창의 레코드를 창 단위로 교체하여 저장합니다.
+
+        데이터가 없는 창은 빈 창으로 기록되며, 그 외 오류가 발생한 창은 저장하지 않고
+        나머지 창을 저장한 뒤 첫번째 오류를 재전파합니다.
+
+        :return: 저장한 창의 수
+        :rtype: int
+        """
+        region = getattr(region, "value", region)
+        filters = _filters(svc, kwargs)
+        day = DATE_FIELDS[svc].day
+        now = time()
+        error = None
+        stored = 0
+        with self._lock, self._conn:
+            for window, records in results.items():
+                if isinstance(records, DataNotFoundException):
+                    records = []
+                elif isinstance(records, Exception):
+                    error = error or records
+                    continue
+                key = (svc.value, region, school, filters, window)
+                self._conn.execute(
+                    "DELETE FROM records WHERE service = ? AND region = ? "
+                    "AND school = ? AND filters = ? AND window = ?",
+                    key,
+                )
+                self._conn.executemany(
+                    "INSERT INTO records "
+                    "(service, region, school, filters, window, seq, day, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (*key, seq, record[day], orjson.dumps(record))
+                        for seq, record in enumerate(records)
+                    ),
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO windows "
+                    "(service, region, school, filters, window, fetched) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (*key, now),
+                )
+                stored += 1
+        if error is not None:
+            raise error
+        return stored
@@ -1,31 +1,123 @@
 # -*- coding: utf-8 -*-
+from __future__ import annotations
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, AsyncIterator, Callable, Iterator, Mapping
 import asyncio
 import atexit
 
 from ..http import AsyncSession, SyncSession
-from ..wrappers import AsyncWrapper, SyncWrapper
 
 __all__ = ["SessionManager"]
 
+# 실행 중인 루프에 등록한, 세션을 닫는 작업 (완료 전에 가비지 컬렉션되지 않도록 보관)
+_CLOSING: set[asyncio.Task] = set()
+
+
+@dataclass
+class _Entry:
+    """
+    보관된 세션과 마지막으로 반환된 시각, 빌려 가서 아직 반환되지 않은 횟수입니다.
+    """
+
+    session: SyncSession | AsyncSession
+    used: float
+    leases: int = 0
+
+
+def _close_async(session: AsyncSession, loop: asyncio.AbstractEventLoop):
+    """
+    비동기 세션을 세션이 생성된 이벤트 루프에서 닫습니다.
+
+    - 현재 실행 중인 루프인 경우: 루프에 닫는 작업을 등록
+    - 다른 스레드에서 실행 중인 루프인 경우: 그 루프에서 닫을 때까지 대기
+    - 실행 중이 아닌 루프인 경우: 그 루프를 잠시 실행하여 닫음
+    - 이미 닫힌 루프인 경우: 연결을 정리할 수 없으므로 아무것도 하지 않음
+    """
+    if loop.is_closed():
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        task = loop.create_task(session.close())
+        _CLOSING.add(task)
+        task.add_done_callback(_CLOSING.discard)
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop).result()
+    elif running is None:
+        loop.run_until_complete(session.close())
+    else:
+        # 다른 루프가 실행 중인 스레드에서는 루프를 실행할 수 없으므로 별도 스레드 사용
+        worker = Thread(target=loop.run_until_complete, args=(session.close(),))
+        worker.start()
+        worker.join()
+
 
 # noinspection SpellCheckingInspection
 # noinspection GrazieInspection
 # PyCharm IDE의 오탈자/문법 관련 기능을 무시
 class SessionManager:
     """
-    동기 및 비동기 Session Wrapper의 생명 주기를 관리합니다.
+    동기 및 비동기 세션의 생명 주기를 관리합니다.
+
+    동기 세션은 API 키마다, 비동기 세션은 (API 키, 이벤트 루프)마다 하나씩 보관하여
+    같은 키로 다시 요청하면 연결 풀이 유지된 세션을 재사용합니다. 비동기 세션은
+    생성된 이벤트 루프에 묶여 있으므로, 다른 루프에서 요청하면 그 루프용 세션을 새로
+    생성합니다.
+
+    세션은 `sync_session()`과 `async_session()`으로 빌려 쓰며, 블록을 벗어나면
+    반환됩니다. 빌려 간 세션은 유휴 세션 정리 대상이 되지 않고, 모두 반환된 뒤
+    `idle_timeout`초 동안 다시 사용되지 않은 세션과 루프가 닫힌 세션만 다음 요청 시
+    정리됩니다. 따라서 블록 밖에서는 세션을 보관하지 말아야 합니다. 비동기 세션은
+    항상 자신이 생성된 루프에서 닫히며, `asyncio.run`처럼 종료 시 남은 작업을
+    취소하는 루프의 경우 루프가 닫히기 전에 그 루프의 세션이 모두 닫힙니다.
 
-    Session Wrapper를 생성하고, 필요하지 않을 때 세션을 정리할 수 있습니다.
     또한, 프로그램 종료 시 자동으로 세션이 정리되도록 설계되어 있습니다.
+
+    **사용례**::
+
+        manager = SessionManager(idle_timeout=600, sync_options={"max_workers": 8})
+        with manager.sync_session("key_of_tenant_a") as sess:
+            data = sess.get(Services.SCHOOL_INFO, **params)
+
+        async def handler():
+            # 현재 이벤트 루프에 묶인 세션
+            async with manager.async_session("key_of_tenant_b") as sess:
+                data = await sess.get(Services.SCHOOL_INFO, **params)
     """
 
-    def __init__(self):
-        # 동기 Session 및 Wrapper
-        self._sync_session = None
-        self._sync_wrapper = None
-        # 비동기 Session 및 Wrapper
-        self._async_session = None
-        self._async_wrapper = None
+    def __init__(
+        self,
+        idle_timeout: float | None = 300.0,
+        *,
+        sync_options: Mapping[str, Any] | None = None,
+        async_options: Mapping[str, Any] | None = None,
+    ):
+        """
+        SessionManager 인스턴스를 초기화합니다.
+
+        :param idle_timeout: 반환된 세션을 닫을 때까지의 시간(초)
+            (None인 경우 닫지 않음)
+        :type idle_timeout: float 또는 None
+        :param sync_options: 동기 세션 생성 시 전달할 추가 인자 (가령, `rate_limiter`)
+        :type sync_options: Mapping[str, Any] 또는 None
+        :param async_options: 비동기 세션 생성 시 전달할 추가 인자
+        :type async_options: Mapping[str, Any] 또는 None
+        """
+        self._idle_timeout = idle_timeout
+        self._sync_options = dict(sync_options or {})
+        self._async_options = dict(async_options or {})
+        # 동기 Session (API 키별)
+        self._sync: dict[str, _Entry] = {}
+        # 비동기 Session ((API 키, 이벤트 루프)별)
+        self._async: dict[tuple[str, asyncio.AbstractEventLoop], _Entry] = {}
+        # 루프가 종료될 때 그 루프의 세션을 닫는 작업 (이벤트 루프별)
+        self._watchers: dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+        self._lock = Lock()
         # 프로그램 종료 시 Session 종료 등록
         atexit.register(self.cleanup)
 
@@ -33,50 +125,168 @@ class SessionManager:
         # Session 종료
         self.cleanup()
 
-    def get_sync_wrapper(self, key: str) -> SyncWrapper:
+    @contextmanager
+    def sync_session(self, key: str) -> Iterator[SyncSession]:
         """
-        보관된 동기 Session Wrapper를 반환합니다.
+        API 키에 해당하는 동기 세션을 빌려 줍니다.
 
-        만약 생성된 열린 동기 Session Wrapper가 없다면,
-        동기 Session Wrapper를 새로 생성합니다.
+        만약 해당 키로 생성된 열린 동기 세션이 없다면, 동기 세션을 새로 생성합니다.
+        블록을 벗어나면 세션이 반환되며, 세션은 닫히지 않고 다음 요청에 재사용됩니다.
 
         :param key: 나이스 교육정보 개방 포털 API 키입니다.
-        :return: SyncWrapper
+        :return: SyncSession
         """
-        if self._sync_session is None or self._sync_session.closed:
-            self._sync_session = SyncSession(key)
-            self._sync_wrapper = SyncWrapper(self._sync_session)
-        return self._sync_wrapper
+        entry = self._lease(
+            self._sync, key, lambda: SyncSession(key, **self._sync_options)
+        )
+        try:
+            yield entry.session
+        finally:
+            self._release(entry)
 
-    def get_async_wrapper(self, key: str) -> AsyncWrapper:
+    @asynccontextmanager
+    async def async_session(self, key: str) -> AsyncIterator[AsyncSession]:
         """
-        보관된 비동기 Session Wrapper를 반환합니다.
+        API 키와 현재 이벤트 루프에 해당하는 비동기 세션을 빌려 줍니다.
 
-        만약 생성된 열린 비동기 Session Wrapper가 없다면,
-        비동기 Session Wrapper를 새로 생성합니다.
+        만약 해당 키로 현재 루프에서 생성된 열린 비동기 세션이 없다면, 비동기 세션을
+        새로 생성합니다. 블록을 벗어나면 세션이 반환되며, 세션은 닫히지 않고 같은
+        루프의 다음 요청에 재사용됩니다.
 
         :param key: 나이스 교육정보 개방 포털 API 키입니다.
-        :return: AsyncWrapper
+        :return: AsyncSession
         """
-        if self._async_session is None or self._async_session.closed:
-            self._async_session = AsyncSession(key)
-            self._async_wrapper = AsyncWrapper(self._async_session)
-        return self._async_wrapper
+        loop = asyncio.get_running_loop()
+        entry = self._lease(
+            self._async, (key, loop), lambda: AsyncSession(key, **self._async_options)
+        )
+        self._watch(loop)
+        try:
+            yield entry.session
+        finally:
+            self._release(entry)
+
+    def evict_idle(self):
+        """
+        반환된 뒤 `idle_timeout`초 동안 사용되지 않은 세션과 이벤트 루프가 닫힌
+        세션을 닫습니다.
+        """
+        with self._lock:
+            expired = self._collect(monotonic())
+        self._close(expired)
 
     def cleanup(self):
-        # 동기 Session Wrapper 종료
-        if self._sync_session and not self._sync_session.closed:
-            self._sync_session.close()
-            self._sync_session = None
-            self._sync_wrapper = None
-        # 비동기 Session Wrapper 종료
-        if self._async_session and not self._async_session.closed:
-            # Event loop 가져오기 또는 생성
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            asyncio.run_coroutine_threadsafe(self._async_session.close(), loop)
-            self._async_session = None
-            self._async_wrapper = None
+        """
+        빌려 간 세션을 포함하여 보관된 모든 세션을 닫습니다. 비동기 세션은 각자
+        생성된 이벤트 루프에서 닫힙니다.
+        """
+        with self._lock:
+            expired = [(entry.session, None) for entry in self._sync.values()]
+            expired += [
+                (entry.session, loop) for (_, loop), entry in self._async.items()
+            ]
+            self._sync.clear()
+            self._async.clear()
+        self._close(expired)
+
+    def _lease(
+        self,
+        pool: dict,
+        slot: str | tuple[str, asyncio.AbstractEventLoop],
+        factory: Callable[[], SyncSession | AsyncSession],
+    ) -> _Entry:
+        """
+        보관된 세션을 빌려 주고, 없거나 닫힌 경우 새로 생성합니다.
+        """
+        now = monotonic()
+        with self._lock:
+            expired = self._collect(now)
+            entry = pool.get(slot)
+            if entry is None or entry.session.closed:
+                entry = pool[slot] = _Entry(factory(), now)
+            entry.leases += 1
+        self._close(expired)
+        return entry
+
+    def _release(self, entry: _Entry):
+        """
+        빌려 간 세션을 반환하고, 유휴 시간을 반환 시각부터 계산합니다.
+        """
+        with self._lock:
+            entry.leases -= 1
+            entry.used = monotonic()
+
+    def _watch(self, loop: asyncio.AbstractEventLoop):
+        """
+        이벤트 루프가 종료될 때 그 루프의 세션을 닫는 작업을 등록합니다. 루프마다
+        한 번만 등록됩니다.
+        """
+        with self._lock:
+            if loop not in self._watchers:
+                self._watchers[loop] = loop.create_task(self._close_on_shutdown(loop))
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop):
+        """
+        루프가 종료되며 남은 작업이 취소될 때까지 기다린 뒤, 루프가 닫히기 전에 그
+        루프의 세션을 모두 닫습니다.
+        """
+        try:
+            await loop.create_future()
+        finally:
+            with self._lock:
+                self._watchers.pop(loop, None)
+                sessions = [
+                    self._async.pop(slot).session
+                    for slot in list(self._async)
+                    if slot[1] is loop
+                ]
+            for session in sessions:
+                if not session.closed:
+                    await session.close()
+
+    def _collect(
+        self, now: float
+    ) -> list[tuple[SyncSession | AsyncSession, asyncio.AbstractEventLoop | None]]:
+        """
+        닫아야 할 세션을 보관 목록에서 제거하여 반환합니다. 잠금을 획득한 상태에서
+        호출해야 합니다.
+
+        빌려 간 세션은 유휴 상태로 보지 않습니다. 이미 닫힌 세션과 닫힌 루프의 세션은
+        더 이상 사용할 수 없으므로 빌려 간 경우에도 제거합니다.
+        """
+        expired = []
+        for key, entry in list(self._sync.items()):
+            if entry.session.closed or self._idle(entry, now):
+                del self._sync[key]
+                expired.append((entry.session, None))
+        for (key, loop), entry in list(self._async.items()):
+            if entry.session.closed or loop.is_closed() or self._idle(entry, now):
+                del self._async[(key, loop)]
+                expired.append((entry.session, loop))
+        for loop in [loop for loop in self._watchers if loop.is_closed()]:
+            del self._watchers[loop]
+        return expired
+
+    def _idle(self, entry: _Entry, now: float) -> bool:
+        """
+        모두 반환된 뒤 `idle_timeout`초 동안 사용되지 않은 세션인지 확인합니다.
+        """
+        idle = self._idle_timeout
+        return entry.leases == 0 and idle is not None and now - entry.used > idle
+
+    @staticmethod
+    def _close(
+        sessions: list[
+            tuple[SyncSession | AsyncSession, asyncio.AbstractEventLoop | None]
+        ],
+    ):
+        """
+        세션을 닫습니다. 비동기 세션은 생성된 이벤트 루프에서 닫습니다.
+        """
+        for session, loop in sessions:
+            if session.closed:
+                continue
+            if loop is None:
+                session.close()
+            else:
+                _close_async(session, loop)
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from datetime import date, datetime, time, timedelta
+from threading import Event, Thread
+from typing import Callable, Iterable, Mapping, Union
+from ..exceptions import (
+    CircuitOpenError,
+    DataNotFoundException,
+    KeyPoolExhaustedError,
+    SessionClosedException,
+)
+from ..http import AsyncSession, SyncSession
+from ..http.service import KST, Services
+from ..models.core import CoreBuilder
+from ..region import Region
+from .metrics import REGISTRY, MetricsRegistry
+import asyncio
+
+__all__ = ["DEFAULT_SCHEDULE", "WarmupScheduler"]
+
+Target = Union[CoreBuilder, Callable[[date], CoreBuilder]]
+"""미리 조회할 빌더 또는 오늘 날짜(KST)로부터 빌더를 만드는 함수"""
+
+DEFAULT_SCHEDULE: dict[Services, tuple[time, ...]] = {
+    # 식단은 전날 오후에 입력되고 당일 오전에 수정되는 경우가 많으므로
+    # 등교 전과 점심 전에 한 번씩 갱신
+    Services.MEALS: (time(6, 0), time(10, 30)),
+    # 시간표는 전날 확정되고 당일 아침에 변경 사항이 반영됨
+    Services.TIMETABLES_E: (time(6, 0),),
+    Services.TIMETABLES_M: (time(6, 0),),
+    Services.TIMETABLES_H: (time(6, 0),),
+    Services.TIMETABLES_S: (time(6, 0),),
+    # 학사일정은 드물게 변경되므로 하루 한 번
+    Services.SCHEDULES: (time(5, 0),),
+}
+"""서비스별 캐시를 갱신할 시각(KST)의 기본값입니다."""
+
+# 기본 일정에 없는 서비스(학교 정보, 학과 정보 등)를 갱신할 시각
+_FALLBACK = (time(4, 0),)
+
+# 다음 갱신 시각을 계산하지 못한 경우 다시 시도하기까지 기다릴 시간(초)
+_RETRY_DELAY = 60.0
+
+# 남은 대상을 요청해도 실패할 것이 분명한 오류 (회로 차단, 인증 키 소진, 세션 종료)
+_FATAL = (CircuitOpenError, KeyPoolExhaustedError, SessionClosedException)
+
+
+def _bind(builder: CoreBuilder, region: Region | str, school: str) -> CoreBuilder:
+    """
+    빌더의 복사본에 시도교육청코드와 행정 표준 코드를 설정합니다.
+    """
+    bound = builder.copy()
+    bound._param["ATPT_OFCDC_SC_CODE"] = getattr(region, "value", region)
+    bound._param["SD_SCHUL_CODE"] = school
+    return bound
+
+
+# noinspection SpellCheckingInspection
+# noinspection GrazieInspection
+# PyCharm IDE의 오탈자/문법 관련 기능을 무시
+class WarmupScheduler:
+    """
+    추적하는 학교의 데이터를 정해진 시각마다 다시 조회하여 세션의 캐시를 미리
+    채워 두는 스케줄러입니다.
+
+    (시도교육청, 학교) 쌍마다 각 빌더의 질의를 `refresh=True`로 조회하므로, 캐시에
+    응답이 남아 있더라도 새로 요청하여 갱신합니다. 조회는 세션을 통해 이루어지므로
+    세션의 토큰 버킷, 재시도 정책, 회로 차단기, 키 풀이 그대로 적용되며, 대상은
+    하나씩 차례대로 조회되어 다른 요청과 동시에 실행되더라도 부하가 몰리지 않습니다.
+
+    갱신 시각은 서비스별로 `schedule`에 지정하며, 지정하지 않은 서비스는
+    `DEFAULT_SCHEDULE`을, 그 외 서비스는 매일 04:00(KST)을 따릅니다. 갱신한 응답이
+    다음 갱신 시각까지 캐시에 남아 있도록 세션 캐시의 유효 기간은 갱신 간격보다
+    길게 설정해야 합니다. 빌더 대신 날짜를 받아 빌더를 만드는 함수를 주면 갱신할
+    때마다 오늘 날짜(KST)로 질의를 만들 수 있습니다.
+
+    동기 세션(`SyncSession`, `BridgeSession`)을 사용하는 경우 백그라운드 스레드에서,
+    비동기 세션을 사용하는 경우 현재 이벤트 루프의 작업으로 실행됩니다. 조회 결과는
+    `ezneis_warmup_queries_total{service, result}` 지표로 기록됩니다.
+
+    **사용례**::
+
+        cache = MemoryResponseCache(ttl=2 * 86400)
+        bucket = TokenBucket(rate=5, capacity=10)
+        with SyncSession("your_api_key", cache=cache, rate_limiter=bucket) as sess:
+            scheduler = WarmupScheduler(
+                sess,
+                [(Region.GYEONGGI, "1234567"), (Region.SEOUL, "7654321")],
+                [SchoolInfoBuilder()],
+            )
+            with scheduler:
+                serve_forever()
+    """
+
+    def __init__(
+        self,
+        session: SyncSession | AsyncSession,
+        schools: Iterable[tuple[Region | str, str]],
+        builders: Iterable[Target],
+        *,
+        schedule: Mapping[Services, Iterable[time]] | None = None,
+        run_on_start: bool = True,
+        metrics: MetricsRegistry | None = REGISTRY,
+    ):
+        """
+        WarmupScheduler 인스턴스를 초기화합니다.
+
+        :param session: 캐시를 채울 세션
+        :type session: SyncSession 또는 AsyncSession
+        :param schools: 추적할 (시도교육청코드, 행정 표준 코드) 쌍 목록
+        :type schools: Iterable[tuple[Region | str, str]]
+        :param builders: 미리 조회할 빌더 또는 오늘 날짜(KST)로부터 빌더를 만드는 함수 목록
+        :type builders: Iterable[CoreBuilder | Callable[[date], CoreBuilder]]
+        :param schedule: 서비스별 갱신 시각(KST) (지정하지 않은 서비스는 기본값 사용)
+        :type schedule: Mapping[Services, Iterable[time]] 또는 None
+        :param run_on_start: True인 경우 시작하자마자 모든 대상을 한 번 조회
+        :type run_on_start: bool
+        :param metrics: 조회 결과를 기록할 지표 저장소 (None인 경우 기록하지 않음)
+        :type metrics: MetricsRegistry 또는 None
+        :raises ValueError: 추적할 학교나 빌더가 없는 경우
+        """
+        self._session = session
+        self._schools = list(schools)
+        self._builders = list(builders)
+        if not self._schools or not self._builders:
+            raise ValueError("추적할 학교와 빌더가 하나 이상 필요합니다.")
+        self._schedule = dict(DEFAULT_SCHEDULE)
+        for svc, times in (schedule or {}).items():
+            self._schedule[svc] = tuple(times)
+        self._run_on_start = run_on_start
+        self._queries = None
+        if metrics is not None:
+            self._queries = metrics.counter(
+                "ezneis_warmup_queries_total",
+                "캐시를 미리 채우기 위해 조회한 질의 수 (결과별)",
+                ("service", "result"),
+            )
+        self._stopped = Event()
+        self._thread: Thread | None = None
+        self._task: asyncio.Task | None = None
+        self._last_error: Exception | None = None
+
+    def __enter__(self) -> WarmupScheduler:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    async def __aenter__(self) -> WarmupScheduler:
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop_async()
+
+    @property
+    def last_error(self) -> Exception | None:
+        """
+        조회 또는 일정 계산 중 마지막으로 발생한 오류입니다. 데이터가 없는 경우는
+        오류로 간주하지 않습니다.
+
+        :return: 마지막 오류 (오류가 없었던 경우 None)
+        :rtype: Exception 또는 None
+        """
+        return self._last_error
+
+    def next_run(
+        self, now: datetime | None = None
+    ) -> tuple[datetime, frozenset[Services]]:
+        """
+        다음 갱신 시각과 그 시각에 갱신할 서비스를 반환합니다.
+
+        :param now: 기준 시각 (None인 경우 현재 시각)
+        :type now: datetime 또는 None
+        :return: (다음 갱신 시각(KST), 갱신할 서비스 집합) 튜플
+        :rtype: tuple[datetime, frozenset[Services]]
+        :raises Exception: 빌더를 만드는 함수에서 오류가 발생한 경우
+        """
+        now = (now or datetime.now(KST)).astimezone(KST)
+        tracked = {self._build(t, now.date())._service for t in self._builders}
+        earliest, services = None, set()
+        for svc in tracked:
+            for moment in self._schedule.get(svc, _FALLBACK):
+                when = datetime.combine(now.date(), moment, KST)
+                if when <= now:
+                    when += timedelta(days=1)
+                if earliest is None or when < earliest:
+                    earliest, services = when, {svc}
+                elif when == earliest:
+                    services.add(svc)
+        return earliest, frozenset(services)
+
+    def run_once(self, services: Iterable[Services] | None = None) -> int:
+        """
+        동기 세션을 사용하여 대상을 한 번 조회하고 캐시를 갱신합니다.
+
+        :param services: 갱신할 서비스 (None인 경우 모든 서비스)
+        :type services: Iterable[Services] 또는 None
+        :return: 갱신한 질의의 수
+        :rtype: int
+        """
+        refreshed = 0
+        for builder in self._targets(services):
+            if self._stopped.is_set():
+                break
+            try:
+                builder.fetch(self._session, refresh=True)
+            except Exception as e:
+                if self._failed(builder, e):
+                    break
+            else:
+                self._record(builder, "ok")
+                refreshed += 1
+        return refreshed
+
+    async def run_once_async(self, services: Iterable[Services] | None = None) -> int:
+        """
+        비동기 세션을 사용하여 대상을 한 번 조회하고 캐시를 갱신합니다.
+
+        :param services: 갱신할 서비스 (None인 경우 모든 서비스)
+        :type services: Iterable[Services] 또는 None
+        :return: 갱신한 질의의 수
+        :rtype: int
+        """
+        refreshed = 0
+        for builder in self._targets(services):
+            try:
+                await builder.fetch_async(self._session, refresh=True)
+            except Exception as e:
+                if self._failed(builder, e):
+                    break
+            else:
+                self._record(builder, "ok")
+                refreshed += 1
+        return refreshed
+
+    def start(self):
+        """
+        백그라운드에서 일정에 따라 캐시를 갱신하기 시작합니다.
+
+        비동기 세션을 사용하는 경우 실행 중인 이벤트 루프 안에서 호출해야 합니다.
+        이미 시작된 경우 아무것도 하지 않습니다.
+
+        :raises RuntimeError: 비동기 세션을 사용하면서 실행 중인 이벤트 루프가 없는 경우
+        """
+        if isinstance(self._session, AsyncSession):
+            if self._task is None or self._task.done():
+                self._task = asyncio.get_running_loop().create_task(self._serve_async())
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = Thread(target=self._serve, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        캐시 갱신을 중지합니다. 동기 세션을 사용하는 경우 진행 중인 질의가 끝날 때까지
+        기다리며, 비동기 세션을 사용하는 경우 갱신 작업의 취소만 요청합니다.
+        """
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._stopped.clear()
+
+    async def stop_async(self):
+        """
+        캐시 갱신을 중지하고, 비동기 세션을 사용하는 경우 갱신 작업이 취소될 때까지
+        기다립니다.
+        """
+        task = self._task
+        self.stop()
+        if task is not None:
+            await asyncio.wait((task,))
+
+    def _serve(self):
+        """
+        백그라운드 스레드에서 갱신 시각마다 대상을 조회합니다.
+
+        일정 계산이나 조회 중 오류가 발생해도 스레드가 종료되지 않도록 오류를 기록하고
+        다음 갱신 시각을 기다립니다.
+        """
+        pending, services = self._run_on_start, None
+        while True:
+            if pending:
+                try:
+                    self.run_once(services)
+                except Exception as e:
+                    self._last_error = e
+            try:
+                when, services = self.next_run()
+                delay = (when - datetime.now(KST)).total_seconds()
+                pending = True
+            except Exception as e:
+                self._last_error = e
+                pending, delay = False, _RETRY_DELAY
+            if self._stopped.wait(max(0.0, delay)):
+                return
+
+    async def _serve_async(self):
+        """
+        이벤트 루프에서 갱신 시각마다 대상을 조회합니다.
+
+        일정 계산이나 조회 중 오류가 발생해도 작업이 종료되지 않도록 오류를 기록하고
+        다음 갱신 시각을 기다립니다.
+        """
+        pending, services = self._run_on_start, None
+        while True:
+            if pending:
+                try:
+                    await self.run_once_async(services)
+                except Exception as e:
+                    self._last_error = e
+            try:
+                when, services = self.next_run()
+                delay = (when - datetime.now(KST)).total_seconds()
+                pending = True
+            except Exception as e:
+                self._last_error = e
+                pending, delay = False, _RETRY_DELAY
+            await asyncio.sleep(max(0.0, delay))
+
+    @staticmethod
+    def _build(target: Target, today: date) -> CoreBuilder:
+        """
+        대상으로부터 빌더를 얻습니다.
+        """
+        return target if isinstance(target, CoreBuilder) else target(today)
+
+    def _targets(self, services: Iterable[Services] | None) -> list[CoreBuilder]:
+        """
+        갱신할 서비스의 빌더를 학교마다 만듭니다. 학교 순서대로 정렬되어 있어 한
+        학교의 데이터가 모두 갱신된 뒤 다음 학교로 넘어갑니다. 빌더를 만들지 못한
+        대상은 오류를 기록하고 건너뜁니다.
+        """
+        today = datetime.now(KST).date()
+        wanted = None if services is None else set(services)
+        builders = []
+        for target in self._builders:
+            try:
+                builders.append(self._build(target, today))
+            except Exception as e:
+                self._last_error = e
+        return [
+            _bind(builder, region, school)
+            for region, school in self._schools
+            for builder in builders
+            if wanted is None or builder._service in wanted
+        ]
+
+    def _failed(self, builder: CoreBuilder, error: Exception) -> bool:
+        """
+        조회 중 발생한 오류를 기록하고, 남은 대상의 조회를 중단해야 하는지 반환합니다.
+        """
+        # 데이터가 없는 날(휴일, 방학)은 정상적인 결과로 간주
+        if isinstance(error, DataNotFoundException):
+            self._record(builder, "not_found")
+            return False
+        self._record(builder, "error")
+        self._last_error = error
+        return isinstance(error, _FATAL)
+
+    def _record(self, builder: CoreBuilder, result: str):
+        """
+        조회 결과를 지표에 기록합니다.
+        """
+        if self._queries is not None:
+            self._queries.inc(builder._service.name, result)
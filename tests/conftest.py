@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from benchmarks.mock_server import MockNeisServer
+from contextlib import ExitStack
+import pytest
+
+
+@pytest.fixture
+def neis():
+    """
+    테스트용 나이스 교육정보 OPEN API 서버를 별도의 스레드에서 시작하는 함수를
+    반환합니다. 시작한 서버는 테스트가 끝나면 종료됩니다.
+    """
+    with ExitStack() as stack:
+
+        def start(rows, **options) -> MockNeisServer:
+            server = MockNeisServer(rows, **options)
+            stack.enter_context(server.serve())
+            return server
+
+        yield start
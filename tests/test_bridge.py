@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from benchmarks.mock_server import synthetic_rows
+from ezneis.exceptions import DataNotFoundException, SessionClosedException
+from ezneis.http import BridgeSession, SyncSession
+from ezneis.http.keys import KeyPool
+from ezneis.http.service import Services
+import json
+import pytest
+
+ROWS = {Services.SCHOOL_INFO: synthetic_rows(Services.SCHOOL_INFO, 2500)}
+
+
+def test_results_match_sync_session(neis):
+    url = neis(ROWS).url
+    with SyncSession("API_KEY", base_url=url) as sync:
+        expected = sync.get(Services.SCHOOL_INFO)
+    with BridgeSession("API_KEY", base_url=url) as sess:
+        assert sess.get(Services.SCHOOL_INFO) == expected
+        assert sess.get(Services.SCHOOL_INFO, limit=1500) == expected[:1500]
+        assert sess.count(Services.SCHOOL_INFO) == 2500
+        results = sess.get_many(
+            [(Services.SCHOOL_INFO, {}), (Services.MEALS, {})],
+            return_exceptions=True,
+        )
+    assert results[0] == expected
+    assert isinstance(results[1], DataNotFoundException)
+
+
+def test_iter_pages_cancels_remaining_pages(neis):
+    server = neis(ROWS, latency=0.05)
+    with BridgeSession("API_KEY", base_url=server.url) as sess:
+        pages = sess.iter_pages(Services.SCHOOL_INFO, prefetch=1)
+        assert len(next(pages)) == 1000
+        pages.close()
+        # 순회를 중단한 뒤에도 세션은 계속 사용할 수 있음
+        assert sess.count(Services.SCHOOL_INFO) == 2500
+    # 첫 페이지, 미리 요청한 페이지 하나, count 요청
+    assert server.stats["requests"] <= 3
+
+
+def test_closed_session_rejects_requests(neis):
+    sess = BridgeSession("API_KEY", base_url=neis(ROWS).url)
+    sess.get(Services.SCHOOL_INFO, limit=1)
+    sess.close()
+    sess.close()
+    assert sess.closed
+    with pytest.raises(SessionClosedException):
+        sess.get(Services.SCHOOL_INFO)
+
+
+@pytest.mark.parametrize("used", [False, True])
+def test_close_saves_key_usage(neis, tmp_path, used):
+    path = tmp_path / "keys.json"
+    pool = KeyPool(["a", "b"], path=path, flush_interval=3600)
+    pool.acquire()
+    sess = BridgeSession(pool, base_url=neis(ROWS).url)
+    if used:
+        sess.get(Services.SCHOOL_INFO, limit=1)
+    # 요청하지 않아 이벤트 루프가 시작되지 않은 경우에도 저장
+    sess.close()
+    usage = json.loads(path.read_text())["keys"]
+    assert sum(state["requests"] for state in usage.values()) == 1 + used
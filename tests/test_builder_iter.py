@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from benchmarks.mock_server import synthetic_rows
+from ezneis.exceptions import DataNotFoundException
+from ezneis.http import AsyncSession, SyncSession
+from ezneis.http.service import Services
+from ezneis.models import SchoolInfo, SchoolInfoBuilder
+from ezneis.region import Region
+from time import sleep
+import asyncio
+import pytest
+
+ROWS = synthetic_rows(Services.SCHOOL_INFO, 2500)
+SCHOOLS = [SchoolInfo.from_dict(row) for row in ROWS]
+
+
+def test_iter_yields_models_in_order(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS}, jitter=0.02, seed=3)
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        assert list(SchoolInfoBuilder().iter(sess, prefetch=2)) == SCHOOLS
+        assert list(SchoolInfoBuilder().limit(1200).iter(sess)) == SCHOOLS[:1200]
+        with pytest.raises(DataNotFoundException):
+            list(SchoolInfoBuilder().region(Region.JEJU).iter(sess))
+
+
+def test_iter_cancels_remaining_pages_when_closed(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS * 4}, latency=0.05)
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        models = SchoolInfoBuilder().iter(sess, prefetch=1)
+        assert next(models) == SCHOOLS[0]
+        models.close()
+        sleep(0.1)
+    assert server.stats["requests"] == 2
+
+
+def test_aiter_yields_models_in_order(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS * 4}, jitter=0.02, seed=3)
+
+    async def main():
+        async with AsyncSession("API_KEY", base_url=server.url) as sess:
+            models = [m async for m in SchoolInfoBuilder().aiter(sess, prefetch=3)]
+            assert models == SCHOOLS * 4
+
+            requests = server.stats["requests"]
+            models = SchoolInfoBuilder().aiter(sess, prefetch=1)
+            assert await anext(models) == SCHOOLS[0]
+            await models.aclose()
+            await asyncio.sleep(0.1)
+            # 미리 요청한 페이지 외의 나머지 페이지는 요청하지 않음
+            assert server.stats["requests"] - requests <= 2
+
+    asyncio.run(main())
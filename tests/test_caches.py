@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+from ezneis.utils.caches import ttl_cache
+import asyncio
+import pytest
+
+
+def test_maxbytes_keeps_inserted_value():
+    calls = []
+
+    @ttl_cache(60, metrics=None, maxbytes=4000)
+    def big(n: int) -> str:
+        calls.append(n)
+        return "x" * n
+
+    big(100)
+    big(200)
+    for _ in range(3):
+        big(3600)
+    # 방금 저장한 큰 값 대신 오래된 값이 삭제되어야 함
+    assert calls == [100, 200, 3600]
+    stats = big.stats()
+    assert stats.hits == 2
+    assert stats.nbytes <= 4000
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("ezneis.utils.caches.time", clock)
+    return clock
+
+
+def test_keys_keep_argument_order():
+    calls = []
+
+    @ttl_cache(60, metrics=None)
+    def pair(*args, **kwargs) -> tuple:
+        calls.append((args, kwargs))
+        return args
+
+    assert pair(1, 2) == (1, 2)
+    assert pair(2, 1) == (2, 1)
+    # 키워드 인자는 이름 순으로 정렬되어 순서와 관계없이 같은 키
+    pair(a=1, b=2)
+    pair(b=2, a=1)
+    # 해시할 수 없는 인자도 순서를 유지하여 키로 사용
+    pair([1, 2], {"x": [3]})
+    pair([1, 2], {"x": [3]})
+    pair([2, 1], {"x": [3]})
+    assert len(calls) == 5
+    assert pair.stats().hits == 2
+
+
+def test_expired_and_least_recently_used_entries_are_evicted(clock):
+    calls = []
+
+    @ttl_cache(60, maxsize=2, metrics=None)
+    def fetch(code: str) -> str:
+        calls.append(code)
+        return code.upper()
+
+    fetch("a")
+    clock.now += 30
+    fetch("b")
+    fetch("a")
+    # 가장 오래 사용하지 않은 "b"가 삭제됨
+    fetch("c")
+    fetch("a")
+    assert calls == ["a", "b", "c"]
+    # 사용 여부와 관계없이 만료 시각이 지난 "a"는 삭제됨
+    clock.now += 30
+    fetch("a")
+    fetch("c")
+    assert calls == ["a", "b", "c", "a"]
+    stats = fetch.stats()
+    assert (stats.hits, stats.misses, stats.size) == (3, 4, 2)
+    assert stats.evictions == 2
+    fetch.clear()
+    assert fetch.stats().size == 0
+
+
+def test_concurrent_misses_share_one_call():
+    calls = []
+
+    @ttl_cache(60, metrics=None)
+    async def fetch(code: str) -> str:
+        calls.append(code)
+        await asyncio.sleep(0.01)
+        return code.upper()
+
+    async def main():
+        return await asyncio.gather(*(fetch("a") for _ in range(10)), fetch("b"))
+
+    assert asyncio.run(main()) == ["A"] * 10 + ["B"]
+    assert calls == ["a", "b"]
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    calls = []
+
+    @ttl_cache(60, metrics=None)
+    async def fetch(code: str) -> str:
+        calls.append(code)
+        await asyncio.sleep(0.02)
+        return code.upper()
+
+    async def main():
+        first = asyncio.ensure_future(fetch("a"))
+        second = asyncio.ensure_future(fetch("a"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "A"
+    assert calls == ["a"]
+    assert fetch.stats().size == 1
+
+
+def test_stale_while_revalidate(clock):
+    values = iter(["old", "new", "newer"])
+    calls = []
+
+    @ttl_cache(60, metrics=None, stale_while_revalidate=30)
+    async def fetch() -> str:
+        calls.append(clock.now)
+        await asyncio.sleep(0.01)
+        return next(values)
+
+    async def main():
+        assert await fetch() == "old"
+        clock.now += 70
+        # 허용 기간 안에서는 이전 값을 바로 반환하고 한 번만 갱신
+        assert await asyncio.gather(fetch(), fetch()) == ["old", "old"]
+        await asyncio.sleep(0.05)
+        assert await fetch() == "new"
+        # 허용 기간이 지나면 갱신된 값을 기다림
+        clock.now += 100
+        assert await fetch() == "newer"
+
+    asyncio.run(main())
+    assert len(calls) == 3
+
+
+def test_stale_if_error(clock):
+    fail = False
+
+    @ttl_cache(60, metrics=None, stale_if_error=30)
+    def fetch() -> str:
+        if fail:
+            raise RuntimeError("장애")
+        return "value"
+
+    assert fetch() == "value"
+    fail = True
+    clock.now += 70
+    assert fetch() == "value"
+    clock.now += 30
+    with pytest.raises(RuntimeError):
+        fetch()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+from ezneis.http import AsyncSession, CountHints, SyncSession
+from ezneis.http.service import Services
+import asyncio
+import pytest
+
+ROWS = [{"SD_SCHUL_CODE": f"{i:07d}"} for i in range(4500)]
+
+
+class Source:
+    def __init__(self, count: int):
+        self.count = count
+
+    def __call__(self, svc, query):
+        return ROWS[: self.count]
+
+
+def test_lru():
+    hints = CountHints(maxsize=2)
+    hints.set(Services.SCHOOL_INFO, {"KEY": "A", "SCHUL_NM": "a"}, 10)
+    hints.set(Services.SCHOOL_INFO, {"SCHUL_NM": "b"}, 20)
+    # 인증 키는 힌트의 키에 포함되지 않음
+    assert hints.get(Services.SCHOOL_INFO, {"KEY": "B", "SCHUL_NM": "a"}) == 10
+    hints.set(Services.SCHOOL_INFO, {"SCHUL_NM": "c"}, 30)
+    assert hints.get(Services.SCHOOL_INFO, {"SCHUL_NM": "b"}) is None
+    hints.discard(Services.SCHOOL_INFO, {"SCHUL_NM": "a"})
+    assert hints.get(Services.SCHOOL_INFO, {"SCHUL_NM": "a"}) is None
+
+
+def test_first_wave_uses_hint(neis):
+    server = neis(Source(2500), latency=0.05)
+    hints = CountHints()
+    with SyncSession("API_KEY", base_url=server.url, hints=hints) as sess:
+        assert sess.get(Services.SCHOOL_INFO) == ROWS[:2500]
+        # 힌트가 없으면 첫 페이지를 받은 뒤 나머지 페이지를 요청
+        assert server.stats["max_inflight"] == 2
+        assert hints.get(Services.SCHOOL_INFO, {}) == 2500
+    with SyncSession("API_KEY", base_url=server.url, hints=hints) as sess:
+        assert sess.get(Services.SCHOOL_INFO) == ROWS[:2500]
+    # 다른 세션이라도 힌트를 공유하면 모든 페이지를 한 번에 요청
+    assert server.stats["max_inflight"] == 3
+    assert server.stats["requests"] == 6
+
+
+@pytest.mark.parametrize("count", [1500, 1000, 4500])
+def test_hint_is_corrected_when_total_changes(neis, count):
+    source = Source(2500)
+    server = neis(source)
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        assert sess.count(Services.SCHOOL_INFO) == 2500
+        source.count = count
+        assert sess.get(Services.SCHOOL_INFO) == ROWS[:count]
+        assert sess._hints.get(Services.SCHOOL_INFO, {}) == count
+        assert list(sess.iter_records(Services.SCHOOL_INFO)) == ROWS[:count]
+
+
+def test_hint_is_dropped_when_data_disappears(neis):
+    source = Source(2500)
+    server = neis(source)
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        assert sess.count(Services.SCHOOL_INFO) == 2500
+        source.count = 0
+        assert sess.count(Services.SCHOOL_INFO) == 0
+        assert sess._hints.get(Services.SCHOOL_INFO, {}) is None
+
+
+@pytest.mark.parametrize("count", [1500, 4500])
+def test_async_hint_is_corrected_when_total_changes(neis, count):
+    source = Source(2500)
+    server = neis(source)
+
+    async def main():
+        async with AsyncSession("API_KEY", base_url=server.url) as sess:
+            assert await sess.count(Services.SCHOOL_INFO) == 2500
+            source.count = count
+            assert await sess.get(Services.SCHOOL_INFO) == ROWS[:count]
+            assert sess._hints.get(Services.SCHOOL_INFO, {}) == count
+            records = sess.iter_records(Services.SCHOOL_INFO)
+            assert [row async for row in records] == ROWS[:count]
+
+    asyncio.run(main())
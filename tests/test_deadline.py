@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from benchmarks.mock_server import MockNeisServer
+from ezneis.exceptions import DeadlineExceededError
+from ezneis.http import AsyncSession, HedgePolicy, SyncSession
+from ezneis.http.service import Services
+from time import monotonic
+import asyncio
+import pytest
+
+ROWS = [{"SD_SCHUL_CODE": f"{i:07d}"} for i in range(9500)]
+
+
+class StallingServer(MockNeisServer):
+    """
+    지정한 페이지의 첫번째 요청만 늦게 응답하는 서버입니다.
+    """
+
+    def __init__(self, stalls: dict[int, float], **options):
+        super().__init__({Services.SCHOOL_INFO: ROWS}, **options)
+        self.stalls = {str(index): delay for index, delay in stalls.items()}
+
+    async def _handle(self, request):
+        delay = self.stalls.pop(request.query.get("pIndex"), 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        return await super()._handle(request)
+
+
+def hedge_policy(burst: float = 10.0) -> HedgePolicy:
+    # 표본을 미리 채워 두어 50ms 이상 늦는 페이지에 바로 중복 요청
+    hedge = HedgePolicy(50, ratio=0.0, burst=burst, min_delay=0.05, min_samples=1)
+    hedge.record(0.01)
+    return hedge
+
+
+def test_hedged_duplicate_wins():
+    server = StallingServer({3: 1.0})
+    hedge = hedge_policy()
+    with server.serve() as url, SyncSession("API_KEY", base_url=url, hedge=hedge) as s:
+        started = monotonic()
+        assert s.get(Services.SCHOOL_INFO) == ROWS
+        assert monotonic() - started < 0.5
+    assert hedge.hedged == 1
+    assert server.stats["requests"] == 11
+
+
+def test_hedge_budget_is_exhausted():
+    server = StallingServer({3: 0.5, 5: 0.5})
+    hedge = hedge_policy(burst=1.0)
+    with server.serve() as url, SyncSession("API_KEY", base_url=url, hedge=hedge) as s:
+        started = monotonic()
+        assert s.get(Services.SCHOOL_INFO) == ROWS
+        # 두번째로 늦은 페이지는 예산이 없어 원래 응답을 기다림
+        assert monotonic() - started >= 0.5
+    assert hedge.hedged == 1
+    assert server.stats["requests"] == 11
+
+
+def test_deadline_cancels_outstanding_pages(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS}, latency=0.15, jitter=0.05)
+    with SyncSession("API_KEY", base_url=server.url, max_workers=3) as sess:
+        started = monotonic()
+        with pytest.raises(DeadlineExceededError) as info:
+            sess.get(Services.SCHOOL_INFO, timeout=0.3)
+        assert monotonic() - started < 0.5
+        assert info.value.timeout == 0.3
+    # 첫 페이지와 창 안의 페이지만 요청되고, 나머지 페이지는 취소됨
+    assert server.stats["requests"] <= 4
+
+
+def test_async_hedged_duplicate_wins():
+    server = StallingServer({3: 1.0})
+    hedge = hedge_policy()
+
+    async def main():
+        async with (
+            server as url,
+            AsyncSession("API_KEY", base_url=url, hedge=hedge) as sess,
+        ):
+            started = monotonic()
+            assert await sess.get(Services.SCHOOL_INFO) == ROWS
+            assert monotonic() - started < 0.5
+
+    asyncio.run(main())
+    assert hedge.hedged == 1
+    assert server.stats["requests"] == 11
+
+
+def test_async_deadline_cancels_outstanding_pages(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS}, latency=0.15, jitter=0.05)
+
+    async def main():
+        async with AsyncSession(
+            "API_KEY", base_url=server.url, max_concurrency=3, adaptive=False
+        ) as sess:
+            started = monotonic()
+            with pytest.raises(DeadlineExceededError) as info:
+                await sess.get(Services.SCHOOL_INFO, timeout=0.3)
+            assert monotonic() - started < 0.5
+            assert info.value.timeout == 0.3
+            # 취소된 페이지 요청이 동시성 제어기의 자리를 차지하지 않음
+            assert await sess.get(Services.SCHOOL_INFO, limit=10) == ROWS[:10]
+
+    asyncio.run(main())
+    assert server.stats["requests"] <= 5
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+from ezneis.http.cache import MemoryResponseCache
+from ezneis.http.expiry import ExpiryPolicy
+from ezneis.http.service import KST, TIME_TO_LIVE, Services
+import pytest
+
+# 2025년 3월 4일 15:00 (KST)
+NOW = datetime(2025, 3, 4, 15, 0, tzinfo=KST).timestamp()
+MIDNIGHT = datetime(2025, 3, 5, tzinfo=KST).timestamp()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"MLSV_YMD": "20250303"},
+        {"MLSV_FROM_YMD": "20250201", "MLSV_TO_YMD": "20250303"},
+        {"MLSV_YMD": "202502"},
+    ],
+)
+def test_past_window_never_expires(query):
+    assert ExpiryPolicy().expires(Services.MEALS, query, NOW) == float("inf")
+    policy = ExpiryPolicy(past={Services.MEALS: 600})
+    assert policy.expires(Services.MEALS, query, NOW) == NOW + 600
+    assert policy.expires(Services.SCHEDULES, {"AA_YMD": "20250303"}, NOW) == float(
+        "inf"
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"MLSV_YMD": "20250304"},
+        {"MLSV_YMD": "202503"},
+        {"MLSV_FROM_YMD": "20250301", "MLSV_TO_YMD": "20250310"},
+        # 범위가 열려 있거나 일자를 알 수 없는 경우 오늘을 포함하는 것으로 간주
+        {"MLSV_FROM_YMD": "20250301"},
+        {"MLSV_YMD": "today"},
+        {},
+    ],
+)
+def test_today_window_expires_at_midnight(query):
+    assert ExpiryPolicy().expires(Services.MEALS, query, NOW) == MIDNIGHT
+    assert ExpiryPolicy(today=600).expires(Services.MEALS, query, NOW) == NOW + 600
+    # 다음 날 0시가 유효 기간보다 먼저 오는 경우
+    policy = ExpiryPolicy(today=86400)
+    assert policy.expires(Services.MEALS, query, NOW) == MIDNIGHT
+
+
+def test_future_window_uses_future_ttl():
+    query = {"MLSV_FROM_YMD": "20250305", "MLSV_TO_YMD": "20250310"}
+    assert ExpiryPolicy().expires(Services.MEALS, query, NOW) == NOW + 3600
+    policy = ExpiryPolicy(future={Services.SCHEDULES: 60})
+    assert policy.expires(Services.MEALS, query, NOW) == MIDNIGHT
+    query = {"AA_YMD": "20250401"}
+    assert policy.expires(Services.SCHEDULES, query, NOW) == NOW + 60
+
+
+def test_other_services_use_ttl():
+    policy = ExpiryPolicy({Services.SCHOOL_INFO: 7 * 86400})
+    assert policy.expires(Services.SCHOOL_INFO, {}, NOW) == NOW + 7 * 86400
+    assert policy.expires(Services.CLASSROOMS, {}, NOW) == NOW + TIME_TO_LIVE
+    assert policy.ttl_for(Services.SCHOOL_INFO) == 7 * 86400
+
+
+def test_cache_follows_policy(monkeypatch):
+    clock = [NOW]
+    monkeypatch.setattr("ezneis.http.cache.time", lambda: clock[0])
+    cache = MemoryResponseCache(ExpiryPolicy(past={Services.SCHEDULES: 0}))
+    cache.store(Services.MEALS, {"MLSV_YMD": "20250303"}, b"past")
+    cache.store(Services.MEALS, {"MLSV_YMD": "20250304"}, b"today")
+    # 즉시 만료되는 응답은 저장하지 않음
+    cache.store(Services.SCHEDULES, {"AA_YMD": "20250303"}, b"schedule")
+    assert cache.load(Services.SCHEDULES, {"AA_YMD": "20250303"}) is None
+    clock[0] = MIDNIGHT
+    assert cache.load(Services.MEALS, {"MLSV_YMD": "20250304"}) is None
+    clock[0] = MIDNIGHT + 365 * 86400
+    assert cache.load(Services.MEALS, {"MLSV_YMD": "20250303"}) == b"past"
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from ezneis.exceptions import DataNotFoundException, ServiceUnavailableError
+from ezneis.http import AsyncSession, SyncSession
+from ezneis.http.service import Services
+from time import monotonic
+import asyncio
+import pytest
+
+ROWS = [{"SD_SCHUL_CODE": f"{i:07d}"} for i in range(9500)]
+
+
+def failing_page(index: int):
+    def rows(svc, query):
+        if query["pIndex"] == str(index):
+            raise RuntimeError("페이지 오류")
+        return ROWS
+
+    return rows
+
+
+def test_records_follow_page_order(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS}, jitter=0.03, seed=2)
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        assert sess.get(Services.SCHOOL_INFO) == ROWS
+        assert sess.get(Services.SCHOOL_INFO, limit=1500) == ROWS[:1500]
+        with pytest.raises(DataNotFoundException):
+            sess.get(Services.MEALS)
+
+
+def test_failed_page_cancels_remaining_pages(neis):
+    server = neis(failing_page(2), latency=0.05)
+    with SyncSession("API_KEY", base_url=server.url, max_workers=2, retry=None) as sess:
+        started = monotonic()
+        with pytest.raises(ServiceUnavailableError):
+            sess.get(Services.SCHOOL_INFO)
+        elapsed = monotonic() - started
+    # 첫 페이지와 함께 요청된 페이지만 전송되고, 나머지 8개 페이지는 취소됨
+    assert server.stats["requests"] <= 4
+    assert elapsed < 0.3
+
+
+def test_async_records_follow_page_order(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS}, jitter=0.03, seed=2)
+
+    async def main():
+        async with AsyncSession("API_KEY", base_url=server.url) as sess:
+            assert await sess.get(Services.SCHOOL_INFO) == ROWS
+            assert await sess.get(Services.SCHOOL_INFO, limit=1500) == ROWS[:1500]
+
+    asyncio.run(main())
+
+
+def test_async_failed_page_cancels_remaining_pages(neis):
+    server = neis(failing_page(2), latency=0.05)
+
+    async def main():
+        async with AsyncSession(
+            "API_KEY",
+            base_url=server.url,
+            max_concurrency=2,
+            adaptive=False,
+            retry=None,
+        ) as sess:
+            with pytest.raises(ServiceUnavailableError):
+                await sess.get(Services.SCHOOL_INFO)
+
+    asyncio.run(main())
+    assert server.stats["requests"] <= 4
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+from ezneis.exceptions import DataNotFoundException, ServiceUnavailableError
+from ezneis.http import AsyncSession, SyncSession
+from ezneis.http.service import Services
+import asyncio
+import pytest
+
+ROWS = [{"SD_SCHUL_CODE": f"{i:07d}"} for i in range(2500)]
+
+
+def source(svc, query):
+    # 급식 서비스는 항상 실패하고, 학교 코드가 "0000000"인 학교는 데이터가 없음
+    if svc is Services.MEALS:
+        raise RuntimeError("서버 오류")
+    if query.get("SD_SCHUL_CODE") == "0000000":
+        return []
+    return ROWS
+
+
+QUERIES = {
+    "all": (Services.SCHOOL_INFO, {}),
+    "some": (Services.SCHOOL_INFO, {"SCHUL_NM": "가상", "limit": 1200}),
+    "none": (Services.SCHOOL_INFO, {"SD_SCHUL_CODE": "0000000"}),
+    "error": (Services.MEALS, {}),
+}
+
+
+def check(results: dict):
+    assert results.keys() == QUERIES.keys()
+    assert results["all"] == ROWS
+    assert results["some"] == ROWS[:1200]
+    assert isinstance(results["none"], DataNotFoundException)
+    assert isinstance(results["error"], ServiceUnavailableError)
+
+
+def test_mapping_and_sequence_keys(neis):
+    url = neis(source).url
+    with SyncSession("API_KEY", base_url=url, retry=None) as sess:
+        check(sess.get_many(QUERIES, return_exceptions=True))
+        results = sess.get_many([QUERIES["some"], QUERIES["all"]])
+    assert results == {0: ROWS[:1200], 1: ROWS}
+
+
+def test_first_error_cancels_remaining_queries(neis):
+    server = neis(source, latency=0.05)
+    queries = [(Services.MEALS, {})] + [
+        (Services.SCHOOL_INFO, {"SCHUL_NM": str(i)}) for i in range(5)
+    ]
+    with SyncSession("API_KEY", base_url=server.url, max_workers=2, retry=None) as s:
+        with pytest.raises(ServiceUnavailableError):
+            s.get_many(queries)
+    # 모든 질의를 마쳤다면 16개의 페이지를 요청했어야 함
+    assert server.stats["requests"] <= 4
+
+
+def test_async_get_many(neis):
+    server = neis(source, latency=0.05)
+
+    async def main():
+        async with AsyncSession("API_KEY", base_url=server.url, retry=None) as sess:
+            check(await sess.get_many(QUERIES, return_exceptions=True))
+            assert await sess.get_many([QUERIES["some"]]) == {0: ROWS[:1200]}
+        requests = server.stats["requests"]
+        async with AsyncSession(
+            "API_KEY",
+            base_url=server.url,
+            max_concurrency=1,
+            adaptive=False,
+            retry=None,
+        ) as sess:
+            with pytest.raises(ServiceUnavailableError):
+                await sess.get_many(
+                    [(Services.MEALS, {}), (Services.SCHOOL_INFO, {"SCHUL_NM": "1"})]
+                )
+        # 실패한 질의 이후 다른 질의의 나머지 페이지는 요청하지 않음
+        assert server.stats["requests"] - requests <= 2
+
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from ezneis.exceptions import DataNotFoundException
+from ezneis.http import AsyncSession, SyncSession
+from ezneis.http.service import Services
+from time import sleep
+import asyncio
+import pytest
+
+ROWS = [{"SD_SCHUL_CODE": f"{i:07d}"} for i in range(3500)]
+
+
+def test_pages_arrive_in_order(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS}, jitter=0.02, seed=1)
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        pages = list(sess.iter_pages(Services.SCHOOL_INFO, prefetch=3))
+        records = list(sess.iter_records(Services.SCHOOL_INFO, limit=1500))
+        with pytest.raises(DataNotFoundException):
+            list(sess.iter_pages(Services.MEALS))
+    assert [len(page) for page in pages] == [1000, 1000, 1000, 500]
+    assert [row for page in pages for row in page] == ROWS
+    # limit을 넘는 레코드는 잘라내고, 필요한 페이지만 요청
+    assert records == ROWS[:1500]
+
+
+def test_prefetch_bounds_requests_in_flight(neis):
+    rows = ROWS * 3
+    server = neis({Services.SCHOOL_INFO: rows}, latency=0.02)
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        pages = sess.iter_pages(Services.SCHOOL_INFO, prefetch=2)
+        assert sum(map(len, pages)) == len(rows)
+    assert server.stats["max_inflight"] == 2
+
+
+def test_closing_iterator_cancels_remaining_pages(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS * 3}, latency=0.05)
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        pages = sess.iter_pages(Services.SCHOOL_INFO, prefetch=2)
+        assert len(next(pages)) == 1000
+        pages.close()
+        sleep(0.2)
+    # 첫 페이지와 미리 요청한 페이지 2개만 요청됨
+    assert server.stats["requests"] == 3
+
+
+def test_async_iterators(neis):
+    server = neis({Services.SCHOOL_INFO: ROWS * 3}, jitter=0.02, seed=1)
+
+    async def main():
+        async with AsyncSession("API_KEY", base_url=server.url) as sess:
+            pages = [
+                page async for page in sess.iter_pages(Services.SCHOOL_INFO, prefetch=3)
+            ]
+            assert [row for page in pages for row in page] == ROWS * 3
+            records = sess.iter_records(Services.SCHOOL_INFO, limit=1500)
+            assert [row async for row in records] == ROWS[:1500]
+
+            requests = server.stats["requests"]
+            pages = sess.iter_pages(Services.SCHOOL_INFO, prefetch=2)
+            await anext(pages)
+            await pages.aclose()
+            await asyncio.sleep(0.1)
+            assert server.stats["requests"] - requests <= 3
+
+            with pytest.raises(DataNotFoundException):
+                async for _ in sess.iter_pages(Services.MEALS):
+                    pass
+
+    asyncio.run(main())
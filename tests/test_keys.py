@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from threading import get_ident
+from time import monotonic, sleep
+from ezneis.exceptions import (
+    InternalServiceError,
+    KeyPoolExhaustedError,
+    ServiceUnavailableError,
+)
+from ezneis.http.keys import KeyPool
+import json
+import pytest
+
+
+def test_rotates_least_used_key():
+    pool = KeyPool(["a", "b", "c"])
+    assert [pool.acquire() for _ in range(6)] == ["a", "b", "c"] * 2
+    assert {usage["requests"] for usage in pool.usage().values()} == {2}
+
+
+def test_rejected_key_leaves_rotation():
+    pool = KeyPool(["a", "b"], cooldown=60)
+    key = pool.acquire()
+    assert pool.report(key, InternalServiceError("ERROR-290", "인증키 오류"))
+    assert pool.usage()[key]["reason"] == "ERROR-290"
+    assert {pool.acquire() for _ in range(3)} == {"b"}
+
+
+def test_other_errors_keep_key():
+    pool = KeyPool(["a"])
+    assert not pool.report("a", InternalServiceError("ERROR-500", "서버 오류"))
+    assert not pool.report("a", ServiceUnavailableError("http://x", 503))
+    assert pool.acquire() == "a"
+    assert pool.usage()["a"]["errors"] == 2
+
+
+def test_throttled_key_leaves_rotation():
+    pool = KeyPool(["a"], throttle_cooldown=60)
+    assert pool.report("a", ServiceUnavailableError("http://x", 429))
+    with pytest.raises(KeyPoolExhaustedError) as info:
+        pool.acquire()
+    assert info.value.available_at is not None
+
+
+def test_daily_quota_exhausts_pool():
+    pool = KeyPool(["a", "b"], daily_quota=2)
+    for _ in range(4):
+        pool.acquire()
+    with pytest.raises(KeyPoolExhaustedError):
+        pool.acquire()
+
+
+def test_usage_persists_without_raw_keys(tmp_path):
+    path = tmp_path / "keys.json"
+    pool = KeyPool(["secret-a", "secret-b"], path=path)
+    for _ in range(3):
+        pool.acquire()
+    pool.report("secret-b", InternalServiceError("INFO-300", "사용 제한"))
+    pool.save()
+    assert "secret" not in path.read_text(encoding="utf-8")
+
+    restored = KeyPool(["secret-a", "secret-b"], path=path)
+    usage = restored.usage()
+    assert usage["secret-a"]["requests"] == 2
+    assert usage["secret-b"]["requests"] == 1
+    assert usage["secret-b"]["reason"] == "INFO-300"
+
+
+def test_flush_runs_off_the_calling_thread(tmp_path, monkeypatch):
+    path = tmp_path / "keys.json"
+    writers = []
+    dumps = json.dumps
+
+    def recording_dumps(*args, **kwargs):
+        writers.append(get_ident())
+        return dumps(*args, **kwargs)
+
+    monkeypatch.setattr("ezneis.http.keys.json.dumps", recording_dumps)
+    pool = KeyPool(["a", "b"], path=path, flush_interval=0)
+    pool.acquire()
+    # 차단 상태는 즉시 저장을 요청하지만, 기록은 호출한 스레드에서 하지 않음
+    pool.report("a", InternalServiceError("ERROR-290", "인증키 오류"))
+    deadline = monotonic() + 5
+    while not path.exists() and monotonic() < deadline:
+        sleep(0.01)
+    assert writers
+    assert get_ident() not in writers
+    pool.save()
+    assert json.loads(path.read_text(encoding="utf-8"))["date"]
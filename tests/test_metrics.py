@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from benchmarks.mock_server import synthetic_rows
+from ezneis.exceptions import InternalServiceError
+from ezneis.http import MemoryResponseCache, RetryPolicy, SyncSession
+from ezneis.http.service import Services
+from ezneis.utils.metrics import MetricsRegistry
+import pytest
+
+
+def test_to_prometheus():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "요청 수", ("service", "code"))
+    requests.inc("MEALS", "INFO-000")
+    requests.inc("MEALS", "INFO-000", amount=2)
+    requests.inc('a"b\\c\n', "ERROR-500")
+    latency = registry.histogram("latency_seconds", "응답 시간", buckets=(0.1, 1.0))
+    latency.observe(0.05)
+    latency.observe(0.1)
+    latency.observe(2.5)
+    assert registry.to_prometheus() == (
+        "# HELP requests_total 요청 수\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{service="MEALS",code="INFO-000"} 3\n'
+        'requests_total{service="a\\"b\\\\c\\n",code="ERROR-500"} 1\n'
+        "# HELP latency_seconds 응답 시간\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{le="0.1"} 2\n'
+        'latency_seconds_bucket{le="1"} 2\n'
+        'latency_seconds_bucket{le="+Inf"} 3\n'
+        "latency_seconds_sum 2.65\n"
+        "latency_seconds_count 3\n"
+    )
+
+
+def test_snapshot_and_reset():
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "적중 수", ("cache",))
+    # 같은 이름으로 다시 등록하면 기존 지표를 반환
+    assert registry.counter("hits_total", "적중 수", ("cache",)) is counter
+    with pytest.raises(ValueError):
+        registry.histogram("hits_total", "적중 수")
+    counter.inc("memory")
+    registry.histogram("size_bytes", "크기", buckets=(10,)).observe(4)
+    assert registry.snapshot() == {
+        "hits_total": {
+            "type": "counter",
+            "help": "적중 수",
+            "samples": [{"labels": {"cache": "memory"}, "value": 1.0}],
+        },
+        "size_bytes": {
+            "type": "histogram",
+            "help": "크기",
+            "samples": [
+                {
+                    "labels": {},
+                    "count": 1,
+                    "sum": 4.0,
+                    "buckets": {"10": 1, "+Inf": 1},
+                }
+            ],
+        },
+    }
+    registry.reset()
+    assert counter.value("memory") == 0
+    assert registry.to_prometheus().count("\n") == 4
+
+
+def test_session_records_traffic(neis):
+    server = neis({Services.SCHOOL_INFO: synthetic_rows(Services.SCHOOL_INFO, 1500)})
+    registry = MetricsRegistry()
+    with SyncSession(
+        "API_KEY",
+        base_url=server.url,
+        cache=MemoryResponseCache(),
+        retry=RetryPolicy(retries=1, base_delay=0.01),
+        metrics=registry,
+    ) as sess:
+        sess.get(Services.SCHOOL_INFO)
+        sess.get(Services.SCHOOL_INFO)
+        server.error_rate = 1.0
+        with pytest.raises(InternalServiceError):
+            sess.get(Services.SCHOOL_INFO, refresh=True, limit=1)
+
+    snapshot = registry.snapshot()
+    pages = {
+        sample["labels"]["source"]: sample["value"]
+        for sample in snapshot["ezneis_pages_total"]["samples"]
+    }
+    assert pages == {"network": 2, "cache": 2}
+    codes = {
+        sample["labels"]["code"]: sample["value"]
+        for sample in snapshot["ezneis_requests_total"]["samples"]
+    }
+    assert codes.pop("INFO-000") == 2
+    assert sum(codes.values()) == 2
+    retries = registry.counter("ezneis_retries_total", "", ("service",))
+    assert retries.value("SCHOOL_INFO") == 1
+    (latency,) = snapshot["ezneis_request_duration_seconds"]["samples"]
+    assert latency["labels"] == {"service": "SCHOOL_INFO"}
+    assert latency["count"] == 4
+    assert 'ezneis_retries_total{service="SCHOOL_INFO"} 1' in registry.to_prometheus()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+from ezneis.exceptions import InternalServiceError
+from ezneis.http import AsyncSession, RetryPolicy, SyncSession
+from ezneis.http.service import Services
+from ezneis.utils.mirror import Mirror
+import asyncio
+import pytest
+
+SCHOOL = ("J10", "7530000")
+
+# 2025년 3월부터 5월까지 매일의 중식(2)과 석식(3), 4월 15일에는 석식 없음
+ROWS = [
+    {"MLSV_YMD": f"2025{month:02}{day:02}", "MMEAL_SC_CODE": code}
+    for month in (3, 4, 5)
+    for day in range(1, 29)
+    for code in ("2", "3")
+    if (month, day, code) != (4, 15, "3")
+]
+
+
+def source(svc, query):
+    low, high = query["MLSV_FROM_YMD"], query["MLSV_TO_YMD"]
+    code = query.get("MMEAL_SC_CODE")
+    return [
+        row
+        for row in ROWS
+        if low <= row["MLSV_YMD"] <= high and code in (None, row["MMEAL_SC_CODE"])
+    ]
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = Mirror(tmp_path / "mirror.sqlite3", max_age=3600)
+    yield mirror
+    mirror.close()
+
+
+def test_filters_are_part_of_the_key(neis, mirror):
+    url = neis(source).url
+    start, end = date(2025, 3, 1), date(2025, 5, 31)
+    with SyncSession("API_KEY", base_url=url) as sess:
+        assert (
+            mirror.sync(sess, Services.MEALS, *SCHOOL, start, end, MMEAL_SC_CODE=2) == 3
+        )
+        # 다른 조건의 동기화는 건너뛰거나 이전 데이터를 덮어쓰지 않음
+        assert (
+            mirror.sync(sess, Services.MEALS, *SCHOOL, start, end, MMEAL_SC_CODE=3) == 3
+        )
+        assert (
+            mirror.sync(sess, Services.MEALS, *SCHOOL, start, end, MMEAL_SC_CODE=2) == 0
+        )
+
+    april = (date(2025, 4, 1), date(2025, 4, 30))
+    lunches = mirror.read(Services.MEALS, *SCHOOL, *april, MMEAL_SC_CODE="2")
+    dinners = mirror.read(Services.MEALS, *SCHOOL, *april, MMEAL_SC_CODE="3")
+    assert len(lunches) == 28 and {r["MMEAL_SC_CODE"] for r in lunches} == {"2"}
+    assert len(dinners) == 27 and {r["MMEAL_SC_CODE"] for r in dinners} == {"3"}
+    assert [r["MLSV_YMD"] for r in lunches] == sorted(r["MLSV_YMD"] for r in lunches)
+    assert mirror.read(Services.MEALS, *SCHOOL, *april) == []
+
+
+def test_stale_windows(mirror):
+    windows = mirror.stale_windows(
+        Services.MEALS, *SCHOOL, date(2025, 1, 15), date(2025, 3, 2)
+    )
+    assert [name for name, _, _ in windows] == ["202501", "202502", "202503"]
+    assert windows[1][1:] == (date(2025, 2, 1), date(2025, 2, 28))
+    assert (
+        mirror.stale_windows(
+            Services.MEALS, *SCHOOL, date(2025, 3, 2), date(2025, 3, 1)
+        )
+        == []
+    )
+
+
+def test_rejects_reserved_parameters_and_services(mirror):
+    with pytest.raises(ValueError):
+        mirror.stale_windows(
+            Services.MEALS,
+            *SCHOOL,
+            date(2025, 3, 1),
+            date(2025, 3, 31),
+            MLSV_YMD="20250301",
+        )
+    with pytest.raises(ValueError):
+        mirror.read(
+            Services.MEALS,
+            *SCHOOL,
+            date(2025, 3, 1),
+            date(2025, 3, 31),
+            SD_SCHUL_CODE="1",
+        )
+    with pytest.raises(ValueError):
+        mirror.stale_windows(
+            Services.SCHOOL_INFO, *SCHOOL, date(2025, 3, 1), date(2025, 3, 31)
+        )
+
+
+def test_missing_windows_are_stored_empty(neis, mirror):
+    def without_april(svc, query):
+        if query["MLSV_FROM_YMD"].startswith("202504"):
+            return []
+        return source(svc, query)
+
+    start, end = date(2025, 3, 1), date(2025, 5, 31)
+    url = neis(without_april).url
+    with SyncSession("API_KEY", base_url=url) as sess:
+        assert mirror.sync(sess, Services.MEALS, *SCHOOL, start, end) == 3
+    april = mirror.read(Services.MEALS, *SCHOOL, date(2025, 4, 1), date(2025, 4, 30))
+    assert april == []
+    assert mirror.stale_windows(Services.MEALS, *SCHOOL, start, end) == []
+
+
+def test_failed_windows_are_not_stored(neis, mirror):
+    url = neis(source, error_rate=1.0).url
+    start, end = date(2025, 3, 1), date(2025, 3, 31)
+    retry = RetryPolicy(retries=0)
+    with SyncSession("API_KEY", base_url=url, retry=retry) as sess:
+        with pytest.raises(InternalServiceError):
+            mirror.sync(sess, Services.MEALS, *SCHOOL, start, end)
+    assert len(mirror.stale_windows(Services.MEALS, *SCHOOL, start, end)) == 1
+
+
+def test_sync_async(neis, mirror):
+    url = neis(source).url
+
+    async def main():
+        async with AsyncSession("API_KEY", base_url=url) as sess:
+            return await mirror.sync_async(
+                sess,
+                Services.MEALS,
+                *SCHOOL,
+                date(2025, 3, 1),
+                date(2025, 3, 31),
+                MMEAL_SC_CODE="3",
+            )
+
+    assert asyncio.run(main()) == 1
+    march = mirror.read(
+        Services.MEALS, *SCHOOL, date(2025, 3, 1), date(2025, 3, 31), MMEAL_SC_CODE=3
+    )
+    assert len(march) == 28
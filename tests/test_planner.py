@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from benchmarks.mock_server import MockNeisServer
+from dataclasses import dataclass
+from ezneis.exceptions import DataNotFoundException, ServiceUnavailableError
+from ezneis.http import SyncSession
+from ezneis.http.service import Services
+from ezneis.models import SchoolInfoBuilder
+from ezneis.models.core import CoreBuilder, CoreModel, QueryPlanner
+import pytest
+
+SCHOOL = {"ATPT_OFCDC_SC_CODE": "J10", "SD_SCHUL_CODE": "7530000"}
+
+
+@dataclass(frozen=True)
+class Meal(CoreModel):
+    day: str
+    code: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Meal:
+        return cls(data["MLSV_YMD"], data["MMEAL_SC_CODE"])
+
+
+class MealBuilder(CoreBuilder):
+    _service = Services.MEALS
+    _model = Meal
+
+    def __rrshift__(self, other) -> MealBuilder:
+        return self
+
+    def day(self, day: str, code: str = "2") -> MealBuilder:
+        self._param.update(SCHOOL, MLSV_YMD=day, MMEAL_SC_CODE=code)
+        return self
+
+
+def meals(*days: str, code: str = "2") -> list[MealBuilder]:
+    return [MealBuilder().day(day, code) for day in days]
+
+
+def fetch_or_empty(builder: CoreBuilder, sess: SyncSession) -> tuple:
+    try:
+        return tuple(builder.fetch(sess))
+    except DataNotFoundException:
+        return ()
+
+
+def test_adjacent_and_overlapping_days_are_merged():
+    planner = QueryPlanner(meals("20250303", "20250305", "20250304", "20250303"))
+    assert planner.plan() == [
+        (
+            Services.MEALS,
+            {
+                **SCHOOL,
+                "MMEAL_SC_CODE": "2",
+                "MLSV_FROM_YMD": "20250303",
+                "MLSV_TO_YMD": "20250305",
+            },
+        )
+    ]
+
+
+def test_gaps_and_other_parameters_are_not_merged():
+    builders = meals("20250303", "20250310") + meals("20250304", code="3")
+    plan = QueryPlanner(builders).plan()
+    assert len(plan) == 3
+
+
+def test_max_days_splits_ranges():
+    days = [f"202503{day:02}" for day in range(1, 11)]
+    plan = QueryPlanner(meals(*days), max_days=4).plan()
+    assert [(q["MLSV_FROM_YMD"], q["MLSV_TO_YMD"]) for _, q in plan] == [
+        ("20250301", "20250304"),
+        ("20250305", "20250308"),
+        ("20250309", "20250310"),
+    ]
+
+
+def test_single_and_unmergeable_queries_pass_through():
+    school = SchoolInfoBuilder().code("7530000")
+    limited = MealBuilder().day("20250305").limit(3)
+    planner = QueryPlanner([MealBuilder().day("20250303"), school, limited])
+    plan = planner.plan()
+    # 합쳐지지 않은 질의는 캐시를 공유할 수 있도록 원래 매개변수로 요청
+    assert (
+        Services.MEALS,
+        {**SCHOOL, "MLSV_YMD": "20250303", "MMEAL_SC_CODE": "2"},
+    ) in plan
+    assert (Services.SCHOOL_INFO, {"SD_SCHUL_CODE": "7530000"}) in plan
+    assert (
+        Services.MEALS,
+        {**SCHOOL, "MLSV_YMD": "20250305", "MMEAL_SC_CODE": "2", "limit": 3},
+    ) in plan
+
+
+def test_distribute_slices_records_per_builder():
+    planner = QueryPlanner(meals("20250303", "20250304", "20250305"))
+    plan = planner._plan()
+    records = [
+        {"MLSV_YMD": "20250303", "MMEAL_SC_CODE": "2"},
+        {"MLSV_YMD": "20250305", "MMEAL_SC_CODE": "2"},
+    ]
+    output = planner._distribute(plan, {0: records})
+    assert output == [
+        (Meal("20250303", "2"),),
+        (),
+        (Meal("20250305", "2"),),
+    ]
+
+
+def test_distribute_handles_missing_data_and_errors():
+    planner = QueryPlanner(meals("20250303"))
+    plan = planner._plan()
+    missing = DataNotFoundException("http://x", {})
+    assert planner._distribute(plan, {0: missing}) == [()]
+    with pytest.raises(ServiceUnavailableError):
+        planner._distribute(plan, {0: ServiceUnavailableError("http://x", 503)})
+
+
+def test_fetch_matches_individual_queries():
+    # 주말(토, 일)에는 급식이 없음
+    rows = [
+        {"MLSV_YMD": f"202503{day:02}", "MMEAL_SC_CODE": "2"}
+        for day in range(1, 32)
+        if day % 7 not in (1, 2)
+    ]
+    requests = []
+
+    def source(svc, query):
+        requests.append(dict(query))
+        if "MLSV_YMD" in query:
+            return [r for r in rows if r["MLSV_YMD"] == query["MLSV_YMD"]]
+        low, high = query["MLSV_FROM_YMD"], query["MLSV_TO_YMD"]
+        return [r for r in rows if low <= r["MLSV_YMD"] <= high]
+
+    days = [f"202503{day:02}" for day in range(1, 15)]
+    builders = meals(*days)
+    with MockNeisServer(source).serve() as url:
+        with SyncSession("API_KEY", base_url=url) as sess:
+            merged = QueryPlanner(builders).fetch(sess)
+            assert len(requests) == 1
+            single = [fetch_or_empty(builder, sess) for builder in builders]
+    assert merged == single
+    assert [len(result) for result in merged].count(0) == 4
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from time import time
+from ezneis.http import SyncSession
+from ezneis.http.cache import (
+    FileResponseCache,
+    MemoryResponseCache,
+    SQLiteResponseCache,
+)
+from ezneis.http.service import TIME_TO_LIVE, Services
+import asyncio
+import pytest
+
+QUERY = {"KEY": "API_KEY", "Type": "json", "pIndex": 1, "pSize": 1000}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("ezneis.http.cache.time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite", "file"])
+def make_cache(request, tmp_path):
+    caches = []
+
+    def make(ttl=60):
+        if request.param == "memory":
+            cache = MemoryResponseCache(ttl)
+        elif request.param == "sqlite":
+            cache = SQLiteResponseCache(tmp_path / "cache.sqlite3", ttl)
+        else:
+            cache = FileResponseCache(tmp_path / "cache", ttl)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def test_key_ignores_credentials_and_order():
+    other = {"pSize": "1000", "pIndex": "1", "KEY": "OTHER_KEY"}
+    key = MemoryResponseCache.make_key(Services.SCHOOL_INFO, QUERY)
+    assert key == MemoryResponseCache.make_key(Services.SCHOOL_INFO, other)
+    assert key == f"{Services.SCHOOL_INFO.value}?pIndex=1&pSize=1000"
+    assert key != MemoryResponseCache.make_key(Services.MEALS, QUERY)
+
+
+def test_store_and_expire(make_cache, clock):
+    cache = make_cache({Services.MEALS: 10})
+    cache.store(Services.SCHOOL_INFO, QUERY, b"school")
+    cache.store(Services.MEALS, QUERY, b"meal")
+    assert cache.load(Services.SCHOOL_INFO, {**QUERY, "KEY": "X"}) == b"school"
+    assert cache.load(Services.MEALS, QUERY) == b"meal"
+    assert cache.load(Services.SCHOOL_INFO, {**QUERY, "pIndex": 2}) is None
+    # 서비스별 유효 기간이 지난 응답만 만료
+    clock.now += 10
+    assert cache.load(Services.MEALS, QUERY) is None
+    assert cache.load(Services.SCHOOL_INFO, QUERY) == b"school"
+    # 매핑에 없는 서비스는 기본 유효 기간(TIME_TO_LIVE)을 따름
+    clock.now += TIME_TO_LIVE
+    assert cache.load(Services.SCHOOL_INFO, QUERY) is None
+
+
+def test_clear(make_cache):
+    cache = make_cache()
+    cache.store(Services.SCHOOL_INFO, QUERY, b"school")
+    cache.clear()
+    assert cache.load(Services.SCHOOL_INFO, QUERY) is None
+
+
+def test_load_and_store_async(make_cache):
+    cache = make_cache()
+
+    async def main():
+        await cache.store_async(Services.SCHOOL_INFO, QUERY, b"school")
+        return await cache.load_async(Services.SCHOOL_INFO, QUERY)
+
+    assert asyncio.run(main()) == b"school"
+    assert cache.load(Services.SCHOOL_INFO, QUERY) == b"school"
+
+
+@pytest.mark.parametrize("cls", [SQLiteResponseCache, FileResponseCache])
+def test_persists_across_instances(cls, tmp_path):
+    cache = cls(tmp_path / "cache", 60)
+    cache.store(Services.SCHOOL_INFO, QUERY, b"school")
+    cache.close()
+    cache = cls(tmp_path / "cache", 60)
+    assert cache.load(Services.SCHOOL_INFO, QUERY) == b"school"
+    cache.close()
+
+
+def test_session_reuses_cached_pages(neis, tmp_path):
+    server = neis({Services.SCHOOL_INFO: [{"SD_SCHUL_CODE": "7530000"}]})
+    cache = SQLiteResponseCache(tmp_path / "cache.sqlite3", 60)
+    for _ in range(2):
+        with SyncSession("API_KEY", base_url=server.url, cache=cache) as sess:
+            assert sess.get(Services.SCHOOL_INFO) == [{"SD_SCHUL_CODE": "7530000"}]
+    assert server.stats["requests"] == 1
+    cache.close()
+
+
+def test_memory_maxbytes_keeps_inserted_response():
+    cache = MemoryResponseCache(maxbytes=3000)
+    expires = time() + 60
+    cache._set("a", b"x" * 500, expires)
+    cache._set("b", b"x" * 500, expires)
+    cache._set("c", b"x" * 2200, expires)
+    # 방금 저장한 응답 대신 오래된 응답이 삭제되어야 함
+    assert cache._get("c", time()) == (b"x" * 2200, expires)
+    assert cache._get("a", time()) is None
+    assert cache.nbytes <= 3000
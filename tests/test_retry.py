@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from ezneis.exceptions import (
+    DeadlineExceededError,
+    InternalServiceCode,
+    InternalServiceError,
+)
+from ezneis.http import AsyncSession, RetryPolicy, SyncSession, TokenBucket
+from ezneis.http.service import Services
+from time import monotonic
+import asyncio
+import pytest
+
+ROWS = {Services.SCHOOL_INFO: [{"SD_SCHUL_CODE": "7010536"}]}
+
+
+def test_daily_quota_is_not_retried(neis):
+    policy = RetryPolicy()
+    assert not policy.is_retryable(InternalServiceError("ERROR-337", "트래픽 초과"))
+    assert policy.is_retryable(InternalServiceError("ERROR-500", "서버 오류"))
+
+    server = neis(ROWS, rate_limit=1)
+    retry = RetryPolicy(retries=3, base_delay=0.01)
+    with SyncSession("API_KEY", base_url=server.url, retry=retry) as sess:
+        sess.get(Services.SCHOOL_INFO)
+        with pytest.raises(InternalServiceError) as info:
+            sess.get(Services.SCHOOL_INFO, refresh=True)
+    assert info.value.code == InternalServiceCode.TOO_MANY_REQUESTS
+    assert server.stats["requests"] == 2
+
+
+def test_rate_limit_wait_respects_deadline(neis):
+    server = neis(ROWS)
+    bucket = TokenBucket(0.5, capacity=1)
+    with SyncSession("API_KEY", base_url=server.url, rate_limiter=bucket) as sess:
+        sess.get(Services.SCHOOL_INFO)
+        started = monotonic()
+        # 다음 토큰은 2초 뒤에 보충되므로 기다리지 않고 즉시 실패
+        with pytest.raises(DeadlineExceededError):
+            sess.get(Services.SCHOOL_INFO, timeout=0.5)
+        assert monotonic() - started < 0.5
+    assert server.stats["requests"] == 1
+    # 실패한 요청이 예약한 토큰은 되돌려 놓음
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.1)
+
+
+def test_async_rate_limit_wait_respects_deadline(neis):
+    server = neis(ROWS)
+    bucket = TokenBucket(0.5, capacity=1)
+
+    async def main():
+        async with AsyncSession(
+            "API_KEY", base_url=server.url, rate_limiter=bucket
+        ) as sess:
+            await sess.get(Services.SCHOOL_INFO)
+            started = monotonic()
+            with pytest.raises(DeadlineExceededError):
+                await sess.get(Services.SCHOOL_INFO, timeout=0.5)
+            assert monotonic() - started < 0.5
+
+    asyncio.run(main())
+    assert server.stats["requests"] == 1
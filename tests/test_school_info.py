@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+from ezneis.http.service import Services
+from ezneis.models import SchoolInfo, SchoolInfoBuilder
+from ezneis.models.common import SchoolCategory, Timing
+from ezneis.models.school_info import (
+    AdmissionPeriod,
+    FoundationType,
+    GenderComposition,
+    HighSchoolCategory,
+    HighSchoolSubtype,
+    SchoolPurpose,
+)
+from ezneis.region import Region
+import pytest
+
+RECORD = {
+    "ATPT_OFCDC_SC_CODE": "J10",
+    "SD_SCHUL_CODE": "7530000",
+    "SCHUL_NM": "가상과학고등학교",
+    "ENG_SCHUL_NM": "Virtual Science High School",
+    "SCHUL_KND_SC_NM": "고등학교",
+    "JU_ORG_NM": "경기도교육청",
+    "FOND_SC_NM": "공립",
+    "ORG_RDNZC": "16000",
+    "ORG_RDNMA": "경기도 가상시 가상로 1",
+    "ORG_RDNDA": " ",
+    "ORG_TELNO": "031-000-0000",
+    "HMPG_ADRES": "",
+    "COEDU_SC_NM": "남여공학",
+    "ORG_FAXNO": None,
+    "HS_SC_NM": "특목고",
+    "INDST_SPECL_CCCCL_EXST_YN": "N",
+    "HS_GNRL_BUSNS_SC_NM": "일반계",
+    "SPCLY_PURPS_HS_ORD_NM": "과학계열",
+    "ENE_BFE_SEHF_SC_NM": "전기",
+    "DGHT_SC_NM": "주간",
+    "FOND_YMD": "19830301",
+    "FOAS_MEMRD": "19830315",
+}
+
+
+def test_from_dict():
+    school = SchoolInfo.from_dict(RECORD)
+    assert school.region is Region.GYEONGGI
+    assert school.code == "7530000"
+    assert school.name == "가상과학고등학교"
+    assert school.english_name == "Virtual Science High School"
+    assert school.school_category is SchoolCategory.HIGH
+    assert school.jurisdiction_name == "경기도교육청"
+    assert school.foundation_type is FoundationType.PUBLIC
+    assert school.zip_code == "16000"
+    assert school.address == "경기도 가상시 가상로 1"
+    # 비어 있거나 공백뿐인 값은 None
+    assert school.address_detail is None
+    assert school.website is None
+    assert school.fax_number is None
+    assert school.tel_number == "031-000-0000"
+    assert school.gender_composition is GenderComposition.MIXED
+    assert school.subtype is HighSchoolSubtype.SPECIAL_PURPOSE
+    assert not school.industry_supports
+    assert school.high_school_category is HighSchoolCategory.NORMAL
+    assert school.purpose is SchoolPurpose.SCIENCE
+    assert school.admission_period is AdmissionPeriod.EARLY
+    assert school.timing is Timing.DAY
+    assert school.founded_date == date(1983, 3, 1)
+    assert school.anniversary == date(1983, 3, 15)
+
+
+@pytest.mark.parametrize(
+    "field, value, attribute, expected",
+    [
+        ("SCHUL_KND_SC_NM", "각종학교(중)", "school_category", SchoolCategory.MISC_MID),
+        ("SCHUL_KND_SC_NM", "외국인학교", "school_category", SchoolCategory.OTHERS),
+        ("FOND_SC_NM", "사립", "foundation_type", FoundationType.PRIVATE),
+        ("FOND_SC_NM", "기타", "foundation_type", FoundationType.OTHERS),
+        ("COEDU_SC_NM", "여", "gender_composition", GenderComposition.GIRLS_ONLY),
+        ("HS_SC_NM", None, "subtype", None),
+        (
+            "HS_GNRL_BUSNS_SC_NM",
+            "전문계",
+            "high_school_category",
+            HighSchoolCategory.VOCATIONAL,
+        ),
+        ("SPCLY_PURPS_HS_ORD_NM", "산업수요맞춤형", "purpose", SchoolPurpose.INDUSTRY),
+        ("INDST_SPECL_CCCCL_EXST_YN", "Y", "industry_supports", True),
+        ("ENE_BFE_SEHF_SC_NM", "전후기", "admission_period", AdmissionPeriod.BOTH),
+        ("DGHT_SC_NM", "야간", "timing", Timing.NIGHT),
+    ],
+)
+def test_field_mappings(field, value, attribute, expected):
+    school = SchoolInfo.from_dict({**RECORD, field: value})
+    assert getattr(school, attribute) == expected
+
+
+@pytest.mark.parametrize("field", ["COEDU_SC_NM", "ENE_BFE_SEHF_SC_NM", "DGHT_SC_NM"])
+def test_unknown_value_raises(field):
+    with pytest.raises(ValueError, match="처리할 수 없는"):
+        SchoolInfo.from_dict({**RECORD, field: "알 수 없음"})
+
+
+def test_builder_parameters():
+    builder = SchoolInfoBuilder().region(Region.SEOUL).name("가상고등학교")
+    assert builder._service is Services.SCHOOL_INFO
+    assert builder._param == {"ATPT_OFCDC_SC_CODE": "B10", "SCHUL_NM": "가상고등학교"}
+    # 학교 기본 정보로부터 시도 교육청과 행정 표준 코드를 상속
+    inherited = SchoolInfo.from_dict(RECORD) >> SchoolInfoBuilder()
+    assert inherited._param == {"ATPT_OFCDC_SC_CODE": "J10", "SD_SCHUL_CODE": "7530000"}
+    assert (Region.BUSAN >> SchoolInfoBuilder())._param == {"ATPT_OFCDC_SC_CODE": "C10"}
+    with pytest.raises(TypeError):
+        "J10" >> SchoolInfoBuilder()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+from benchmarks.mock_server import MockNeisServer, synthetic_rows
+from ezneis.http import Services
+from ezneis.utils.session_manager import SessionManager
+from time import sleep
+import asyncio
+import pytest
+
+ROWS = {Services.SCHOOL_INFO: synthetic_rows(Services.SCHOOL_INFO, 1500)}
+
+
+@pytest.fixture
+def server():
+    with MockNeisServer(ROWS).serve() as url:
+        yield url
+
+
+def test_sync_sessions_pooled_per_key(server):
+    manager = SessionManager(sync_options={"base_url": server})
+    try:
+        with manager.sync_session("a") as first:
+            assert len(first.get(Services.SCHOOL_INFO)) == 1500
+        with manager.sync_session("a") as again, manager.sync_session("b") as other:
+            assert again is first
+            assert other is not first
+    finally:
+        manager.cleanup()
+    assert first.closed and other.closed
+
+
+def test_leased_sync_session_is_not_evicted(server):
+    manager = SessionManager(idle_timeout=0, sync_options={"base_url": server})
+    try:
+        with manager.sync_session("a") as held:
+            sleep(0.01)
+            manager.evict_idle()
+            # 다른 키를 빌리는 동안에도 빌려 간 세션은 닫히지 않아야 함
+            with manager.sync_session("b"):
+                pass
+            assert not held.closed
+            assert len(held.get(Services.SCHOOL_INFO)) == 1500
+        sleep(0.01)
+        manager.evict_idle()
+        assert held.closed
+        with manager.sync_session("a") as fresh:
+            assert fresh is not held
+    finally:
+        manager.cleanup()
+
+
+def test_async_sessions_pooled_per_loop(server):
+    manager = SessionManager(async_options={"base_url": server})
+
+    async def borrow():
+        async with manager.async_session("a") as first:
+            assert len(await first.get(Services.SCHOOL_INFO)) == 1500
+        async with manager.async_session("a") as again:
+            assert again is first
+        return first
+
+    try:
+        first = asyncio.run(borrow())
+        # 이전 루프가 닫혔으므로 세션은 정리되고 새 루프에서 새로 생성되어야 함
+        second = asyncio.run(borrow())
+        assert second is not first
+    finally:
+        manager.cleanup()
+    assert first.closed and second.closed
+
+
+def test_leased_async_session_is_not_evicted(server):
+    manager = SessionManager(idle_timeout=0, async_options={"base_url": server})
+
+    async def main():
+        async with manager.async_session("a") as held:
+            await asyncio.sleep(0.01)
+            manager.evict_idle()
+            assert not held.closed
+            assert len(await held.get(Services.SCHOOL_INFO)) == 1500
+        await asyncio.sleep(0.01)
+        manager.evict_idle()
+        # 세션은 자신의 루프에서 닫히는 작업으로 등록됨
+        for _ in range(100):
+            if held.closed:
+                break
+            await asyncio.sleep(0.01)
+        return held
+
+    held = asyncio.run(main())
+    assert held.closed
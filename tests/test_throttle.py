@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+from benchmarks.mock_server import MockNeisServer, synthetic_rows
+from ezneis.exceptions import (
+    CircuitOpenError,
+    InternalServiceError,
+    ServiceUnavailableError,
+)
+from ezneis.http import AsyncSession, MemoryResponseCache, RetryPolicy, SyncSession
+from ezneis.http.service import Services
+from ezneis.http.throttle import CircuitBreaker
+import asyncio
+import pytest
+
+SERVER_ERROR = InternalServiceError("ERROR-500", "서버 오류")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("ezneis.http.throttle.monotonic", clock)
+    return clock
+
+
+def test_opens_after_failure_rate(clock):
+    breaker = CircuitBreaker(0.5, window=4, min_requests=4)
+    for error in (SERVER_ERROR, None, None):
+        breaker.record("svc", error)
+    assert breaker.state("svc") == CircuitBreaker.CLOSED
+    breaker.record("svc", SERVER_ERROR)
+    assert breaker.state("svc") == CircuitBreaker.OPEN
+    assert not breaker.allow("svc")
+    # 회로는 서비스마다 따로 관리됨
+    assert breaker.allow("other")
+
+
+def test_non_failures_do_not_open(clock):
+    breaker = CircuitBreaker(0.5, window=2, min_requests=2)
+    for _ in range(4):
+        breaker.record("svc", InternalServiceError("ERROR-290", "인증키 오류"))
+        breaker.record("svc", ServiceUnavailableError("http://x", 404))
+    assert breaker.state("svc") == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_closes(clock):
+    breaker = CircuitBreaker(1.0, window=1, min_requests=1, reset_timeout=30)
+    breaker.record("svc", SERVER_ERROR)
+    assert breaker.retry_after("svc") == 30
+    clock.now += 30
+    assert breaker.state("svc") == CircuitBreaker.HALF_OPEN
+    assert breaker.allow("svc")
+    # 시험 요청의 결과가 나올 때까지 다른 요청은 차단
+    assert not breaker.allow("svc")
+    breaker.record("svc", None)
+    assert breaker.state("svc") == CircuitBreaker.CLOSED
+    assert breaker.retry_after("svc") is None
+
+
+def test_half_open_failure_reopens(clock):
+    breaker = CircuitBreaker(1.0, window=1, min_requests=1, reset_timeout=30)
+    breaker.record("svc", SERVER_ERROR)
+    clock.now += 30
+    assert breaker.allow("svc")
+    breaker.record("svc", ServiceUnavailableError("http://x", 503))
+    assert breaker.state("svc") == CircuitBreaker.OPEN
+    assert not breaker.allow("svc")
+
+
+def test_lost_probe_is_replaced_after_timeout(clock):
+    breaker = CircuitBreaker(1.0, window=1, min_requests=1, reset_timeout=30)
+    breaker.record("svc", SERVER_ERROR)
+    clock.now += 30
+    assert breaker.allow("svc")
+    clock.now += 30
+    assert breaker.allow("svc")
+
+
+def test_multiple_probes_required(clock):
+    breaker = CircuitBreaker(1.0, window=1, min_requests=1, probes=2)
+    breaker.record("svc", SERVER_ERROR)
+    clock.now += 30
+    assert breaker.allow("svc")
+    breaker.record("svc", None)
+    assert breaker.state("svc") == CircuitBreaker.HALF_OPEN
+    assert breaker.allow("svc")
+    breaker.record("svc", None)
+    assert breaker.state("svc") == CircuitBreaker.CLOSED
+
+
+def test_session_fails_fast_when_open():
+    breaker = CircuitBreaker(1.0, window=2, min_requests=2, reset_timeout=60)
+    retry = RetryPolicy(retries=0)
+    with MockNeisServer(error_rate=1.0).serve() as url:
+        with SyncSession("API_KEY", base_url=url, breaker=breaker, retry=retry) as sess:
+            for _ in range(2):
+                with pytest.raises(InternalServiceError):
+                    sess.get(Services.SCHOOL_INFO)
+            with pytest.raises(CircuitOpenError) as info:
+                sess.get(Services.SCHOOL_INFO)
+    assert 0 < info.value.retry_after <= 60
+
+
+@pytest.fixture
+def cache_clock(monkeypatch):
+    clock = Clock()
+    clock.now = 1_700_000_000.0
+    monkeypatch.setattr("ezneis.http.cache.time", clock)
+    return clock
+
+
+def stale_session(cls, url: str, stale_ttl: float = 3600):
+    return cls(
+        "API_KEY",
+        base_url=url,
+        cache=MemoryResponseCache(ttl=60, stale_ttl=stale_ttl),
+        breaker=CircuitBreaker(1.0, window=1, min_requests=1, reset_timeout=60),
+        retry=RetryPolicy(retries=0),
+    )
+
+
+def test_session_serves_expired_response_while_open(cache_clock):
+    server = MockNeisServer(
+        {Services.SCHOOL_INFO: synthetic_rows(Services.SCHOOL_INFO, 10)}
+    )
+    with server.serve() as url, stale_session(SyncSession, url) as sess:
+        primed = sess.get(Services.SCHOOL_INFO)
+        cache_clock.now += 120
+        server.error_rate = 1.0
+        # 회로를 여는 요청부터 만료된 응답을 대신 반환
+        for _ in range(3):
+            assert sess.get(Services.SCHOOL_INFO) == primed
+        assert sess._breaker.state(Services.SCHOOL_INFO) == CircuitBreaker.OPEN
+
+
+def test_session_fails_once_stale_window_passes(cache_clock):
+    server = MockNeisServer(
+        {Services.SCHOOL_INFO: synthetic_rows(Services.SCHOOL_INFO, 10)}
+    )
+    with server.serve() as url, stale_session(SyncSession, url, 60) as sess:
+        sess.get(Services.SCHOOL_INFO)
+        cache_clock.now += 180
+        server.error_rate = 1.0
+        with pytest.raises(InternalServiceError):
+            sess.get(Services.SCHOOL_INFO)
+        with pytest.raises(CircuitOpenError):
+            sess.get(Services.SCHOOL_INFO)
+
+
+def test_async_session_serves_expired_response_while_open(cache_clock):
+    server = MockNeisServer(
+        {Services.SCHOOL_INFO: synthetic_rows(Services.SCHOOL_INFO, 10)}
+    )
+
+    async def main():
+        async with server as url, stale_session(AsyncSession, url) as sess:
+            primed = await sess.get(Services.SCHOOL_INFO)
+            cache_clock.now += 120
+            server.error_rate = 1.0
+            for _ in range(3):
+                assert await sess.get(Services.SCHOOL_INFO) == primed
+
+    asyncio.run(main())
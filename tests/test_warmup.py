@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from benchmarks.mock_server import synthetic_rows
+from datetime import datetime, time
+from ezneis.exceptions import SessionClosedException
+from ezneis.http import AsyncSession, MemoryResponseCache, SyncSession
+from ezneis.http.service import KST, Services
+from ezneis.models import SchoolInfoBuilder
+from ezneis.models.core import CoreBuilder
+from ezneis.utils.metrics import MetricsRegistry
+from ezneis.utils.warmup import WarmupScheduler
+from time import monotonic, sleep
+import asyncio
+
+ROWS = {Services.SCHOOL_INFO: synthetic_rows(Services.SCHOOL_INFO, 1)}
+TRACKED = ("J10", "7530000")
+MISSING = ("B10", "7010000")
+
+
+class MealBuilder(CoreBuilder):
+    _service = Services.MEALS
+    _model = None
+
+    def __rrshift__(self, other) -> MealBuilder:
+        return self
+
+
+def wait_until(condition, timeout: float = 5.0):
+    deadline = monotonic() + timeout
+    while not condition():
+        assert monotonic() < deadline
+        sleep(0.01)
+
+
+def results(registry: MetricsRegistry) -> dict[str, float]:
+    (metric,) = registry.snapshot().values()
+    return {sample["labels"]["result"]: sample["value"] for sample in metric["samples"]}
+
+
+def test_next_run():
+    scheduler = WarmupScheduler(
+        None,
+        [TRACKED],
+        [SchoolInfoBuilder(), lambda today: MealBuilder()],
+        schedule={Services.SCHOOL_INFO: (time(6, 0), time(12, 0))},
+        metrics=None,
+    )
+    at = datetime(2025, 3, 4, 5, 0, tzinfo=KST)
+    # 같은 시각에 갱신하는 서비스는 함께 반환
+    assert scheduler.next_run(at) == (
+        datetime(2025, 3, 4, 6, 0, tzinfo=KST),
+        frozenset((Services.SCHOOL_INFO, Services.MEALS)),
+    )
+    at = datetime(2025, 3, 4, 10, 30, tzinfo=KST)
+    assert scheduler.next_run(at) == (
+        datetime(2025, 3, 4, 12, 0, tzinfo=KST),
+        frozenset((Services.SCHOOL_INFO,)),
+    )
+    # 오늘의 마지막 갱신 시각이 지난 경우 다음 날 첫 갱신 시각
+    at = datetime(2025, 3, 4, 12, 0, tzinfo=KST)
+    assert scheduler.next_run(at) == (
+        datetime(2025, 3, 5, 6, 0, tzinfo=KST),
+        frozenset((Services.SCHOOL_INFO, Services.MEALS)),
+    )
+
+
+def test_run_once_refreshes_cache(neis):
+    server = neis(ROWS)
+    registry = MetricsRegistry()
+    with SyncSession("API_KEY", base_url=server.url, cache=MemoryResponseCache()) as s:
+        scheduler = WarmupScheduler(
+            s, [TRACKED, MISSING], [SchoolInfoBuilder()], metrics=registry
+        )
+        assert scheduler.run_once() == 1
+        # 캐시에 응답이 있어도 새로 요청
+        assert scheduler.run_once() == 1
+        assert scheduler.run_once([Services.MEALS]) == 0
+    assert server.stats["requests"] == 4
+    assert results(registry) == {"ok": 2, "not_found": 2}
+    assert scheduler.last_error is None
+
+
+def test_fatal_error_stops_run():
+    registry = MetricsRegistry()
+    sess = SyncSession("API_KEY")
+    sess.close()
+    scheduler = WarmupScheduler(
+        sess, [TRACKED, MISSING], [SchoolInfoBuilder()], metrics=registry
+    )
+    assert scheduler.run_once() == 0
+    assert results(registry) == {"error": 1}
+    assert isinstance(scheduler.last_error, SessionClosedException)
+
+
+def test_thread_survives_failing_target(neis):
+    server = neis(ROWS)
+
+    def broken(today):
+        raise RuntimeError("대상 오류")
+
+    with SyncSession("API_KEY", base_url=server.url) as sess:
+        scheduler = WarmupScheduler(
+            sess, [TRACKED], [SchoolInfoBuilder(), broken], metrics=None
+        )
+        with scheduler:
+            # 빌더를 만들지 못한 대상만 건너뛰고, 다음 갱신 시각을 계산하지 못해도
+            # 스레드는 계속 실행됨
+            wait_until(lambda: server.stats["requests"] == 1)
+            wait_until(lambda: scheduler.last_error is not None)
+            assert isinstance(scheduler.last_error, RuntimeError)
+            assert scheduler._thread.is_alive()
+        assert scheduler._thread is None
+
+
+def test_async_exit_waits_for_task(neis):
+    server = neis(ROWS)
+
+    async def main():
+        async with AsyncSession("API_KEY", base_url=server.url) as sess:
+            scheduler = WarmupScheduler(
+                sess, [TRACKED], [SchoolInfoBuilder()], metrics=None
+            )
+            async with scheduler:
+                task = scheduler._task
+                while server.stats["requests"] == 0:
+                    await asyncio.sleep(0.01)
+            assert task.cancelled()
+            assert scheduler.last_error is None
+
+    asyncio.run(main())